@@ -0,0 +1,48 @@
+""" Compares the object engine with the NumPy fleet engine.
+
+    Usage: python -m benchmarks.bench_fleet [rovers] [instruction_length]
+"""
+
+import random
+import sys
+import time
+from internal.engine import simulate_rovers
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.land import RectangularLand
+
+
+def build_fleet(rovers_count: int, instruction_length: int, seed: int = 0):
+    generator = random.Random(seed)
+    land = RectangularLand(upper_right_edge=Point(1000, 1000))
+    rovers = []
+    for number in range(rovers_count):
+        position = Position(generator.randint(0, 1000), generator.randint(0, 1000), generator.choice(list(Orientation)))
+        rover = Rover(name=f"Rover{number}", position=position, land=land)
+        rover.set_instruction("".join(generator.choices("LRM", k=instruction_length)))
+        rovers.append(rover)
+    return rovers
+
+
+def main(rovers_count: int = 10000, instruction_length: int = 200):
+    rovers = build_fleet(rovers_count, instruction_length)
+
+    started = time.perf_counter()
+    fleet = simulate_rovers(rovers)
+    numpy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = []
+    for rover in rovers:
+        rover.run_instruction()
+        expected.append(f"{rover.name}:{rover.position}")
+    object_seconds = time.perf_counter() - started
+
+    assert list(fleet.lines()) == expected, "engines disagree"
+    print(f"rovers={rovers_count} instruction_length={instruction_length}")
+    print(f"object engine: {object_seconds:.3f}s")
+    print(f"numpy engine:  {numpy_seconds:.3f}s")
+    print(f"speedup:       {object_seconds / numpy_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
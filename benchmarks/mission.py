@@ -0,0 +1,48 @@
+""" Builds synthetic mission inputs for benchmarks. """
+
+import random
+from typing import List
+
+
+def build_mission(
+    fleet_size: int,
+    instruction_length: int,
+    plateau_size: int,
+    edge_hit_ratio: float = 0.0,
+    seed: int = 0
+) -> List[str]:
+    """ Returns the input lines of a mission on a square plateau.
+
+        @params
+            fleet_size: number of rovers.
+            instruction_length: number of instruction characters per rover.
+            plateau_size: x and y coordinate of the plateau's upper right edge.
+            edge_hit_ratio: share of rovers that land next to an edge and keep driving into it.
+            seed: seed of the random generator, so that missions can be rebuilt exactly.
+    """
+
+    generator = random.Random(seed)
+    lines = [f"Plateau:{plateau_size} {plateau_size}\n"]
+    centre = plateau_size // 2
+
+    for number in range(fleet_size):
+        name = f"Rover{number + 1}"
+        if generator.random() < edge_hit_ratio:
+            # rover faces the upper edge from one cell below it, so almost every move is dropped.
+            landing = f"{generator.randint(0, plateau_size)} {max(plateau_size - 1, 0)} N"
+            instruction = "".join(generator.choice("MMMMMMMLR") for _ in range(instruction_length))
+        else:
+            landing = f"{centre} {centre} {generator.choice('NESW')}"
+            instruction = "".join(generator.choice("LRM") for _ in range(instruction_length))
+
+        lines.append(f"{name} Landing:{landing}\n")
+        lines.append(f"{name} Instructions:{instruction}\n")
+
+    return lines
+
+
+def write_mission(file_path: str, **mission_options):
+    "writes a mission built with `build_mission` to a file."
+
+    with open(file_path, "w") as file:
+        file.writelines(build_mission(**mission_options))
@@ -0,0 +1,123 @@
+""" Times each stage of the parse -> execute -> report pipeline on synthetic missions.
+
+    Usage:
+        python -m benchmarks.run                    # run every scenario and compare with the baseline
+        python -m benchmarks.run --save-baseline    # run every scenario and store the results as the baseline
+        python -m benchmarks.run -s large_fleet     # run some scenarios only
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict
+from internal.parser import InputParser
+from utils import get_input_from_args
+from .mission import write_mission
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+SCENARIOS = {
+    "small": dict(fleet_size=100, instruction_length=100, plateau_size=50, edge_hit_ratio=0.1),
+    "large_fleet": dict(fleet_size=20000, instruction_length=50, plateau_size=1000, edge_hit_ratio=0.1),
+    "long_instructions": dict(fleet_size=10, instruction_length=500000, plateau_size=100000, edge_hit_ratio=0.0),
+    "edge_heavy": dict(fleet_size=1000, instruction_length=2000, plateau_size=100, edge_hit_ratio=0.9),
+}
+
+STAGES = ("read", "parse", "execute", "report")
+
+
+def time_pipeline(file_path: str, repeat: int) -> Dict[str, float]:
+    "returns the best wall time in seconds of every stage over `repeat` runs."
+
+    best = {stage: float("inf") for stage in STAGES}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = get_input_from_args(file_path, "", [])
+        read_done = time.perf_counter()
+        rovers = InputParser(inputs=data).rovers
+        parse_done = time.perf_counter()
+        for rover in rovers:
+            rover.run_instruction()
+        execute_done = time.perf_counter()
+        output = io.StringIO()
+        for rover in rovers:
+            output.write(f"{rover.name}:{rover.position}\n")
+        report_done = time.perf_counter()
+
+        timings = (read_done - started, parse_done - read_done, execute_done - parse_done, report_done - execute_done)
+        for stage, seconds in zip(STAGES, timings):
+            best[stage] = min(best[stage], seconds)
+
+    return best
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    min_delta: float
+) -> bool:
+    """ Prints each stage against its baseline and returns False if any stage regressed.
+
+        A stage regresses when it is slower than its baseline by more than `tolerance` (relative)
+        and by more than `min_delta` seconds, so that timer noise on tiny stages is ignored.
+    """
+
+    passed = True
+    for scenario, timings in results.items():
+        for stage, seconds in timings.items():
+            expected = baseline.get(scenario, {}).get(stage)
+            if expected is None:
+                print(f"{scenario:<18} {stage:<8} {seconds:9.4f}s  (no baseline)")
+                continue
+
+            ratio = seconds / expected if expected else 1.0
+            regressed = ratio > 1 + tolerance and seconds - expected > min_delta
+            passed = passed and not regressed
+            print(f"{scenario:<18} {stage:<8} {seconds:9.4f}s  baseline {expected:9.4f}s  x{ratio:5.2f}{'  REGRESSED' if regressed else ''}")
+
+    return passed
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="mars rover pipeline benchmarks", prog="benchmarks.run")
+    arg_parser.add_argument("-s", "--scenarios", type=str, nargs="*", choices=list(SCENARIOS), default=list(SCENARIOS))
+    arg_parser.add_argument("-n", "--repeat", type=int, help="runs per scenario; the best time is kept", default=3)
+    arg_parser.add_argument("-t", "--tolerance", type=float, help="allowed slowdown over baseline, e.g. 0.25 for 25%%", default=0.25)
+    arg_parser.add_argument("-d", "--min-delta", type=float, help="slowdowns below this many seconds are ignored", default=0.005)
+    arg_parser.add_argument("--save-baseline", help="store results as the new baseline", action="store_true")
+    args = arg_parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for scenario in args.scenarios:
+            file_path = os.path.join(directory, f"{scenario}.txt")
+            write_mission(file_path, **SCENARIOS[scenario])
+            results[scenario] = time_pipeline(file_path, args.repeat)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.isfile(BASELINE_PATH):
+            with open(BASELINE_PATH) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(baseline, file, indent=4, sort_keys=True)
+        print(f"baseline saved to {BASELINE_PATH}")
+        return 0
+
+    baseline = {}
+    if os.path.isfile(BASELINE_PATH):
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)
+
+    return 0 if compare(results, baseline, args.tolerance, args.min_delta) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
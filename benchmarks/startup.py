@@ -0,0 +1,66 @@
+""" Measures how long the CLI takes to run a tiny mission, which is mostly interpreter and import time.
+
+    Usage:
+        python -m benchmarks.startup                  # time single runs and a batch run against the budget
+        python -m benchmarks.startup -n 50            # number of single runs to take the median of
+        python -m benchmarks.startup --app dist/app   # time a built executable instead of main/app.py
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+
+# median wall time, in milliseconds, that a single run of a tiny mission must stay under.
+STARTUP_BUDGET_MS = 120
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main", "app.py")
+
+TINY_MISSION = "Plateau:5 5\nRover1 Landing:1 2 N\nRover1 Instructions:LMLMLMLMM\n"
+
+
+def time_command(command: List[str], stdin: str = "") -> float:
+    "returns the wall time of a command in milliseconds."
+
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(APP_PATH)))
+    started = time.perf_counter()
+    subprocess.run(command, input=stdin, env=env, check=True, capture_output=True, text=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    arg_parser.add_argument("-n", "--runs", type=int, help="number of single runs", default=20)
+    arg_parser.add_argument("--app", type=str, help="executable to time instead of main/app.py")
+    arg_parser.add_argument("--budget-ms", type=float, help="median budget of a single run", default=STARTUP_BUDGET_MS)
+    args = arg_parser.parse_args()
+
+    app = [args.app] if args.app else [sys.executable, APP_PATH]
+
+    with tempfile.TemporaryDirectory() as directory:
+        mission_path = os.path.join(directory, "tiny.txt")
+        with open(mission_path, "w") as file:
+            file.write(TINY_MISSION)
+
+        single = [time_command([*app, mission_path]) for _ in range(args.runs)]
+        batch = time_command([*app, "--batch"], stdin=f"{mission_path}\n" * args.runs)
+
+    median = statistics.median(single)
+    print(f"single run:  median {median:.1f}ms, min {min(single):.1f}ms over {args.runs} runs")
+    print(f"batch run:   {batch / args.runs:.1f}ms per mission for {args.runs} missions in one process")
+
+    if median > args.budget_ms:
+        print(f"over budget: {median:.1f}ms > {args.budget_ms:.0f}ms")
+        return 1
+
+    print(f"within budget of {args.budget_ms:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
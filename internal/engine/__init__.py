@@ -0,0 +1,34 @@
+# engines are imported when first used, so importing `internal.engine` does not load NumPy or multiprocessing.
+from importlib import import_module
+
+_EXPORTS = {
+    "Fleet": "batch",
+    "encode_instructions": "batch",
+    "run_fleet": "batch",
+    "simulate_rovers": "batch",
+    "RoverTask": "pool",
+    "run_rovers_in_pool": "pool",
+    "to_task": "pool",
+    "COLLISION_MODES": "collision",
+    "OccupancyIndex": "collision",
+    "OccupiedLand": "collision",
+    "run_with_collisions": "collision",
+    "PeriodicProgram": "periodic",
+    "find_period": "periodic",
+    "run_periodic_instruction": "periodic",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
\ No newline at end of file
@@ -0,0 +1,141 @@
+from typing import Iterator, List, Optional, Sequence
+from dataclasses import dataclass
+import numpy as np
+from internal.models import Land, Rover
+from internal.models.mechanics import LABELS, UNIT_VECTORS
+from internal.models.program import Instruction, instruction_length, iter_blocks
+from utils import EngineError
+
+
+# instruction codes used in the padded instruction matrix. padding uses NOOP.
+NOOP, LEFT, RIGHT, MOVE = 0, 1, 2, 3
+
+_CODES = np.zeros(256, dtype=np.uint8)
+_CODES[ord("L")] = LEFT
+_CODES[ord("R")] = RIGHT
+_CODES[ord("M")] = MOVE
+
+_TURNS = np.array([0, 3, 1, 0], dtype=np.int8)
+_DX = np.array([dx for dx, _ in UNIT_VECTORS], dtype=np.int64)
+_DY = np.array([dy for _, dy in UNIT_VECTORS], dtype=np.int64)
+
+# most columns encoded at a time, and bytes a block of columns may take across the whole fleet.
+DEFAULT_BLOCK_SIZE = 4096
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+# bytes a cell takes while a block is encoded: the instruction byte, its raw and coded matrices and
+# the transposed copy of the coded matrix.
+_CELL_BYTES = 4
+
+
+@dataclass
+class Fleet:
+    """ Positions of a fleet of rovers kept as NumPy arrays.
+
+        Main Attributes:
+            names: names of rovers, in input order.
+            x: x coordinates of rovers.
+            y: y coordinates of rovers.
+            heading: headings of rovers as quarter turns to the right of north.
+
+        Main Methods:
+            from_rovers: builds a fleet from rover instances.
+            lines: yields the `name:x y H` result line of every rover.
+    """
+
+    names: List[str]
+    x: np.ndarray
+    y: np.ndarray
+    heading: np.ndarray
+
+    @classmethod
+    def from_rovers(cls, rovers: Sequence[Rover]) -> "Fleet":
+        return cls(
+            names=[rover.name for rover in rovers],
+            x=np.array([rover.position.point.x for rover in rovers], dtype=np.int64),
+            y=np.array([rover.position.point.y for rover in rovers], dtype=np.int64),
+            heading=np.array([rover.position.heading for rover in rovers], dtype=np.int8)
+        )
+
+    def lines(self) -> Iterator[str]:
+        for name, x, y, heading in zip(self.names, self.x.tolist(), self.y.tolist(), self.heading.tolist()):
+            yield f"{name}:{x} {y} {LABELS[heading]}"
+
+
+def encode_instructions(instructions: Sequence[Instruction], width: int) -> np.ndarray:
+    """ Returns a (rovers, width) matrix of instruction codes.
+
+        Instructions shorter than `width` are padded with NOOP, longer ones are cut at `width`.
+        Every character takes one column: characters other than ASCII are encoded as `?`, which is a NOOP
+        like any other character that is not a command.
+    """
+
+    encoded = [
+        instruction[:width].encode("ascii", "replace") if isinstance(instruction, str) else bytes(instruction[:width])
+        for instruction in instructions
+    ]
+    if not width or not encoded:
+        return np.zeros((len(encoded), width), dtype=np.uint8)
+
+    # a fixed-width bytes array pads short instructions with zero bytes, which encode as NOOP.
+    raw = np.array(encoded, dtype=f"S{width}").view(np.uint8).reshape(len(encoded), width)
+    return _CODES[raw]
+
+
+def fleet_block_size(rovers: int, block_bytes: int = DEFAULT_BLOCK_BYTES) -> int:
+    "returns how many columns of a fleet's instructions fit in `block_bytes`, at most `DEFAULT_BLOCK_SIZE`."
+    return max(1, min(DEFAULT_BLOCK_SIZE, block_bytes // (_CELL_BYTES * max(rovers, 1))))
+
+
+def run_fleet(fleet: Fleet, land: Land, instructions: Sequence[Instruction], block_size: Optional[int] = None):
+    """ Runs every rover's instruction on the fleet, one instruction column at a time.
+
+        Instructions are encoded in blocks of `block_size` columns to bound memory. When not given,
+        the block length is worked out from `DEFAULT_BLOCK_BYTES` and the size of the fleet, so a
+        block takes about the same memory however many rovers there are. A move is
+        applied only to rovers whose next cell is still on the land, exactly like `Rover.move`;
+        the next cells of the whole fleet are checked together with `Land.contains_many`.
+        Every column is one step, so run-length encoded instructions are expanded one block at a time.
+    """
+
+    if len(instructions) != len(fleet.names):
+        raise EngineError(f"expected {len(fleet.names)} instructions. got {len(instructions)}")
+
+    if block_size is None:
+        block_size = fleet_block_size(len(instructions))
+
+    width = max((instruction_length(instruction) for instruction in instructions), default=0)
+    blocks = [iter_blocks(instruction, block_size) for instruction in instructions]
+
+    for start in range(0, width, block_size):
+        block = [next(instruction_blocks, "") for instruction_blocks in blocks]
+        # columns are laid out contiguously so each step reads one row of the transposed matrix.
+        columns = np.ascontiguousarray(encode_instructions(block, min(block_size, width - start)).T)
+
+        for column in columns:
+            fleet.heading += _TURNS[column]
+            fleet.heading &= 3
+
+            moving = column == MOVE
+            if not moving.any():
+                continue
+
+            next_x = fleet.x + _DX[fleet.heading]
+            next_y = fleet.y + _DY[fleet.heading]
+            moving &= land.contains_many(next_x, next_y)
+
+            np.copyto(fleet.x, next_x, where=moving)
+            np.copyto(fleet.y, next_y, where=moving)
+
+
+def simulate_rovers(rovers: Sequence[Rover], block_size: Optional[int] = None) -> Fleet:
+    """ Runs the instructions of rovers sharing one land and returns their final positions.
+
+        Rovers are left untouched; the returned fleet holds the results.
+    """
+
+    fleet = Fleet.from_rovers(rovers)
+    if rovers:
+        run_fleet(fleet, rovers[0].land, [rover.instruction for rover in rovers], block_size)
+
+    return fleet
@@ -0,0 +1,157 @@
+import codecs
+from itertools import chain
+from typing import Iterator, Sequence, Set, Tuple
+from internal.models import Land, Point, Rover
+from internal.models.program import Instruction, is_encoded, iter_blocks
+from utils import EngineError, RoverError
+
+
+COLLISION_MODES = ("sequential", "timestep")
+
+# steps of an instruction expanded at a time in timestep mode.
+_BLOCK_SIZE = 4096
+
+
+class OccupancyIndex:
+    """ Hash-based index of the cells held by rovers, keyed by the coordinates of a point.
+
+        Main Methods:
+            occupy: marks the cell of a point as occupied.
+            vacate: marks the cell of a point as free.
+            is_occupied: checks if the cell of a point is occupied.
+            is_coordinate_occupied: checks if the cell at coordinates (x, y) is occupied.
+    """
+
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        self._cells: Set[Tuple[int, int]] = set()
+
+    def occupy(self, point: Point):
+        self._cells.add((point.x, point.y))
+
+    def vacate(self, point: Point):
+        self._cells.discard((point.x, point.y))
+
+    def is_occupied(self, point: Point) -> bool:
+        return (point.x, point.y) in self._cells
+
+    def is_coordinate_occupied(self, x: int, y: int) -> bool:
+        return (x, y) in self._cells
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+
+class OccupiedLand(Land):
+    """ Land whose occupied cells are treated as outside of it, so rovers never move onto them.
+
+        Main Attributes:
+            land: land the rovers are on.
+            occupancy: index of cells held by rovers.
+    """
+
+    def __init__(self, land: Land, occupancy: OccupancyIndex) -> None:
+        self.land = land
+        self.occupancy = occupancy
+
+    def is_address_within(self, address: Point) -> bool:
+        return not self.occupancy.is_occupied(address) and self.land.is_address_within(address)
+
+    def is_coordinate_within(self, x: int, y: int) -> bool:
+        return not self.occupancy.is_coordinate_occupied(x, y) and self.land.is_coordinate_within(x, y)
+
+    @property
+    def bounds(self) -> Tuple[Point, Point]:
+        return self.land.bounds
+
+
+def run_with_collisions(rovers: Sequence[Rover], mode: str = "sequential"):
+    """ Runs the instructions of rovers sharing one land without letting two rovers hold the same cell.
+
+        A move onto a cell held by another rover is dropped, like a move off the land.
+
+        @params
+            rovers: rovers to run. Their positions are updated in place.
+            mode: 'sequential' runs each rover's whole instruction in turn, with rovers waiting to run
+                holding their landing cells. 'timestep' runs one instruction of every rover per step.
+    """
+
+    if mode not in COLLISION_MODES:
+        raise EngineError(f"collision mode must be one of {', '.join(COLLISION_MODES)}. got {mode}")
+
+    occupancy = OccupancyIndex()
+    for rover in rovers:
+        if occupancy.is_occupied(rover.position.point):
+            raise RoverError(f"Rover '{rover.name}' landed on a cell occupied by another rover", rover.name)
+        occupancy.occupy(rover.position.point)
+
+    if mode == "sequential":
+        _run_sequentially(rovers, occupancy)
+    else:
+        _run_by_timestep(rovers, occupancy)
+
+
+def _run_sequentially(rovers: Sequence[Rover], occupancy: OccupancyIndex):
+    for rover in rovers:
+        land = rover.land
+        occupancy.vacate(rover.position.point)
+        rover.land = OccupiedLand(land, occupancy)
+        try:
+            rover.run_instruction()
+        finally:
+            rover.land = land
+        occupancy.occupy(rover.position.point)
+
+
+def _run_by_timestep(rovers: Sequence[Rover], occupancy: OccupancyIndex):
+    lands = [rover.land for rover in rovers]
+    try:
+        _run_steps(rovers, occupancy)
+    finally:
+        # every rover gets its own land back, even when one of them fails mid-run.
+        for rover, land in zip(rovers, lands):
+            rover.land = land
+
+    for rover in rovers:
+        rover.reset_instruction()
+
+
+def _iter_commands(instruction: Instruction) -> Iterator[str]:
+    "yields the characters of an instruction one step at a time, expanding run-length encoded ones a block at a time."
+
+    blocks = iter_blocks(instruction, _BLOCK_SIZE)
+    if not (isinstance(instruction, str) or is_encoded(instruction)):
+        # blocks of a plain bytes-like instruction are decoded as they come, keeping characters split across blocks whole.
+        blocks = codecs.iterdecode(blocks, "utf-8")
+    return chain.from_iterable(blocks)
+
+
+def _run_steps(rovers: Sequence[Rover], occupancy: OccupancyIndex):
+    "runs one instruction of every rover per step, with each rover's land swapped for an `OccupiedLand`."
+
+    for rover in rovers:
+        # a rover's own cell is freed while its land is swapped, so that it passes the landing check.
+        occupancy.vacate(rover.position.point)
+        rover.land = OccupiedLand(rover.land, occupancy)
+        occupancy.occupy(rover.position.point)
+
+    active = [(rover, _iter_commands(rover.instruction)) for rover in rovers]
+    while active:
+        running = []
+        for rover, commands in active:
+            command = next(commands, None)
+            if command is None:
+                continue
+
+            if command == "L":
+                rover.spin_left()
+            elif command == "R":
+                rover.spin_right()
+            elif command == "M":
+                occupancy.vacate(rover.position.point)
+                rover.move()
+                occupancy.occupy(rover.position.point)
+            running.append((rover, commands))
+
+        active = running
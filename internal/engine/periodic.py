@@ -0,0 +1,184 @@
+from typing import List, Tuple
+from internal.models import Land, Rover
+from internal.models.land import RectangularLand
+from internal.models.mechanics import UNIT_VECTORS
+from internal.models.program import compile_instruction, execute
+
+
+# bounding box of a path relative to its start: (min x, max x, min y, max y).
+BoundingBox = Tuple[int, int, int, int]
+
+_COMPARE_CHUNK_SIZE = 1 << 20
+_PERIOD_PROBE_SIZE = 64
+
+
+def find_period(instruction: str, max_candidates: int = 16) -> Tuple[str, int, str]:
+    """ Splits an instruction into a repeated pattern, its number of repeats and a tail.
+
+        The tail is what is left after the last whole repeat, and is a prefix of the pattern.
+        An instruction without a period is returned as its own pattern, repeated once.
+
+        @params
+            instruction: instruction to split.
+            max_candidates: number of candidate periods tried before giving up.
+    """
+
+    size = len(instruction)
+    # a period of at most half the instruction is followed by at least half the instruction again.
+    probe = instruction[:min(_PERIOD_PROBE_SIZE, size // 2)]
+    start = 1
+
+    for _ in range(max_candidates if probe else 0):
+        period = instruction.find(probe, start)
+        if period == -1 or period > size // 2:
+            break
+        if _is_period(instruction, period):
+            repeats = size // period
+            return instruction[:period], repeats, instruction[period * repeats:]
+        start = period + 1
+
+    return instruction, 1, ""
+
+
+def _is_period(instruction: str, period: int) -> bool:
+    "checks if instruction[i] == instruction[i + period] for every i, comparing a chunk at a time."
+
+    for start in range(0, len(instruction) - period, _COMPARE_CHUNK_SIZE):
+        end = min(start + _COMPARE_CHUNK_SIZE, len(instruction) - period)
+        if instruction[start:end] != instruction[start + period:end + period]:
+            return False
+
+    return True
+
+
+def _rotate(x: int, y: int, turns: int) -> Tuple[int, int]:
+    "rotates a vector by quarter turns to the right."
+
+    for _ in range(turns % 4):
+        x, y = y, -x
+    return x, y
+
+
+def _rotate_box(box: BoundingBox, turns: int) -> BoundingBox:
+    min_x, max_x, min_y, max_y = box
+    for _ in range(turns % 4):
+        min_x, max_x, min_y, max_y = min_y, max_y, -max_x, -min_x
+    return min_x, max_x, min_y, max_y
+
+
+class PeriodicProgram:
+    """ Effect of one repeat of a pattern on a rover that never reaches the edge of the land.
+
+        A pattern turns the rover by `turn` quarter turns, so `period` repeats of it (1, 2 or 4)
+        bring the rover back to its heading. For every starting heading, the displacement and
+        bounding box of such a super-period are precomputed, so whole super-periods can be skipped
+        in O(1) as long as their path stays on a rectangular land.
+    """
+
+    __slots__ = ("pattern", "program", "turn", "period", "displacements", "boxes")
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self.program = compile_instruction(pattern)
+
+        x = y = heading = 0
+        min_x = max_x = min_y = max_y = 0
+        for turn, steps in self.program:
+            heading = (heading + turn) % 4
+            dx, dy = UNIT_VECTORS[heading]
+            x, y = x + dx * steps, y + dy * steps
+            min_x, max_x, min_y, max_y = min(min_x, x), max(max_x, x), min(min_y, y), max(max_y, y)
+
+        self.turn = heading
+        self.period = 1 if heading == 0 else 2 if heading == 2 else 4
+
+        self.displacements: List[Tuple[int, int]] = []
+        self.boxes: List[BoundingBox] = []
+        for start_heading in range(4):
+            total_x = total_y = 0
+            box = (0, 0, 0, 0)
+            for repeat in range(self.period):
+                repeat_heading = start_heading + repeat * heading
+                low_x, high_x, low_y, high_y = _rotate_box((min_x, max_x, min_y, max_y), repeat_heading)
+                box = (
+                    min(box[0], total_x + low_x), max(box[1], total_x + high_x),
+                    min(box[2], total_y + low_y), max(box[3], total_y + high_y)
+                )
+                dx, dy = _rotate(x, y, repeat_heading)
+                total_x, total_y = total_x + dx, total_y + dy
+            self.displacements.append((total_x, total_y))
+            self.boxes.append(box)
+
+    def run(self, repeats: int, land: Land, x: int, y: int, heading: int) -> Tuple[int, int, int]:
+        """ Runs `repeats` repeats of the pattern and returns the final (x, y, heading).
+
+            Super-periods whose whole path stays on a rectangular land are skipped in one jump.
+            Near the edges repeats are run exactly, and once a repeat leaves the rover where it
+            started, every remaining repeat would too, so they are skipped.
+        """
+
+        rectangular = isinstance(land, RectangularLand)
+
+        while repeats:
+            if rectangular and repeats >= self.period:
+                jumps = self._safe_super_periods(land, x, y, heading, repeats // self.period)
+                if jumps:
+                    dx, dy = self.displacements[heading]
+                    x, y = x + dx * jumps, y + dy * jumps
+                    repeats -= jumps * self.period
+                    continue
+
+            next_x, next_y, next_heading = execute(self.program, land, x, y, heading)
+            repeats -= 1
+            if (next_x, next_y, next_heading) == (x, y, heading):
+                break
+            x, y, heading = next_x, next_y, next_heading
+
+        return x, y, heading
+
+    def _safe_super_periods(self, land: RectangularLand, x: int, y: int, heading: int, limit: int) -> int:
+        "returns how many super-periods in a row, up to limit, can run from (x, y) without their path leaving the land."
+
+        dx, dy = self.displacements[heading]
+        min_x, max_x, min_y, max_y = self.boxes[heading]
+        lower, upper = land.lower_left_edge, land.upper_right_edge
+
+        counts = (
+            _count_safe(x, dx, min_x, max_x, lower.x, upper.x),
+            _count_safe(y, dy, min_y, max_y, lower.y, upper.y)
+        )
+        return min([count for count in counts if count is not None] + [limit])
+
+
+def _count_safe(start: int, step: int, low_offset: int, high_offset: int, low: int, high: int):
+    """ Returns the number of j >= 0 with low <= start + j*step + low_offset and start + j*step + high_offset <= high,
+        or None when every j fits.
+    """
+
+    if start + low_offset < low or start + high_offset > high:
+        return 0
+    if step > 0:
+        return (high - high_offset - start) // step + 1
+    if step < 0:
+        return (start + low_offset - low) // -step + 1
+    return None
+
+
+def run_periodic_instruction(rover: Rover):
+    """ Executes instruction given to rover, skipping repeats of a repeated pattern where possible.
+
+        Gives the same final position as `Rover.run_instruction`.
+    """
+
+    instruction = rover.instruction
+    if not instruction:
+        return
+    if not isinstance(instruction, str):
+        instruction = bytes(instruction).decode()
+
+    pattern, repeats, tail = find_period(instruction)
+    point = rover.position.point
+    x, y, heading = PeriodicProgram(pattern).run(repeats, rover.land, point.x, point.y, rover.position.heading)
+    point.x, point.y, rover.position.heading = execute(compile_instruction(tail), rover.land, x, y, heading)
+
+    rover.reset_instruction()
@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional, Sequence, Tuple
+from internal.models import Land, Rover
+from internal.models.mechanics import LABELS
+from internal.models.program import Instruction, compile_instruction, execute
+
+
+# compact form of a rover sent to worker processes: (name, x, y, heading, instruction).
+RoverTask = Tuple[str, int, int, int, Instruction]
+
+# land shared by every task of a worker process, set once when the worker starts.
+_worker_land: Optional[Land] = None
+
+
+def _set_worker_land(land: Land):
+    global _worker_land
+    _worker_land = land
+
+
+def _run_task(task: RoverTask) -> str:
+    name, x, y, heading, instruction = task
+    x, y, heading = execute(compile_instruction(instruction), _worker_land, x, y, heading)
+    return f"{name}:{x} {y} {LABELS[heading]}"
+
+
+def to_task(rover: Rover) -> RoverTask:
+    "returns the compact task form of a rover."
+
+    instruction = rover.instruction
+    if not isinstance(instruction, (str, bytes)):
+        # memoryviews of a mapped file cannot be pickled.
+        instruction = bytes(instruction)
+
+    point = rover.position.point
+    return rover.name, point.x, point.y, rover.position.heading, instruction
+
+
+def run_rovers_in_pool(rovers: Sequence[Rover], workers: int, chunksize: int = 0) -> Iterator[str]:
+    """ Runs rovers sharing one land across a pool of worker processes.
+
+        The land is sent to each worker once; rovers are sent as compact tasks. Yields the
+        `name:x y H` result line of every rover, in the order rovers were given.
+
+        @params
+            rovers: rovers to run.
+            workers: number of worker processes.
+            chunksize: number of tasks sent to a worker at a time. Spreads rovers evenly when 0.
+    """
+
+    if not rovers:
+        return
+
+    chunksize = chunksize or max(1, len(rovers) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_land, initargs=(rovers[0].land,)) as executor:
+        yield from executor.map(_run_task, map(to_task, rovers), chunksize=chunksize)
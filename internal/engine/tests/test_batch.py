@@ -0,0 +1,97 @@
+import random
+from unittest import TestCase
+from internal.engine.batch import (
+    DEFAULT_BLOCK_BYTES, DEFAULT_BLOCK_SIZE, Fleet, encode_instructions, fleet_block_size, run_fleet, simulate_rovers,
+    NOOP, LEFT, RIGHT, MOVE
+)
+from internal.models.bitmap_land import ObstacleLand
+from internal.models.land import RectangularLand
+from internal.models.mechanics import Position, Orientation
+from internal.models.point import Point
+from internal.models.rover import Rover
+
+
+class FleetTestCase(TestCase):
+    def setUp(self):
+        self.land = RectangularLand(upper_right_edge=Point(5, 5))
+
+    def build_rovers(self, count: int, seed: int = 3):
+        generator = random.Random(seed)
+        rovers = []
+        for number in range(count):
+            position = Position(generator.randint(0, 5), generator.randint(0, 5), generator.choice(list(Orientation)))
+            rover = Rover(name=f"Rover{number}", position=position, land=self.land)
+            rover.set_instruction("".join(generator.choice("LRMM") for _ in range(generator.randint(0, 40))))
+            rovers.append(rover)
+        return rovers
+
+    def test_encode_instructions_pads_with_noop(self):
+        codes = encode_instructions(["LRM", "M"], 3)
+        self.assertEqual(codes.tolist(), [[LEFT, RIGHT, MOVE], [MOVE, NOOP, NOOP]])
+
+    def test_non_ascii_characters_take_one_column(self):
+        codes = encode_instructions(["éMR", "Mé"], 2)
+        self.assertEqual(codes.tolist(), [[NOOP, MOVE], [MOVE, NOOP]])
+
+        rover = Rover(name="Rover1", position=Position(1, 1, Orientation.N), land=self.land)
+        rover.set_instruction("MéüMRM")
+        fleet = simulate_rovers([rover], block_size=2)
+        rover.run_instruction()
+        self.assertEqual(list(fleet.lines()), [f"Rover1:{rover.position}"])
+
+    def test_fleet_lines_match_rover_output_format(self):
+        rovers = self.build_rovers(1)
+        self.assertEqual(list(Fleet.from_rovers(rovers).lines()), [f"{rovers[0].name}:{rovers[0].position}"])
+
+    def test_simulation_matches_object_path(self):
+        rovers = self.build_rovers(50)
+        fleet = simulate_rovers(rovers)
+
+        expected = []
+        for rover in rovers:
+            rover.run_instruction()
+            expected.append(f"{rover.name}:{rover.position}")
+
+        self.assertEqual(list(fleet.lines()), expected)
+
+    def test_small_blocks_give_same_result(self):
+        rovers = self.build_rovers(20, seed=11)
+        self.assertEqual(list(simulate_rovers(rovers, block_size=3).lines()), list(simulate_rovers(rovers).lines()))
+
+    def test_block_size_shrinks_as_fleet_grows(self):
+        self.assertEqual(fleet_block_size(10), DEFAULT_BLOCK_SIZE)
+        self.assertLess(fleet_block_size(10**5) * 10**5, DEFAULT_BLOCK_BYTES)
+        self.assertEqual(fleet_block_size(10**9), 1)
+        self.assertEqual(fleet_block_size(1000, block_bytes=8000), 2)
+
+    def test_encoded_instructions_run_a_block_at_a_time(self):
+        rovers = self.build_rovers(3, seed=5)
+        rovers[0].set_instruction("M5000R3M7L2M2")
+        rovers[1].set_instruction("L5M3")
+        fleet = simulate_rovers(rovers, block_size=64)
+
+        expected = []
+        for rover in rovers:
+            rover.run_instruction()
+            expected.append(f"{rover.name}:{rover.position}")
+        self.assertEqual(list(fleet.lines()), expected)
+
+    def test_moves_off_the_edge_are_dropped(self):
+        rover = Rover(name="Edge Rover", position=Position(5, 5, Orientation.N), land=self.land)
+        fleet = Fleet.from_rovers([rover])
+        run_fleet(fleet, self.land, ["MMRMM"])
+        self.assertEqual(list(fleet.lines()), ["Edge Rover:5 5 E"])
+
+    def test_simulation_respects_obstacles(self):
+        land = ObstacleLand(upper_right_edge=Point(5, 5), obstacles=[(Point(2, 2), Point(3, 3))])
+        rovers = [rover for rover in self.build_rovers(60, seed=5) if land.is_address_within(rover.position.point)]
+        for rover in rovers:
+            rover.land = land
+        fleet = simulate_rovers(rovers)
+
+        expected = []
+        for rover in rovers:
+            rover.run_instruction()
+            expected.append(f"{rover.name}:{rover.position}")
+
+        self.assertEqual(list(fleet.lines()), expected)
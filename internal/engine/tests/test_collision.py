@@ -0,0 +1,107 @@
+from unittest import TestCase
+from internal.engine.collision import OccupancyIndex, OccupiedLand, run_with_collisions
+from internal.models.land import RectangularLand
+from internal.models.mechanics import Position, Orientation
+from internal.models.point import Point
+from internal.models.rover import Rover
+from utils import EngineError, LandError, RoverError
+
+
+class FaultyLand(RectangularLand):
+    "rectangular land that fails when asked about one of its columns."
+
+    def __init__(self, upper_right_edge: Point, faulty_x: int) -> None:
+        super().__init__(upper_right_edge=upper_right_edge)
+        self.faulty_x = faulty_x
+
+    def is_coordinate_within(self, x: int, y: int) -> bool:
+        if x == self.faulty_x:
+            raise LandError(f"column {x} cannot be checked")
+        return super().is_coordinate_within(x, y)
+
+
+class OccupancyIndexTestCase(TestCase):
+    def test_occupy_and_vacate(self):
+        occupancy = OccupancyIndex()
+        occupancy.occupy(Point(1, 2))
+        self.assertTrue(occupancy.is_occupied(Point(1, 2)))
+        occupancy.vacate(Point(1, 2))
+        self.assertFalse(occupancy.is_occupied(Point(1, 2)))
+
+    def test_occupied_cells_are_not_on_occupied_land(self):
+        occupancy = OccupancyIndex()
+        occupancy.occupy(Point(1, 1))
+        land = OccupiedLand(RectangularLand(upper_right_edge=Point(3, 3)), occupancy)
+        self.assertFalse(land.is_address_within(Point(1, 1)))
+        self.assertTrue(land.is_address_within(Point(1, 2)))
+        self.assertFalse(land.is_address_within(Point(4, 2)))
+
+
+class RunWithCollisionsTestCase(TestCase):
+    def setUp(self):
+        self.land = RectangularLand(upper_right_edge=Point(5, 5))
+
+    def build_rover(self, name: str, position: Position, instruction: str) -> Rover:
+        rover = Rover(name=name, position=position, land=self.land)
+        rover.set_instruction(instruction)
+        return rover
+
+    def test_rover_stops_before_waiting_rover(self):
+        first = self.build_rover("Rover1", Position(0, 0, Orientation.E), "MMMMM")
+        second = self.build_rover("Rover2", Position(3, 0, Orientation.N), "M")
+        run_with_collisions([first, second])
+        self.assertEqual(first.position, Position(2, 0, Orientation.E))
+        self.assertEqual(second.position, Position(3, 1, Orientation.N))
+
+    def test_rover_stops_before_finished_rover(self):
+        first = self.build_rover("Rover1", Position(0, 1, Orientation.S), "MRMM")
+        second = self.build_rover("Rover2", Position(4, 0, Orientation.W), "MMMMM")
+        run_with_collisions([first, second])
+        self.assertEqual(first.position, Position(0, 0, Orientation.W))
+        self.assertEqual(second.position, Position(1, 0, Orientation.W))
+
+    def test_timestep_mode_interleaves_rovers(self):
+        # Rover2 moves out of the way at the first step, so Rover1 is never blocked.
+        first = self.build_rover("Rover1", Position(0, 0, Orientation.E), "MMM")
+        second = self.build_rover("Rover2", Position(1, 0, Orientation.N), "M")
+        run_with_collisions([second, first], mode="timestep")
+        self.assertEqual(first.position, Position(3, 0, Orientation.E))
+        self.assertEqual(second.position, Position(1, 1, Orientation.N))
+        self.assertEqual(first.land, self.land)
+        self.assertEqual(first.instruction, "")
+
+    def test_timestep_mode_runs_encoded_instructions_step_by_step(self):
+        first = self.build_rover("Rover1", Position(0, 0, Orientation.E), "M10000L")
+        second = self.build_rover("Rover2", Position(3, 1, Orientation.N), "L2M")
+        run_with_collisions([second, first], mode="timestep")
+        # Rover2 takes (3, 0) at the third step, just before Rover1 would, so Rover1 waits at x 2 for good.
+        self.assertEqual(first.position, Position(2, 0, Orientation.N))
+        self.assertEqual(second.position, Position(3, 0, Orientation.S))
+
+    def test_timestep_mode_blocks_moves_onto_rovers(self):
+        first = self.build_rover("Rover1", Position(0, 0, Orientation.E), "MMM")
+        second = self.build_rover("Rover2", Position(2, 0, Orientation.N), "LLRR")
+        run_with_collisions([first, second], mode="timestep")
+        self.assertEqual(first.position, Position(1, 0, Orientation.E))
+
+    def test_lands_are_restored_when_a_rover_fails(self):
+        for mode in ("sequential", "timestep"):
+            land = FaultyLand(Point(5, 5), faulty_x=3)
+            rovers = [Rover(name=f"Rover{x}", position=Position(x, 0, Orientation.E), land=land) for x in (0, 4)]
+            rovers[0].set_instruction("MMMM")
+            rovers[1].set_instruction("LMM")
+
+            with self.assertRaises(LandError):
+                run_with_collisions(rovers, mode=mode)
+            for rover in rovers:
+                self.assertIs(rover.land, land)
+
+    def test_rovers_landing_on_same_cell_raises_error(self):
+        first = self.build_rover("Rover1", Position(1, 1, Orientation.E), "")
+        second = self.build_rover("Rover2", Position(1, 1, Orientation.N), "")
+        with self.assertRaises(RoverError):
+            run_with_collisions([first, second])
+
+    def test_unknown_mode_raises_error(self):
+        with self.assertRaises(EngineError):
+            run_with_collisions([], mode="teleport")
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# modules only some engines or modes need. a plain run of a small mission must not import them.
+HEAVY_MODULES = ("numpy", "asyncio", "sqlite3", "multiprocessing", "concurrent.futures", "json", "fractions")
+
+
+class LazyImportsTestCase(TestCase):
+    def imported_modules(self, code: str):
+        "runs code in a fresh interpreter and returns which of the heavy modules it imported."
+
+        script = f"{code}\nimport sys\nprint(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.splitlines()[-1].split()
+
+    def test_importing_engines_loads_nothing_heavy(self):
+        self.assertEqual(self.imported_modules("import internal.engine, internal.parser, internal.models"), [])
+
+    def test_engines_load_their_modules_when_used(self):
+        self.assertIn("numpy", self.imported_modules("from internal.engine import run_fleet"))
+
+    def test_cli_run_loads_nothing_heavy(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+            file.write("Plateau:5 5\nRover1 Landing:1 2 N\nRover1 Instructions:LMLMLMLMM\n")
+        self.addCleanup(os.remove, file.name)
+
+        code = f"import runpy, sys\nsys.argv = ['app', {file.name!r}]\nrunpy.run_path('main/app.py', run_name='__main__')"
+        self.assertEqual(self.imported_modules(code), [])
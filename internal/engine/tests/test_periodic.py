@@ -0,0 +1,55 @@
+import random
+from unittest import TestCase
+from internal.engine.periodic import PeriodicProgram, find_period, run_periodic_instruction
+from internal.models.land import RectangularLand
+from internal.models.mechanics import Position, Orientation
+from internal.models.point import Point
+from internal.models.program import compile_instruction, execute
+from internal.models.rover import Rover
+
+
+class FindPeriodTestCase(TestCase):
+    def test_exact_repetition(self):
+        self.assertEqual(find_period("LMRM" * 5), ("LMRM", 5, ""))
+
+    def test_repetition_with_tail(self):
+        self.assertEqual(find_period("LMRM" * 5 + "LM"), ("LMRM", 5, "LM"))
+
+    def test_no_period(self):
+        self.assertEqual(find_period("LMRMM"), ("LMRMM", 1, ""))
+
+
+class PeriodicProgramTestCase(TestCase):
+    def test_matches_stepwise_execution(self):
+        generator = random.Random(13)
+        for _ in range(300):
+            size = generator.randint(0, 30)
+            land = RectangularLand(upper_right_edge=Point(size, generator.randint(0, 30)))
+            x, y, heading = generator.randint(0, size), generator.randint(0, land.upper_right_edge.y), generator.randint(0, 3)
+            pattern = "".join(generator.choice("LRMMM") for _ in range(generator.randint(1, 8)))
+            repeats = generator.randint(0, 200)
+
+            expected = execute(compile_instruction(pattern * repeats), land, x, y, heading)
+            self.assertEqual(PeriodicProgram(pattern).run(repeats, land, x, y, heading), expected, (pattern, repeats))
+
+    def test_long_repetition_far_from_edges_is_skipped(self):
+        land = RectangularLand(upper_right_edge=Point(10 ** 9, 10 ** 9))
+        start = 5 * 10 ** 8
+        self.assertEqual(PeriodicProgram("MLMR").run(10 ** 7, land, start, start, 0), (start - 10 ** 7, start + 10 ** 7, 0))
+
+    def test_rover_pushing_against_edge(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        self.assertEqual(PeriodicProgram("MMRL").run(10 ** 7, land, 1, 1, 0), (1, 5, 0))
+
+    def test_run_periodic_instruction_matches_run_instruction(self):
+        land = RectangularLand(upper_right_edge=Point(40, 40))
+        instruction = "MMRMLMMLL" * 30 + "MMR"
+        rover = Rover(name="Rover1", position=Position(20, 20, Orientation.E), land=land)
+        rover_clone = rover.clone()
+        rover.set_instruction(instruction)
+        rover_clone.set_instruction(instruction)
+
+        run_periodic_instruction(rover)
+        rover_clone.run_instruction()
+        self.assertEqual(rover.position, rover_clone.position)
+        self.assertEqual(rover.instruction, "")
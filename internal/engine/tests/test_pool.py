@@ -0,0 +1,38 @@
+import random
+from unittest import TestCase
+from internal.engine.pool import run_rovers_in_pool, to_task
+from internal.models.land import RectangularLand
+from internal.models.mechanics import Position, Orientation
+from internal.models.point import Point
+from internal.models.rover import Rover
+
+
+class PoolTestCase(TestCase):
+    def setUp(self):
+        generator = random.Random(5)
+        land = RectangularLand(upper_right_edge=Point(8, 8))
+        self.rovers = []
+        for number in range(40):
+            position = Position(generator.randint(0, 8), generator.randint(0, 8), generator.choice(list(Orientation)))
+            rover = Rover(name=f"Rover{number}", position=position, land=land)
+            rover.set_instruction("".join(generator.choice("LRMM") for _ in range(generator.randint(0, 50))))
+            self.rovers.append(rover)
+
+    def test_to_task_is_compact_tuple(self):
+        rover = self.rovers[0]
+        task = to_task(rover)
+        self.assertEqual(task, (rover.name, rover.position.point.x, rover.position.point.y, task[3], rover.instruction))
+        self.assertEqual(Orientation(task[3] * 90), rover.position.direction.orientation)
+
+    def test_results_match_serial_run_in_input_order(self):
+        results = list(run_rovers_in_pool(self.rovers, workers=2, chunksize=3))
+
+        expected = []
+        for rover in self.rovers:
+            rover.run_instruction()
+            expected.append(f"{rover.name}:{rover.position}")
+
+        self.assertEqual(results, expected)
+
+    def test_no_rovers_gives_no_results(self):
+        self.assertEqual(list(run_rovers_in_pool([], workers=2)), [])
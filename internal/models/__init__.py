@@ -1,4 +1,5 @@
 from .point import Point
 from .mechanics import Orientation, Position
 from .land import Land, LandFactory, LandShape
+from .program import CompiledInstruction, ExecutionCounters, compile_instruction, execute, expand_instruction
 from .rover import Rover
\ No newline at end of file
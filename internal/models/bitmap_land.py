@@ -0,0 +1,143 @@
+from dataclasses import dataclass, field
+from math import gcd
+from typing import Dict, List, Tuple
+from utils import LandError
+from .land import Land
+from .point import Point
+
+
+class BitmapLand(Land):
+    """ Land of any shape, looked up in a bitmap with one bit per cell of its bounding box.
+
+        The bitmap is computed once when the land is created, so checking a cell costs a bounds
+        check and a bit test whatever the shape. Rows are `stride` bytes long, with the cell at
+        column i of a row in bit i % 8 of byte i // 8.
+    """
+
+    def _set_bitmap(self, lower_left: Point, upper_right: Point, row_masks: Dict[int, int]):
+        """ Builds the bitmap of a land from the cells inside it in each row.
+
+            @params
+                lower_left, upper_right: corners of the bounding box of the land.
+                row_masks: integer bit masks of the cells inside the land, keyed by row y coordinate.
+                    Bit i of a mask is the cell at x coordinate `lower_left.x + i`.
+        """
+
+        self._origin_x, self._origin_y = lower_left.x, lower_left.y
+        self._width = upper_right.x - lower_left.x + 1
+        self._height = upper_right.y - lower_left.y + 1
+        self._stride = (self._width + 7) // 8
+        self._bits = bytearray(self._stride * self._height)
+
+        for y, mask in row_masks.items():
+            start = (y - self._origin_y) * self._stride
+            self._bits[start:start + self._stride] = mask.to_bytes(self._stride, "little")
+
+    def is_address_within(self, address: Point) -> bool:
+        return self.is_coordinate_within(address.x, address.y)
+
+    def is_coordinate_within(self, x: int, y: int) -> bool:
+        column, row = x - self._origin_x, y - self._origin_y
+        if not (0 <= column < self._width and 0 <= row < self._height):
+            return False
+        return bool(self._bits[row * self._stride + (column >> 3)] >> (column & 7) & 1)
+
+    def contains_many(self, xs, ys):
+        import numpy as np
+
+        columns = np.asarray(xs, dtype=np.int64) - self._origin_x
+        rows = np.asarray(ys, dtype=np.int64) - self._origin_y
+        inside = (columns >= 0) & (columns < self._width) & (rows >= 0) & (rows < self._height)
+
+        columns = np.where(inside, columns, 0)
+        cells = np.frombuffer(self._bits, dtype=np.uint8)[np.where(inside, rows, 0) * self._stride + (columns >> 3)]
+        return inside & ((cells >> (columns & 7)) & 1).astype(bool)
+
+    @property
+    def bounds(self) -> Tuple[Point, Point]:
+        return (
+            Point(x=self._origin_x, y=self._origin_y),
+            Point(x=self._origin_x + self._width - 1, y=self._origin_y + self._height - 1)
+        )
+
+
+@dataclass
+class PolygonLand(BitmapLand):
+    """ Land inside a simple polygon, edges and corners included.
+
+        Main Attributes:
+            vertices: corners of the polygon in order, clockwise or anticlockwise.
+    """
+    vertices: List[Point]
+
+    def __post_init__(self):
+        from fractions import Fraction
+
+        if len(self.vertices) < 3:
+            raise LandError(f"polygon land needs at least 3 vertices. got {len(self.vertices)}")
+
+        lower_left = Point(x=min(vertex.x for vertex in self.vertices), y=min(vertex.y for vertex in self.vertices))
+        upper_right = Point(x=max(vertex.x for vertex in self.vertices), y=max(vertex.y for vertex in self.vertices))
+        edges = list(zip(self.vertices, self.vertices[1:] + self.vertices[:1]))
+        row_masks: Dict[int, int] = {}
+
+        # cells strictly inside, row by row: fill between pairs of edge crossings.
+        for y in range(lower_left.y, upper_right.y + 1):
+            crossings = sorted(
+                Fraction(start.x * (end.y - start.y) + (y - start.y) * (end.x - start.x), end.y - start.y)
+                for start, end in edges
+                if min(start.y, end.y) <= y < max(start.y, end.y)
+            )
+            mask = 0
+            for left, right in zip(crossings[::2], crossings[1::2]):
+                first, last = -(-left.numerator // left.denominator), right.numerator // right.denominator
+                if first <= last:
+                    mask |= ((1 << (last - first + 1)) - 1) << (first - lower_left.x)
+            row_masks[y] = mask
+
+        # cells on the edges, which the crossings above leave out along the top and horizontal edges.
+        for start, end in edges:
+            dx, dy = end.x - start.x, end.y - start.y
+            count = gcd(abs(dx), abs(dy))
+            for step in range(count + 1):
+                x, y = start.x + step * dx // count, start.y + step * dy // count
+                row_masks[y] |= 1 << (x - lower_left.x)
+
+        self._set_bitmap(lower_left, upper_right, row_masks)
+
+
+@dataclass
+class ObstacleLand(BitmapLand):
+    """ Rectangular land with keep-out areas, such as craters, that rovers cannot move onto.
+
+        Main Attributes:
+            upper_right_edge: upper right corner of the land.
+            obstacles: (lower left, upper right) corners of each rectangular keep-out area, edges included.
+            lower_left_edge: lower left corner of the land.
+    """
+    upper_right_edge: Point
+    obstacles: List[Tuple[Point, Point]] = field(default_factory=list)
+    lower_left_edge: Point = field(default_factory=lambda: Point(x=0, y=0))
+
+    def __post_init__(self):
+        corners = [(self.lower_left_edge, self.upper_right_edge), *self.obstacles]
+        for lower_left, upper_right in corners:
+            if lower_left.x > upper_right.x or lower_left.y > upper_right.y:
+                raise LandError(
+                    "corners of obstacle land and its obstacles must be given lower left first. "
+                    f"got ({lower_left.x}, {lower_left.y}) and ({upper_right.x}, {upper_right.y})"
+                )
+
+        left, bottom = self.lower_left_edge.x, self.lower_left_edge.y
+        width = self.upper_right_edge.x - left + 1
+        row_masks = {y: (1 << width) - 1 for y in range(bottom, self.upper_right_edge.y + 1)}
+
+        for lower_left, upper_right in self.obstacles:
+            first, last = max(lower_left.x, left), min(upper_right.x, self.upper_right_edge.x)
+            if first > last:
+                continue
+            span = ((1 << (last - first + 1)) - 1) << (first - left)
+            for y in range(max(lower_left.y, bottom), min(upper_right.y, self.upper_right_edge.y) + 1):
+                row_masks[y] &= ~span
+
+        self._set_bitmap(self.lower_left_edge, self.upper_right_edge, row_masks)
@@ -1,12 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
-from utils import exit_program
+from typing import Tuple
+from utils import LandError
 from .point import Point
 
 
 class LandShape(Enum):
     RECTANGULAR = "rectangular"
+    POLYGON = "polygon"
+    OBSTACLES = "obstacles"
 
 
 class Land(ABC):
@@ -15,18 +18,97 @@ class Land(ABC):
         "checks if a point is inside land"
         pass
 
+    def is_coordinate_within(self, x: int, y: int) -> bool:
+        "checks if the point at coordinates (x, y) is inside land"
+        return self.is_address_within(Point(x, y))
+
+    def contains_many(self, xs, ys):
+        """ Returns a NumPy boolean mask of the coordinates inside land.
+
+            Subclasses that can check many coordinates at once should override this; by default
+            every coordinate is checked with `is_coordinate_within`.
+
+            @params
+                xs, ys: x and y coordinates as sequences, array.array or NumPy arrays of the same length.
+        """
+
+        import numpy as np
+
+        return np.fromiter(
+            (self.is_coordinate_within(x, y) for x, y in zip(np.asarray(xs).tolist(), np.asarray(ys).tolist())),
+            dtype=bool,
+            count=len(xs)
+        )
+
+    @property
+    def bounds(self) -> Tuple[Point, Point]:
+        """ Returns the lower left and upper right corners of the smallest rectangle holding the land.
+
+            Lands that are not bounded, or do not know their bounds, raise LandError. Route planning
+            and the result cache need bounds, so subclasses that have them should override this.
+        """
+        raise LandError(f"{type(self).__name__} has no bounds, which route planning and result caching need")
+
+    def traverse(self, x: int, y: int, dx: int, dy: int, steps: int) -> Tuple[int, int]:
+        """ Returns the coordinates reached after taking up to `steps` unit steps of (dx, dy) from (x, y).
+
+            Stepping stops at the first step that would leave the land, the same way a rover drops
+            every move that would take it off the land. Subclasses may override this with a closed form.
+        """
+
+        for _ in range(steps):
+            if not self.is_coordinate_within(x + dx, y + dy):
+                break
+            x += dx
+            y += dy
+
+        return x, y
+
 
 @dataclass
 class RectangularLand(Land):
     upper_right_edge: Point
-    lower_left_edge: Point = Point(x=0, y=0)
+    lower_left_edge: Point = field(default_factory=lambda: Point(x=0, y=0))
 
     def is_address_within(self, address: Point) -> bool:
+        return self.is_coordinate_within(address.x, address.y)
+
+    def is_coordinate_within(self, x: int, y: int) -> bool:
+        return (
+            (x <= self.upper_right_edge.x and y <= self.upper_right_edge.y) and
+            (x >= self.lower_left_edge.x and y >= self.lower_left_edge.y)
+        )
+
+    def contains_many(self, xs, ys):
+        import numpy as np
+
+        xs, ys = np.asarray(xs), np.asarray(ys)
         return (
-            (address.x <= self.upper_right_edge.x and address.y <= self.upper_right_edge.y) and
-            (address.x >= self.lower_left_edge.x and address.y >= self.lower_left_edge.y)
+            (xs <= self.upper_right_edge.x) & (ys <= self.upper_right_edge.y) &
+            (xs >= self.lower_left_edge.x) & (ys >= self.lower_left_edge.y)
         )
 
+    @property
+    def bounds(self) -> Tuple[Point, Point]:
+        return self.lower_left_edge, self.upper_right_edge
+
+    def traverse(self, x: int, y: int, dx: int, dy: int, steps: int) -> Tuple[int, int]:
+        if not self.is_coordinate_within(x, y):
+            # off-land starting points can still step onto the land, so keep the exact per-step walk.
+            return super().traverse(x, y, dx, dy, steps)
+
+        # a straight run inside a rectangle is blocked only by the edge it runs towards.
+        if dx > 0:
+            x = min(x + steps, self.upper_right_edge.x)
+        elif dx < 0:
+            x = max(x - steps, self.lower_left_edge.x)
+        elif dy > 0:
+            y = min(y + steps, self.upper_right_edge.y)
+        elif dy < 0:
+            y = max(y - steps, self.lower_left_edge.y)
+
+        return x, y
+
 
 class LandFactory:
     """factory class to create Land instances based on properties like shape of the land."""
@@ -35,6 +117,13 @@ class LandFactory:
     def create(cls, land_shape: LandShape, **kwargs) -> Land:
         if land_shape == LandShape.RECTANGULAR:
             return RectangularLand(**kwargs)
-        else:
-            exit_program(f"no such land. got {land_shape} as land_shape")
+        elif land_shape == LandShape.POLYGON:
+            from .bitmap_land import PolygonLand
+
+            return PolygonLand(**kwargs)
+        elif land_shape == LandShape.OBSTACLES:
+            from .bitmap_land import ObstacleLand
 
+            return ObstacleLand(**kwargs)
+        else:
+            raise LandError(f"no such land. got {land_shape} as land_shape")
@@ -1,7 +1,6 @@
 from enum import Enum
-from copy import deepcopy
-from dataclasses import dataclass
-from utils import exit_program
+from typing import Tuple
+from utils import RotationError
 from .point import Point
 
 
@@ -14,40 +13,104 @@ class Orientation(Enum):
     W = 270     # West
 
 
-@dataclass
+# headings are kept as small ints: quarter turns to the right of north. they index these tables directly.
+HEADINGS = tuple(Orientation)
+LABELS = tuple(orientation.name for orientation in HEADINGS)
+UNIT_VECTORS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+LEFT_OF = (3, 0, 1, 2)
+RIGHT_OF = (1, 2, 3, 0)
+
+
+def heading_of(orientation: Orientation) -> int:
+    "returns the heading of a cardinal compass point."
+    return orientation.value // 90
+
+
+def quarter_turns(rotation: int) -> int:
+    "returns the number of quarter turns to the right in a rotation given in degrees."
+
+    if rotation % 90 != 0:
+        raise RotationError("rotation should be to one of the four cardinal compass points")
+
+    return rotation // 90
+
+
 class Direction:
-    orientation: Orientation
+    """ Represents the direction faced by an object, stored as a heading.
 
-    def rotate(self, rotation: int):
-        if rotation % 90 != 0:
-            exit_program("rotation should be to one of the four cardinal compass points")
+        Main Attributes:
+            heading: quarter turns to the right of north (0 to 3).
+            orientation: cardinal compass point faced.
+
+        Main Methods:
+            rotate: changes direction by an angle.
+    """
+
+    __slots__ = ("heading",)
+
+    def __init__(self, orientation: Orientation) -> None:
+        self.heading = heading_of(orientation)
+
+    @property
+    def orientation(self) -> Orientation:
+        return HEADINGS[self.heading]
+
+    @orientation.setter
+    def orientation(self, orientation: Orientation):
+        self.heading = heading_of(orientation)
 
-        angle_of_orientation = (self.orientation.value + rotation) % 360
-        self.orientation = Orientation(angle_of_orientation)
+    def rotate(self, rotation: int):
+        self.heading = (self.heading + quarter_turns(rotation)) % 4
     
     @property
     def label(self):
-        return self.orientation.name
+        return LABELS[self.heading]
     
     def __eq__(self, other) -> bool:
         if not isinstance(other, Direction):
             return False
 
-        return self.orientation == other.orientation
+        return self.heading == other.heading
+
+    def __repr__(self) -> str:
+        return f"Direction(orientation={self.orientation!r})"
+
+class _PositionDirection(Direction):
+    "Direction of a position, which reads and writes the heading of the position."
+
+    __slots__ = ("_position",)
+
+    def __init__(self, position: "Position") -> None:
+        self._position = position
+
+    @property
+    def heading(self) -> int:
+        return self._position.heading
+
+    @heading.setter
+    def heading(self, heading: int):
+        self._position.heading = heading
+
 
 class Position:
     """ Represents the position of a mobile object.
 
         Main Attributes:
             point: Point (x and y coordinate) of the object.
-            direction: Direction that the object is facing.
+            heading: heading that the object is facing, as quarter turns to the right of north.
+            direction: Direction that the object is facing. It is a view of `heading`, so changing it turns the object.
 
         Main Methods:
             rotate: changes direction of the object.
+            turn_left: rotates the object to the left by 90 degrees.
+            turn_right: rotates the object to the right by 90 degrees.
             move: moves the object by one unit along the direction faced.
+            next_coordinates: returns the coordinates a move would reach, without moving.
             clone: copies the current position of an object
     """
 
+    __slots__ = ("point", "heading")
+
     def __init__(self, x: int, y: int, orientation: Orientation) -> None:
         """ Initializer
         @params
@@ -57,25 +120,41 @@ class Position:
         """
 
         self.point = Point(x, y)
-        self.direction = Direction(orientation)
+        self.heading = heading_of(orientation)
+
+    @property
+    def direction(self) -> Direction:
+        return _PositionDirection(self)
+
+    @direction.setter
+    def direction(self, direction: Direction):
+        self.heading = direction.heading
 
     def rotate(self, angle: int):
-        self.direction.rotate(angle)
+        self.heading = (self.heading + quarter_turns(angle)) % 4
+
+    def turn_left(self):
+        self.heading = LEFT_OF[self.heading]
+
+    def turn_right(self):
+        self.heading = RIGHT_OF[self.heading]
     
     def change_orientation(self, orientation: Orientation):
-        self.direction.orientation = orientation
+        self.heading = heading_of(orientation)
     
     def move(self):
         "moves an object by one unit along the direction faced."
 
-        if self.direction.orientation == Orientation.N:
-            self.move_up()
-        elif self.direction.orientation == Orientation.S:
-            self.move_down()
-        elif self.direction.orientation == Orientation.E:
-            self.move_right()
-        elif self.direction.orientation == Orientation.W:
-            self.move_left()
+        dx, dy = UNIT_VECTORS[self.heading]
+        point = self.point
+        point.x += dx
+        point.y += dy
+    
+    def next_coordinates(self) -> Tuple[int, int]:
+        "returns the coordinates reached by moving one unit along the direction faced, without moving."
+
+        dx, dy = UNIT_VECTORS[self.heading]
+        return self.point.x + dx, self.point.y + dy
     
     def move_up(self):
         self.point.move_y(1)
@@ -90,13 +169,16 @@ class Position:
         self.point.move_x(-1)
     
     def clone(self):
-        return deepcopy(self)
+        position = Position.__new__(Position)
+        position.point = Point(self.point.x, self.point.y)
+        position.heading = self.heading
+        return position
 
     def __str__(self):
-        return f"{self.point.x} {self.point.y} {self.direction.label}"
+        return f"{self.point.x} {self.point.y} {LABELS[self.heading]}"
     
     def __eq__(self, other) -> bool:
         if not isinstance(other, Position):
             return False
 
-        return self.point == other.point and self.direction == other.direction
+        return self.point == other.point and self.heading == other.heading
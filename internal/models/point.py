@@ -15,6 +15,8 @@ class Point:
             move:   move along x and/or y axis.
     """
 
+    __slots__ = ("x", "y")
+
     x: int
     y: int
 
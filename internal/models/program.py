@@ -0,0 +1,360 @@
+import re
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from utils import EngineError
+from .land import Land
+from .mechanics import UNIT_VECTORS
+
+Instruction = Union[str, bytes, bytearray, memoryview]
+
+_SEGMENT = re.compile(r"([^M]*)(M*)")
+_BYTES_SEGMENT = re.compile(rb"([^M]*)(M*)")
+_COUNT_CHUNK_SIZE = 1 << 20
+
+# run-length encoded instructions follow each command with an optional count, for example `M1000R3M500`.
+_DIGITS = tuple("0123456789")
+_BYTES_DIGITS = tuple(digit.encode() for digit in _DIGITS)
+_BYTES_DIGIT = re.compile(rb"[0-9]")
+# instructions up to this length are told plain by `isalpha`, which is cheaper than looking for each digit.
+_SHORT_INSTRUCTION_LENGTH = 256
+_RUN = re.compile(r"([LRM])([0-9]*)")
+_BYTES_RUN = re.compile(rb"([LRM])([0-9]*)")
+_ENCODED = re.compile(r"(?:[LRM][0-9]*)*")
+_BYTES_ENCODED = re.compile(rb"(?:[LRM][0-9]*)*")
+
+# largest count of a run, and of all the runs of an instruction together, so that every count of steps
+# made by an instruction fits in a signed 64-bit integer.
+MAX_RUN_COUNT = 10 ** 15
+MAX_ENCODED_STEPS = 10 ** 18
+
+# longest run-length encoded instruction, in commands, that `expand_instruction` spells out.
+MAX_EXPANDED_LENGTH = 1 << 26
+
+# runs of a plain instruction: the index of the matching group tells the command.
+_PLAIN_RUN = re.compile("(L+)|(R+)|(M+)")
+_BYTES_PLAIN_RUN = re.compile(rb"(L+)|(R+)|(M+)")
+_RUN_COMMANDS = (None, "L", "R", "M")
+
+
+class CompiledInstruction:
+    """ Compact form of an instruction string.
+
+        The instruction is kept as a list of segments. Each segment is a rotation, in quarter turns
+        to the right (0 to 3), followed by a run of forward moves along the resulting heading.
+
+        Main Attributes:
+            turns: rotation of every segment.
+            steps: number of moves of every segment.
+
+        Main Methods:
+            append: adds a segment, merging it into the previous one where possible.
+    """
+
+    __slots__ = ("turns", "steps")
+
+    def __init__(self) -> None:
+        self.turns = array("b")
+        self.steps = array("q")
+
+    def append(self, turn: int, steps: int):
+        """ adds a segment to the compiled instruction.
+            @params
+                turn - quarter turns to the right made before moving.
+                steps - number of forward moves made after turning.
+        """
+        turn %= 4
+        if self.turns and not self.steps[-1]:
+            # previous segment only rotates, so both rotations collapse into one.
+            self.turns[-1] = (self.turns[-1] + turn) % 4
+            self.steps[-1] = steps
+        elif self.turns and not turn:
+            self.steps[-1] += steps
+        elif turn or steps:
+            self.turns.append(turn)
+            self.steps.append(steps)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.turns, self.steps)
+
+
+def has_digit(instruction: Instruction) -> bool:
+    "checks if an instruction has any digit, which only run-length encoded instructions should have."
+
+    if isinstance(instruction, memoryview):
+        return _BYTES_DIGIT.search(instruction) is not None
+    if len(instruction) <= _SHORT_INSTRUCTION_LENGTH and instruction.isalpha():
+        return False
+
+    # a substring test finds a character with memchr, many times faster than a regular expression scan.
+    for digit in _DIGITS if isinstance(instruction, str) else _BYTES_DIGITS:
+        if digit in instruction:
+            return True
+    return False
+
+
+def is_encoded(instruction: Instruction) -> bool:
+    """ Checks if an instruction is run-length encoded: only made of commands with optional counts, and with a count.
+
+        Any other instruction is plain. Parsers reject instructions with digits that are not valid encodings,
+        so plain instructions read from input have no digits.
+    """
+
+    return has_digit(instruction) and is_valid_encoding(instruction)
+
+
+def is_valid_encoding(instruction: Instruction) -> bool:
+    "checks if a run-length encoded instruction is only made of commands with optional counts."
+    return (_ENCODED if isinstance(instruction, str) else _BYTES_ENCODED).fullmatch(instruction) is not None
+
+
+def check_run_counts(instruction: Instruction):
+    "raises ValueError if a run of an encoded instruction counts more than MAX_RUN_COUNT, or all its runs more than MAX_ENCODED_STEPS."
+
+    max_digits = len(str(MAX_RUN_COUNT))
+    total = 0
+    for match in (_RUN if isinstance(instruction, str) else _BYTES_RUN).finditer(instruction):
+        count = match.group(2)
+        # a count is checked by its length first, so that a huge count is never converted.
+        if len(count) > max_digits or (count and int(count) > MAX_RUN_COUNT):
+            raise ValueError(f"run counts must be at most {MAX_RUN_COUNT}")
+        total += int(count) if count else 1
+
+    if total > MAX_ENCODED_STEPS:
+        raise ValueError(f"run-length encoded instructions must add up to at most {MAX_ENCODED_STEPS} steps")
+
+
+def iter_runs(instruction: Instruction) -> Iterator[Tuple[str, int]]:
+    "yields (command, count) runs of a run-length encoded instruction. commands without a count run once."
+
+    pattern = _RUN if isinstance(instruction, str) else _BYTES_RUN
+    for match in pattern.finditer(instruction):
+        command, count = match.groups()
+        if not isinstance(command, str):
+            command = command.decode()
+        yield command, int(count) if count else 1
+
+
+def _merge_runs(runs: Iterable[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+    "merges adjacent runs of the same command."
+
+    command, count = None, 0
+    for next_command, next_count in runs:
+        if next_command == command:
+            count += next_count
+            continue
+        if command is not None:
+            yield command, count
+        command, count = next_command, next_count
+
+    if command is not None:
+        yield command, count
+
+
+def iter_command_runs(instruction: Instruction) -> Iterator[Tuple[str, int]]:
+    "yields (command, count) for each run of a repeated command in a plain or run-length encoded instruction."
+
+    if is_encoded(instruction):
+        return _merge_runs(iter_runs(instruction))
+
+    pattern = _PLAIN_RUN if isinstance(instruction, str) else _BYTES_PLAIN_RUN
+    return ((_RUN_COMMANDS[match.lastindex], match.end() - match.start()) for match in pattern.finditer(instruction))
+
+
+def instruction_length(instruction: Instruction) -> int:
+    "returns the number of steps in an instruction: its length, or the sum of its counts when run-length encoded."
+
+    if not is_encoded(instruction):
+        return len(instruction)
+
+    return sum(count for _, count in iter_runs(instruction))
+
+
+def expand_instruction(instruction: Instruction, max_length: int = MAX_EXPANDED_LENGTH) -> Instruction:
+    """ Returns a run-length encoded instruction as a plain instruction string. plain instructions are returned as they are.
+
+        Raises EngineError rather than allocating an instruction longer than `max_length` commands.
+        Use `iter_blocks` to go through longer ones.
+    """
+
+    if not is_encoded(instruction):
+        return instruction
+
+    length = instruction_length(instruction)
+    if length > max_length:
+        raise EngineError(f"run-length encoded instruction of {length} steps is too long to expand. at most {max_length}")
+
+    return "".join(command * count for command, count in iter_runs(instruction))
+
+
+def iter_blocks(instruction: Instruction, size: int) -> Iterator[Instruction]:
+    """ Yields an instruction as consecutive plain blocks of `size` steps, the last one possibly shorter.
+
+        Plain instructions are sliced, and run-length encoded ones are expanded one block at a time,
+        so memory does not grow with the number of steps.
+    """
+
+    if not is_encoded(instruction):
+        for start in range(0, len(instruction), size):
+            yield instruction[start:start + size]
+        return
+
+    parts: List[str] = []
+    length = 0
+    for command, count in iter_runs(instruction):
+        while count:
+            taken = min(count, size - length)
+            parts.append(command * taken)
+            length += taken
+            count -= taken
+            if length == size:
+                yield "".join(parts)
+                parts, length = [], 0
+
+    if parts:
+        yield "".join(parts)
+
+
+def encode_instruction(instruction: str) -> str:
+    "returns a plain instruction string run-length encoded, such as `MMMRLL` as `M3RL2`."
+    return encode_runs(iter_command_runs(instruction))
+
+
+def encode_runs(runs: Iterable[Tuple[str, int]]) -> str:
+    """ Returns (command, count) runs as a run-length encoded instruction.
+
+        Adjacent runs of the same command are merged, and runs with a count of 0 are left out since they take no steps.
+    """
+
+    runs = ((command, count) for command, count in runs if count)
+    return "".join(command + (str(count) if count > 1 else "") for command, count in _merge_runs(runs))
+
+
+def compile_instruction(instruction: Instruction) -> CompiledInstruction:
+    """ Compiles an instruction string into segments of (rotation, moves).
+
+        Characters other than `L`, `R` and `M` are ignored, as they are by `Rover.run_instruction`.
+        Bytes-like instructions are read in place without being decoded, and run-length encoded
+        instructions are compiled from their runs without being expanded.
+    """
+
+    if is_encoded(instruction):
+        return compile_encoded_instruction(instruction)
+
+    if isinstance(instruction, str):
+        pattern, left, right = _SEGMENT, "L", "R"
+    else:
+        pattern, left, right = _BYTES_SEGMENT, b"L", b"R"
+
+    program = CompiledInstruction()
+    for match in pattern.finditer(instruction):
+        rotations = match.group(1)
+        turn = rotations.count(right) - rotations.count(left) if rotations else 0
+        program.append(turn, match.end(2) - match.start(2))
+
+    return program
+
+
+def compile_encoded_instruction(instruction: Instruction) -> CompiledInstruction:
+    "compiles a run-length encoded instruction, such as `M1000R3M500`, into segments of (rotation, moves)."
+
+    program = CompiledInstruction()
+    for command, count in iter_runs(instruction):
+        if command == "M":
+            program.append(0, count)
+        else:
+            program.append(count if command == "R" else -count, 0)
+
+    return program
+
+
+class ExecutionCounters:
+    """ Counts what a rover did while executing instructions.
+
+        Main Attributes:
+            moves: moves made.
+            blocked_moves: moves dropped because they would have left the land.
+            rotations: rotations made.
+    """
+
+    __slots__ = ("moves", "blocked_moves", "rotations")
+
+    def __init__(self) -> None:
+        self.moves = 0
+        self.blocked_moves = 0
+        self.rotations = 0
+
+    @property
+    def instructions(self) -> int:
+        return self.moves + self.blocked_moves + self.rotations
+
+
+def count_rotations(instruction: Instruction) -> int:
+    "returns the number of rotations, `L` and `R` commands, in an instruction."
+
+    if is_encoded(instruction):
+        return sum(count for command, count in iter_runs(instruction) if command != "M")
+
+    if isinstance(instruction, str):
+        return instruction.count("L") + instruction.count("R")
+
+    # bytes-like instructions are counted a chunk at a time, so that a mapped file is never copied whole.
+    view = memoryview(instruction)
+    rotations = 0
+    for start in range(0, len(view), _COUNT_CHUNK_SIZE):
+        chunk = bytes(view[start:start + _COUNT_CHUNK_SIZE])
+        rotations += chunk.count(b"L") + chunk.count(b"R")
+
+    return rotations
+
+
+def execute(
+    program: CompiledInstruction,
+    land: Land,
+    x: int,
+    y: int,
+    heading: int,
+    counters: Optional[ExecutionCounters] = None
+) -> Tuple[int, int, int]:
+    """ Runs a compiled instruction from a starting position and returns the final (x, y, heading).
+
+        Each run of moves is clamped against the land in one step through `Land.traverse`,
+        which drops moves off the land exactly as stepping one unit at a time would.
+        Moves and dropped moves are added to `counters` when it is given.
+    """
+
+    if counters is not None:
+        return _execute_counted(program, land, x, y, heading, counters)
+
+    for turn, steps in program:
+        heading = (heading + turn) % 4
+        if steps:
+            dx, dy = UNIT_VECTORS[heading]
+            x, y = land.traverse(x, y, dx, dy, steps)
+
+    return x, y, heading
+
+
+def _execute_counted(
+    program: CompiledInstruction,
+    land: Land,
+    x: int,
+    y: int,
+    heading: int,
+    counters: ExecutionCounters
+) -> Tuple[int, int, int]:
+    "same as `execute`, adding moves and dropped moves to counters."
+
+    for turn, steps in program:
+        heading = (heading + turn) % 4
+        if steps:
+            dx, dy = UNIT_VECTORS[heading]
+            next_x, next_y = land.traverse(x, y, dx, dy, steps)
+            moved = abs(next_x - x) + abs(next_y - y)
+            counters.moves += moved
+            counters.blocked_moves += steps - moved
+            x, y = next_x, next_y
+
+    return x, y, heading
@@ -1,8 +1,9 @@
+from typing import Optional
 from dataclasses import dataclass, field
-from copy import deepcopy
 from .mechanics import Position
 from .land import Land
-from utils import exit_program
+from .program import ExecutionCounters, compile_instruction, count_rotations, execute
+from utils import RoverError
 
 
 @dataclass
@@ -42,19 +43,18 @@ class Rover:
     def move(self):
         "moves rover by one unit based on its position."
 
-        hypothetic_position = self.position.clone()
-        hypothetic_position.move()
-        if self.land.is_address_within(hypothetic_position.point):
-            self.position = hypothetic_position
+        x, y = self.position.next_coordinates()
+        if self.land.is_coordinate_within(x, y):
+            self.position.move()
  
     def spin(self, angle: int):
         self.position.rotate(angle)
     
     def spin_left(self):
-        self.spin(-90)
+        self.position.turn_left()
     
     def spin_right(self):
-        self.spin(90)
+        self.position.turn_right()
     
     def set_instruction(self, instruction: str):
         self._instruction = instruction
@@ -64,13 +64,13 @@ class Rover:
     
     def validate_position_is_on_land(self):
         if not self.land.is_address_within(self.position.point):
-            exit_program(f"Rover '{self.name}' is outside specified land")
+            raise RoverError(f"Rover '{self.name}' is outside specified land", self.name)
     
     @property
     def instruction(self):
         return self._instruction
     
-    def run_instruction(self):
+    def run_instruction(self, counters: Optional[ExecutionCounters] = None):
         """ Executes instruction given to rover.
 
             Instruction executed is a string stream of characters.
@@ -79,20 +79,31 @@ class Rover:
                 L: Makes rover spin leftward.
                 R: Makes rover spin rightward.
                 M: Makes rover move one unit along the direction it is facing.
+
+            The instruction is compiled into runs of rotations and moves before it is executed,
+            giving the same final position as performing each instruction character one by one.
+
+            @param
+                counters: optional counters that moves, dropped moves and rotations are added to.
         """
 
         if not self.instruction:
             return
-        
-        for instruction in self.instruction:
-            if instruction == "L":
-                self.spin_left()
-            elif instruction == "R":
-                self.spin_right()
-            elif instruction == "M":
-                self.move()
-        
+
+        program = compile_instruction(self.instruction)
+        if counters is not None:
+            counters.rotations += count_rotations(self.instruction)
+
+        point = self.position.point
+        point.x, point.y, self.position.heading = execute(
+            program, self.land, point.x, point.y, self.position.heading, counters
+        )
+
         self.reset_instruction()
     
     def clone(self):
-        return deepcopy(self)
+        "returns a rover with a copy of this rover's position and instruction, on the same land."
+
+        rover = Rover(name=self.name, position=self.position.clone(), land=self.land)
+        rover.set_instruction(self._instruction)
+        return rover
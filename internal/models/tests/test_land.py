@@ -1,6 +1,10 @@
 from unittest import TestCase
+from array import array
+from fractions import Fraction
+from internal.models.bitmap_land import ObstacleLand, PolygonLand
 from internal.models.land import RectangularLand, Land, LandFactory, LandShape
 from internal.models.point import Point
+from utils import LandError
 
 
 class TestRectangularLand(TestCase):
@@ -104,7 +108,105 @@ class TestRectangularLand(TestCase):
         self.assertFalse(self.land.is_address_within(point))
 
 
+class TestContainsMany(TestCase):
+    def setUp(self):
+        self.xs = array("q", [-1, 0, 2, 3, 4, 1])
+        self.ys = array("q", [0, 0, 3, 1, 2, -1])
+
+    def test_rectangular_land_checks_arrays_at_once(self):
+        land = RectangularLand(upper_right_edge=Point(3, 3))
+        self.assertEqual(land.contains_many(self.xs, self.ys).tolist(), [False, True, True, True, False, False])
+
+    def test_any_land_checks_arrays_point_by_point(self):
+        class DiagonalLand(Land):
+            def is_address_within(self, address: Point) -> bool:
+                return address.x == address.y
+
+        self.assertEqual(DiagonalLand().contains_many(self.xs, self.ys).tolist(), [False, True, False, False, False, False])
+        with self.assertRaises(LandError):
+            DiagonalLand().bounds
+
+
 class TestLandFactory(TestCase):
     def test_land_factory_creates_rectangular_land(self):
         land = LandFactory.create(land_shape=LandShape.RECTANGULAR, upper_right_edge=Point(3,3))
         self.assertIsInstance(land, RectangularLand)
+
+    def test_land_factory_creates_polygon_land(self):
+        land = LandFactory.create(land_shape=LandShape.POLYGON, vertices=[Point(0, 0), Point(3, 0), Point(0, 3)])
+        self.assertIsInstance(land, PolygonLand)
+
+    def test_land_factory_creates_obstacle_land(self):
+        land = LandFactory.create(land_shape=LandShape.OBSTACLES, upper_right_edge=Point(3, 3))
+        self.assertIsInstance(land, ObstacleLand)
+
+
+def is_in_polygon(vertices, x, y):
+    "checks a point against a polygon the slow way: on an edge, or an odd number of crossings to its right."
+
+    edges = list(zip(vertices, vertices[1:] + vertices[:1]))
+    for start, end in edges:
+        cross = (end.x - start.x) * (y - start.y) - (end.y - start.y) * (x - start.x)
+        if cross == 0 and min(start.x, end.x) <= x <= max(start.x, end.x) and min(start.y, end.y) <= y <= max(start.y, end.y):
+            return True
+
+    crossings = 0
+    for start, end in edges:
+        if (start.y > y) != (end.y > y):
+            crossing_x = start.x + Fraction((y - start.y) * (end.x - start.x), end.y - start.y)
+            if crossing_x > x:
+                crossings += 1
+    return crossings % 2 == 1
+
+
+class TestPolygonLand(TestCase):
+    def setUp(self):
+        # an irregular, non-convex plateau with slanted and horizontal edges.
+        self.vertices = [Point(0, 0), Point(9, 2), Point(6, 5), Point(11, 11), Point(3, 8), Point(3, 4), Point(-2, 4)]
+        self.land = PolygonLand(vertices=self.vertices)
+
+    def test_cells_match_point_in_polygon(self):
+        for x in range(-4, 14):
+            for y in range(-2, 14):
+                self.assertEqual(self.land.is_coordinate_within(x, y), is_in_polygon(self.vertices, x, y), (x, y))
+
+    def test_contains_many_matches_single_checks(self):
+        points = [(x, y) for x in range(-4, 14) for y in range(-2, 14)]
+        mask = self.land.contains_many([x for x, _ in points], [y for _, y in points])
+        self.assertEqual(mask.tolist(), [self.land.is_coordinate_within(x, y) for x, y in points])
+
+    def test_bounds_hold_every_vertex(self):
+        self.assertEqual(self.land.bounds, (Point(-2, 0), Point(11, 11)))
+
+    def test_polygon_needs_three_vertices(self):
+        with self.assertRaises(LandError):
+            PolygonLand(vertices=[Point(0, 0), Point(3, 3)])
+
+
+class TestObstacleLand(TestCase):
+    def setUp(self):
+        self.land = ObstacleLand(
+            upper_right_edge=Point(5, 5),
+            obstacles=[(Point(1, 1), Point(2, 3)), (Point(5, 5), Point(7, 7))]
+        )
+
+    def test_obstacles_are_not_on_land(self):
+        for x in range(-1, 7):
+            for y in range(-1, 7):
+                on_land = 0 <= x <= 5 and 0 <= y <= 5
+                in_obstacle = (1 <= x <= 2 and 1 <= y <= 3) or (x == 5 and y == 5)
+                self.assertEqual(self.land.is_address_within(Point(x, y)), on_land and not in_obstacle, (x, y))
+
+    def test_swapped_corners_raise_error(self):
+        with self.assertRaises(LandError):
+            ObstacleLand(upper_right_edge=Point(5, 5), obstacles=[(Point(3, 3), Point(1, 1))])
+        with self.assertRaises(LandError):
+            ObstacleLand(upper_right_edge=Point(5, 5), obstacles=[(Point(1, 3), Point(3, 1))])
+        with self.assertRaises(LandError):
+            ObstacleLand(upper_right_edge=Point(5, 5), lower_left_edge=Point(7, 0))
+
+    def test_moves_stop_in_front_of_obstacles(self):
+        self.assertEqual(self.land.traverse(0, 2, 1, 0, 10), (0, 2))
+        self.assertEqual(self.land.traverse(3, 2, -1, 0, 10), (3, 2))
+        self.assertEqual(self.land.traverse(1, 0, 0, 1, 10), (1, 0))
+        self.assertEqual(self.land.traverse(5, 0, 0, 1, 10), (5, 4))
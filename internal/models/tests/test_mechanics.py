@@ -0,0 +1,56 @@
+from unittest import TestCase
+from internal.models.mechanics import Direction, Orientation, Position
+from internal.models.point import Point
+from utils import RotationError
+
+
+class PositionTestCase(TestCase):
+    def test_models_have_no_instance_dict(self):
+        for model in (Point(1, 2), Direction(Orientation.N), Position(1, 2, Orientation.N)):
+            self.assertFalse(hasattr(model, "__dict__"))
+
+    def test_turns_walk_around_compass(self):
+        position = Position(0, 0, Orientation.N)
+        labels = []
+        for _ in range(4):
+            position.turn_right()
+            labels.append(position.direction.label)
+        self.assertEqual(labels, ["E", "S", "W", "N"])
+
+        position.turn_left()
+        self.assertEqual(position.direction.orientation, Orientation.W)
+
+    def test_rotate_by_angle(self):
+        position = Position(0, 0, Orientation.E)
+        position.rotate(-270)
+        self.assertEqual(position.direction, Direction(Orientation.S))
+
+    def test_changing_direction_turns_position(self):
+        position = Position(0, 0, Orientation.N)
+        position.direction.rotate(90)
+        self.assertEqual(str(position), "0 0 E")
+
+        position.direction.orientation = Orientation.W
+        self.assertEqual(position.heading, 3)
+
+        direction = position.direction
+        position.turn_left()
+        self.assertEqual(direction.label, "S")
+
+    def test_rotate_must_be_to_cardinal_compass_point(self):
+        with self.assertRaises(RotationError):
+            Position(0, 0, Orientation.E).rotate(45)
+
+    def test_move_is_in_place(self):
+        position = Position(2, 2, Orientation.W)
+        point = position.point
+        position.move()
+        self.assertIs(position.point, point)
+        self.assertEqual(point, Point(1, 2))
+
+    def test_str_and_equality(self):
+        position = Position(3, 4, Orientation.S)
+        self.assertEqual(str(position), "3 4 S")
+        self.assertEqual(position, Position(3, 4, Orientation.S))
+        self.assertNotEqual(position, Position(3, 4, Orientation.N))
+        self.assertEqual(position.clone(), position)
@@ -0,0 +1,153 @@
+import random
+from unittest import TestCase
+from internal.models.program import (
+    MAX_ENCODED_STEPS,
+    MAX_RUN_COUNT,
+    ExecutionCounters,
+    check_run_counts,
+    compile_instruction,
+    count_rotations,
+    encode_instruction,
+    encode_runs,
+    execute,
+    expand_instruction,
+    instruction_length,
+    is_encoded,
+    is_valid_encoding,
+    iter_blocks
+)
+from internal.models.land import RectangularLand
+from internal.models.mechanics import HEADINGS, Position, Orientation
+from internal.models.point import Point
+from internal.models.rover import Rover
+from utils import EngineError
+
+
+class CompileInstructionTestCase(TestCase):
+    def test_rotation_runs_collapse_modulo_four(self):
+        program = compile_instruction("RRRRLLLM")
+        self.assertEqual(list(program), [(1, 1)])
+
+    def test_move_runs_become_one_segment(self):
+        program = compile_instruction("MMMLMM")
+        self.assertEqual(list(program), [(0, 3), (3, 2)])
+
+    def test_unknown_characters_are_ignored(self):
+        self.assertEqual(list(compile_instruction("MxM")), list(compile_instruction("MM")))
+
+    def test_trailing_rotation_is_kept(self):
+        self.assertEqual(list(compile_instruction("MR")), [(0, 1), (1, 0)])
+
+    def test_bytes_instruction_compiles_like_string(self):
+        instruction = "LMMRMMMRRLM"
+        expected = list(compile_instruction(instruction))
+        self.assertEqual(list(compile_instruction(instruction.encode())), expected)
+        self.assertEqual(list(compile_instruction(memoryview(instruction.encode()))), expected)
+
+
+class EncodedInstructionTestCase(TestCase):
+    def test_runs_compile_without_expansion(self):
+        self.assertEqual(list(compile_instruction("M1000000R3M500")), [(0, 1000000), (3, 500)])
+
+    def test_encoded_and_plain_instructions_compile_alike(self):
+        encoded = "L2M3RM2L5M"
+        self.assertEqual(expand_instruction(encoded), "LLMMMRMMLLLLLM")
+        self.assertEqual(list(compile_instruction(encoded)), list(compile_instruction(expand_instruction(encoded))))
+        self.assertEqual(list(compile_instruction(encoded.encode())), list(compile_instruction(encoded)))
+
+    def test_encoding_round_trips(self):
+        self.assertEqual(encode_instruction("LLMMMRMMLLLLLM"), "L2M3RM2L5M")
+        self.assertEqual(expand_instruction(encode_instruction("MRRLMMM")), "MRRLMMM")
+        self.assertEqual(encode_instruction(""), "")
+
+    def test_runs_without_steps_are_not_encoded(self):
+        self.assertEqual(encode_runs([("M", 0)]), "")
+        self.assertEqual(encode_runs([("L", 1), ("M", 0), ("L", 2), ("M", 3)]), "L3M3")
+        self.assertEqual(encode_instruction("M0R"), "R")
+
+    def test_plain_instruction_is_not_expanded(self):
+        self.assertEqual(expand_instruction("LMR"), "LMR")
+
+    def test_long_encoded_instruction_is_not_expanded(self):
+        self.assertEqual(instruction_length("M10000000000R"), 10000000001)
+        with self.assertRaises(EngineError):
+            expand_instruction("M10000000000R")
+
+    def test_blocks_of_encoded_instruction_are_expanded_one_at_a_time(self):
+        self.assertEqual(list(iter_blocks("M5R2L", 3)), ["MMM", "MMR", "RL"])
+        self.assertEqual(list(iter_blocks("LMRML", 2)), ["LM", "RM", "L"])
+        blocks = iter_blocks("M10000000000R", 4)
+        self.assertEqual([next(blocks), next(blocks)], ["MMMM", "MMMM"])
+
+    def test_count_rotations_of_encoded_instruction(self):
+        self.assertEqual(count_rotations("L2M30R"), 3)
+
+    def test_encoding_must_be_commands_with_counts(self):
+        self.assertTrue(is_valid_encoding("M10R2L"))
+        self.assertFalse(is_valid_encoding("10M"))
+        self.assertFalse(is_valid_encoding("M1X2"))
+
+    def test_only_valid_encodings_with_counts_are_encoded(self):
+        self.assertTrue(is_encoded("M10R2L"))
+        self.assertTrue(is_encoded(memoryview(b"M10R2L")))
+        self.assertFalse(is_encoded("MRL"))
+        self.assertFalse(is_encoded(b"MRL"))
+        self.assertFalse(is_encoded("M1X2"))
+        self.assertEqual(list(compile_instruction("M1X2")), list(compile_instruction("M")))
+
+    def test_run_counts_are_checked_against_maximums(self):
+        check_run_counts("M" + str(MAX_RUN_COUNT) + "R3")
+        with self.assertRaises(ValueError):
+            check_run_counts("M" + str(MAX_RUN_COUNT + 1))
+        with self.assertRaises(ValueError):
+            check_run_counts(b"M" + b"9" * 5000)
+        with self.assertRaises(ValueError):
+            check_run_counts(("M" + str(MAX_RUN_COUNT)) * (MAX_ENCODED_STEPS // MAX_RUN_COUNT + 1))
+
+
+class ExecuteTestCase(TestCase):
+    def setUp(self):
+        self.land = RectangularLand(upper_right_edge=Point(5, 5))
+
+    def run_stepwise(self, position: Position, instruction: str) -> Position:
+        rover = Rover(name="Step Rover", position=position.clone(), land=self.land)
+        for character in instruction:
+            if character == "L":
+                rover.spin_left()
+            elif character == "R":
+                rover.spin_right()
+            elif character == "M":
+                rover.move()
+        return rover.position
+
+    def run_compiled(self, position: Position, instruction: str) -> Position:
+        x, y, heading = execute(
+            compile_instruction(instruction),
+            self.land,
+            position.point.x,
+            position.point.y,
+            position.heading
+        )
+        return Position(x, y, HEADINGS[heading])
+
+    def test_moves_off_the_edge_are_dropped(self):
+        position = Position(4, 4, Orientation.N)
+        self.assertEqual(self.run_compiled(position, "MMMRMMM"), Position(5, 5, Orientation.E))
+
+    def test_matches_stepwise_execution(self):
+        generator = random.Random(7)
+        for _ in range(200):
+            position = Position(generator.randint(0, 5), generator.randint(0, 5), generator.choice(list(Orientation)))
+            instruction = "".join(generator.choice("LRMMM") for _ in range(generator.randint(0, 60)))
+            self.assertEqual(self.run_compiled(position, instruction), self.run_stepwise(position, instruction))
+
+    def test_counters_record_moves_blocked_moves_and_rotations(self):
+        rover = Rover(name="Counted Rover", position=Position(4, 4, Orientation.N), land=self.land)
+        rover.set_instruction("MMMRMMMLL")
+        counters = ExecutionCounters()
+        rover.run_instruction(counters)
+        self.assertEqual((counters.moves, counters.blocked_moves, counters.rotations), (2, 4, 3))
+        self.assertEqual(counters.instructions, 9)
+
+    def test_count_rotations_of_bytes_instruction(self):
+        self.assertEqual(count_rotations(memoryview(b"LMRRxL")), 4)
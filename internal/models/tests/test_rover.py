@@ -4,6 +4,7 @@ from internal.models.rover import Rover
 from internal.models.land import RectangularLand
 from internal.models.mechanics import Position, Orientation
 from internal.models.point import Point
+from utils import RotationError, RoverError
 
 
 class RoverTestCase(TestCase):
@@ -91,7 +92,7 @@ class RoverTestCase(TestCase):
         self.assertEqual(self.rover.position.direction.orientation, Orientation.N)
 
     def test_rover_can_only_spin_to_a_cardinal_compass_point(self):
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(RotationError):
             self.rover.spin(70)
 
     def test_rover_run_instruction(self):
@@ -115,5 +116,14 @@ class RoverTestCase(TestCase):
 
     def test_rover_cannot_land_outside_specified_land(self):
         land = RectangularLand(upper_right_edge=Point(3, 4))
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(RoverError):
             Rover(name="Test Rover", position=Position(6, 7, Orientation.N), land=land)
+
+    def test_rover_clone_shares_land_but_not_position(self):
+        self.rover.set_instruction("MM")
+        rover_clone = self.rover.clone()
+        self.assertIs(rover_clone.land, self.rover.land)
+        self.assertEqual(rover_clone.instruction, "MM")
+
+        rover_clone.move()
+        self.assertNotEqual(self.rover.position, rover_clone.position)
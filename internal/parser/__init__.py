@@ -1 +1,24 @@
-from .input_parser import InputParser
\ No newline at end of file
+# parsers are imported when first used, so the CLI only loads the one it runs.
+from importlib import import_module
+
+_EXPORTS = {
+    "InputParser": "input_parser",
+    "StreamInputParser": "stream_parser",
+    "MappedInputParser": "mapped_parser",
+    "ParallelInputParser": "parallel_parser",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
\ No newline at end of file
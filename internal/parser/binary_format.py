@@ -0,0 +1,204 @@
+""" Binary mission files.
+
+    A binary mission file holds the same mission as a text input file in a form that loads straight
+    into arrays. All numbers are little-endian.
+
+        header          32 bytes    magic b"MRVB", version (u16), flags (u16, unused), plateau upper right
+                                    x and y (i64 each), number of rovers (u32), size of the names block (u32).
+        rover table     48 bytes    per rover: landing x and y (i64 each), heading (u8, quarter turns to the
+                                    right of north), 3 reserved bytes, name length (u32), name offset (u64),
+                                    instruction offset (u64) and instruction length (u64, in instructions).
+        names block                 rover names in UTF-8, back to back. offsets are relative to the block.
+        instructions block          packed 2-bit instruction streams, four instructions per byte starting at
+                                    the most significant bits. L = 0, R = 1, M = 2. every stream starts on a
+                                    new byte; offsets are in bytes, relative to the block.
+
+    Characters other than L, R and M are dropped when a text mission is converted, since they do not change
+    where a rover ends up. The format has no run-length encoding, so run-length encoded instructions cannot
+    be converted.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+import numpy as np
+from internal.engine.batch import Fleet
+from internal.models import Point, Rover
+from internal.models.land import RectangularLand
+from internal.models.mechanics import HEADINGS, Position
+from internal.models.program import is_encoded
+from utils import BINARY_MISSION_MAGIC, InputError, RoverError, map_input_file
+from .input_parser import InputParser
+
+
+MAGIC = BINARY_MISSION_MAGIC
+VERSION = 1
+HEADER = struct.Struct("<4sHHqqII")
+ROVER_DTYPE = np.dtype([
+    ("x", "<i8"),
+    ("y", "<i8"),
+    ("heading", "u1"),
+    ("reserved", "u1", (3,)),
+    ("name_length", "<u4"),
+    ("name_offset", "<u8"),
+    ("instruction_offset", "<u8"),
+    ("instruction_length", "<u8"),
+])
+
+_NOT_PACKED = 255
+_PACK_CODES = np.full(256, _NOT_PACKED, dtype=np.uint8)
+_PACK_CODES[ord("L")] = 0
+_PACK_CODES[ord("R")] = 1
+_PACK_CODES[ord("M")] = 2
+_LETTERS = np.frombuffer(b"LRM?", dtype=np.uint8)
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+def pack_instruction(instruction: Union[str, bytes, memoryview]) -> Tuple[bytes, int]:
+    """ Returns an instruction as a packed 2-bit stream and its number of instructions, dropping characters other than L, R and M.
+
+        Raises InputError for run-length encoded instructions, which binary missions cannot hold.
+    """
+
+    if is_encoded(instruction):
+        raise InputError("binary missions have no run-length encoding, so encoded instructions cannot be converted")
+    if isinstance(instruction, str):
+        instruction = instruction.encode("utf-8")
+
+    codes = _PACK_CODES[np.frombuffer(instruction, dtype=np.uint8)]
+    codes = codes[codes != _NOT_PACKED]
+    padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    return np.bitwise_or.reduce(padded.reshape(-1, 4) << _SHIFTS, axis=1).astype(np.uint8).tobytes(), len(codes)
+
+
+def write_binary_mission(rovers: Sequence[Rover], plateau: RectangularLand, file_path: str):
+    "writes rovers on a plateau to a binary mission file."
+
+    table = np.zeros(len(rovers), dtype=ROVER_DTYPE)
+    names: List[bytes] = []
+    streams: List[bytes] = []
+    name_offset = instruction_offset = 0
+
+    for index, rover in enumerate(rovers):
+        name = rover.name.encode("utf-8")
+        stream, instruction_length = pack_instruction(rover.instruction)
+        table[index] = (
+            rover.position.point.x, rover.position.point.y, rover.position.heading, (0, 0, 0),
+            len(name), name_offset, instruction_offset, instruction_length
+        )
+        names.append(name)
+        streams.append(stream)
+        name_offset += len(name)
+        instruction_offset += len(stream)
+
+    with open(file_path, "wb") as file:
+        upper_right_edge = plateau.upper_right_edge
+        file.write(HEADER.pack(MAGIC, VERSION, 0, upper_right_edge.x, upper_right_edge.y, len(rovers), name_offset))
+        file.write(table.tobytes())
+        file.writelines(names)
+        file.writelines(streams)
+
+
+def convert_to_binary(inputs: List[str], file_path: str):
+    "parses text inputs, as given to `InputParser`, and writes them to a binary mission file."
+
+    rovers = InputParser(inputs=inputs).rovers
+    plateau = rovers[0].land if rovers else InputParser._parse_plateau(inputs[0])
+    write_binary_mission(rovers, plateau, file_path)
+
+
+@dataclass
+class BinaryMission:
+    """ Mission loaded from a binary mission file, kept as arrays over the file's content.
+
+        Main Attributes:
+            plateau: land the rovers are on.
+            names: names of rovers, in file order.
+            table: rover table as a NumPy structured array.
+            instructions: packed instruction streams as a NumPy byte array.
+
+        Main Methods:
+            load: loads a binary mission file.
+            instruction: returns a rover's instruction as an `L/R/M` byte string.
+            rovers: returns rover instances with their instructions set.
+            fleet: returns the rovers' landing positions as a `Fleet` for the NumPy engine.
+    """
+
+    plateau: RectangularLand
+    names: List[str]
+    table: np.ndarray
+    instructions: np.ndarray
+
+    @classmethod
+    def load(cls, file_path: str) -> "BinaryMission":
+        buffer = map_input_file(file_path)
+        if len(buffer) < HEADER.size:
+            raise InputError(f"binary mission file is too short. got {len(buffer)} bytes")
+
+        magic, version, _, plateau_x, plateau_y, rovers_count, names_size = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise InputError(f"unsupported binary mission file. got magic {magic!r} and version {version}")
+
+        table_end = HEADER.size + rovers_count * ROVER_DTYPE.itemsize
+        names_end = table_end + names_size
+        if len(buffer) < names_end:
+            raise InputError("binary mission file is truncated")
+
+        table = np.frombuffer(buffer, dtype=ROVER_DTYPE, count=rovers_count, offset=HEADER.size)
+        names_block = bytes(buffer[table_end:names_end])
+        names = [
+            names_block[offset:offset + length].decode("utf-8")
+            for offset, length in zip(table["name_offset"].tolist(), table["name_length"].tolist())
+        ]
+        instructions = np.frombuffer(buffer, dtype=np.uint8, offset=names_end)
+
+        plateau = RectangularLand(upper_right_edge=Point(x=plateau_x, y=plateau_y))
+        mission = cls(plateau=plateau, names=names, table=table, instructions=instructions)
+        mission._validate()
+        return mission
+
+    def _validate(self):
+        table = self.table
+        if len(table) and (table["heading"] > 3).any():
+            name = self.names[int(np.argmax(table["heading"] > 3))]
+            raise RoverError(f"Rover '{name}' has an invalid heading", name)
+
+        stream_ends = table["instruction_offset"] + (table["instruction_length"] + 3) // 4
+        if len(table) and (stream_ends > len(self.instructions)).any():
+            raise InputError("binary mission file is truncated")
+
+        lower, upper = self.plateau.lower_left_edge, self.plateau.upper_right_edge
+        outside = (table["x"] < lower.x) | (table["x"] > upper.x) | (table["y"] < lower.y) | (table["y"] > upper.y)
+        if outside.any():
+            name = self.names[int(np.argmax(outside))]
+            raise RoverError(f"Rover '{name}' is outside specified land", name)
+
+    def instruction(self, index: int) -> bytes:
+        row = self.table[index]
+        offset, length = int(row["instruction_offset"]), int(row["instruction_length"])
+        packed = self.instructions[offset:offset + (length + 3) // 4]
+        codes = ((packed[:, None] >> _SHIFTS) & 3).ravel()[:length]
+        return _LETTERS[codes].tobytes()
+
+    def rovers(self) -> List[Rover]:
+        rovers = []
+        for index, (name, x, y, heading) in enumerate(zip(
+            self.names, self.table["x"].tolist(), self.table["y"].tolist(), self.table["heading"].tolist()
+        )):
+            rover = Rover(name=name, position=Position(x, y, HEADINGS[heading]), land=self.plateau)
+            rover.set_instruction(self.instruction(index))
+            rovers.append(rover)
+        return rovers
+
+    def fleet(self) -> Fleet:
+        return Fleet(
+            names=list(self.names),
+            x=self.table["x"].astype(np.int64),
+            y=self.table["y"].astype(np.int64),
+            heading=self.table["heading"].astype(np.int8)
+        )
+
+    def unpacked_instructions(self) -> List[bytes]:
+        "returns the instruction of every rover, in file order."
+        return [self.instruction(index) for index in range(len(self.names))]
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from internal.models import (
     Land,
@@ -9,7 +9,12 @@ from internal.models import (
     Orientation,
     Rover
 )
-from utils import exit_program
+from internal.models.program import check_run_counts, has_digit, is_valid_encoding
+from utils import InputError, PlateauError, RoverError
+from utils.profiling import profile_stage
+
+
+ROVER_INPUT_TYPES = ("landing", "instructions")
 
 
 @dataclass
@@ -18,31 +23,58 @@ class InputParser:
 
         Main Attributes:
             inputs: list representing inputs from users (plateau input and per-rover landing/instructions inputs).
+            partial: when True, invalid rovers are left out and their errors recorded in `errors`
+                instead of raised, so the rest of the rovers can still run.
 
         Main Methods:
             get_rovers: returns list of rovers on plateau
     """
     inputs: List[str]
+    partial: bool = False
 
     def __post_init__(self):
         if not self.inputs:
-            exit_program("no input was given")
+            raise InputError("no input was given")
 
+        self.errors: List[RoverError] = []
         self.rovers = self._get_rovers()
     
     def _get_rovers(self) -> List[Rover]:
-        rover_inputs = self.inputs[1:]
-        rover_details = self._get_rover_details(rover_inputs)
+        rover_details = self._read_rover_details()
         rovers = []
-        plateau = self._get_plateau()
+        with profile_stage("plateau"):
+            plateau = self._get_plateau()
 
         for name, details in rover_details.items():
-            rover = Rover(name=name, position=details["landing_position"], land=plateau)
+            if "error" in details:
+                continue
+
+            try:
+                if len(details) != 2:
+                    raise RoverError(
+                        f"landing and instructions inputs must both be given. got only one for rover {name}", name
+                    )
+                rover = Rover(name=name, position=details["landing_position"], land=plateau)
+            except RoverError as error:
+                self._record_error(error)
+                continue
+
             rover.set_instruction(details["instructions"])
             rovers.append(rover)
 
         return rovers
 
+    def _read_rover_details(self) -> Dict:
+        "returns the details of every rover, keyed by rover name in the order rovers first appear."
+        return self._get_rover_details(self.inputs[1:])
+
+    def _record_error(self, error: RoverError):
+        "raises the error of an invalid rover, or records it in partial mode."
+
+        if not self.partial:
+            raise error
+        self.errors.append(error)
+
     @staticmethod
     def _parse_to_position(position_str: str) -> Position:
         """ Returns position instance as represented by a string.
@@ -57,7 +89,7 @@ class InputParser:
             assert x.isdigit() and y.isdigit()
             assert isinstance(orientation, Orientation)
         except (ValueError, AttributeError, AssertionError):
-            exit_program(f"invalid position definition: {position_str}")
+            raise RoverError(f"invalid position definition: {position_str}") from None
 
         return Position(int(x), int(y), orientation)
 
@@ -66,45 +98,94 @@ class InputParser:
 
         try:
             plateau_definition = self.inputs[0]
-            plateau_definition_list = plateau_definition.lower().split("plateau:")
         except IndexError:
-            exit_program("no input was given")
+            raise InputError("no input was given") from None
+
+        return self._parse_plateau(plateau_definition)
+
+    @staticmethod
+    def _parse_plateau(plateau_definition: str) -> Land:
+        """ Returns plateau as represented by a string.
+
+            @param
+                plateau_definition: string representation of a plateau. For example: 'Plateau:5 5'
+        """
+
+        plateau_definition_list = plateau_definition.lower().split("plateau:")
 
         if len(plateau_definition_list) != 2 or plateau_definition_list[0] != "":
-            exit_program(f"plateau end point not correctly given. got {plateau_definition}")
+            raise PlateauError(f"plateau end point not correctly given. got {plateau_definition}")
         
         upper_right_edge_list_str = plateau_definition_list[1].split()
         if len(upper_right_edge_list_str) != 2:
-            exit_program(f"coordinates definition must be exactly 2. got {upper_right_edge_list_str} for plateau")
+            raise PlateauError(f"coordinates definition must be exactly 2. got {upper_right_edge_list_str} for plateau")
         
         x_coordinate_str = upper_right_edge_list_str[0]
         y_coordinate_str = upper_right_edge_list_str[1]
 
         if not (x_coordinate_str.isdigit() and y_coordinate_str.isdigit()):
-            exit_program(f"coordinate values must be integers. got {x_coordinate_str} and {y_coordinate_str}")
+            raise PlateauError(f"coordinate values must be integers. got {x_coordinate_str} and {y_coordinate_str}")
 
         upper_right_edge = Point(x=int(x_coordinate_str), y=int(y_coordinate_str))
         return LandFactory.create(land_shape=LandShape.RECTANGULAR, upper_right_edge=upper_right_edge)
+
+    @staticmethod
+    def _parse_instructions(instructions_str: str) -> str:
+        """ Returns instructions as given in a rover input, checking the format and counts of run-length encoded ones.
+
+            @param
+                instructions_str: plain instructions such as 'LMLMM', or run-length encoded ones such as 'LM2R3M500'.
+        """
+
+        instructions = instructions_str.strip()
+        if has_digit(instructions):
+            if not is_valid_encoding(instructions):
+                raise RoverError(f"invalid run-length encoded instructions. got {instructions}")
+            try:
+                check_run_counts(instructions)
+            except ValueError as error:
+                raise RoverError(f"{error}. got {instructions}") from None
+
+        return instructions
+
+    @staticmethod
+    def _parse_rover_input(rover_input: str) -> Tuple[str, str, str]:
+        """ Returns the rover name, input type ('landing' or 'instructions') and value of a rover input.
+
+            @param
+                rover_input: string representation of a rover input. For example: 'Rover1 Landing:1 2 N'
+        """
+
+        try:
+            key, value = rover_input.split(":")
+            name, input_type = key.split()
+            input_type = input_type.lower()
+            assert input_type in ROVER_INPUT_TYPES
+
+        except (ValueError, AssertionError):
+            raise RoverError(f"invalid rover input. got {rover_input}") from None
+
+        return name, input_type, value
     
     def _get_rover_details(self, inputs: List[str]) -> Dict:
-        input_types = ("landing", "instructions")
         rover_details = {}
 
         for rover_input in inputs:
             try:
-                key, value = rover_input.split(":")
-                name, input_type = key.split()
-                input_type = input_type.lower()
-                assert input_type in input_types
-    
-            except (ValueError, AssertionError):
-                exit_program(f"invalid rover input. got {rover_input}")
-            
-            rover_details.setdefault(name, {})
-
-            if input_type == "landing":
-                rover_details[name]["landing_position"] = self._parse_to_position(value)
-            elif input_type == "instructions":
-                rover_details[name]["instructions"] = value.strip()
+                name, input_type, value = self._parse_rover_input(rover_input)
+            except RoverError as error:
+                self._record_error(error)
+                continue
+
+            details = rover_details.setdefault(name, {})
+            try:
+                if input_type == "landing":
+                    details["landing_position"] = self._parse_to_position(value)
+                elif input_type == "instructions":
+                    details["instructions"] = self._parse_instructions(value)
+            except RoverError as error:
+                error.rover_name = name
+                details["error"] = error
+                self._record_error(error)
         
         return rover_details
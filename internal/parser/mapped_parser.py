@@ -0,0 +1,85 @@
+import re
+from mmap import mmap
+from typing import Any, Iterator, Tuple, Union
+from dataclasses import dataclass
+from internal.models.program import check_run_counts, has_digit, is_valid_encoding
+from utils import RoverError
+from .input_parser import ROVER_INPUT_TYPES
+from .stream_parser import StreamInputParser
+
+
+Buffer = Union[mmap, bytes, bytearray, memoryview]
+LineRange = Tuple[int, int]
+
+_NON_SPACE = re.compile(rb"\S")
+_SPACES = frozenset(b" \t\n\r\x0b\x0c")
+
+
+@dataclass
+class MappedInputParser(StreamInputParser):
+    """ Parses inputs held in a buffer, usually a memory-mapped input file, without copying instructions.
+
+        Inputs are read as byte ranges of the buffer. Only the short parts of an input (rover names,
+        landing positions and the plateau) are decoded; instructions are handed to rovers as
+        memoryview slices of the buffer, which the instruction compiler reads in place.
+
+        Main Attributes:
+            inputs: buffer with the content of an input file. See `utils.map_input_file`.
+
+        Main Methods:
+            __iter__: yields rovers on plateau with their instructions set.
+    """
+    inputs: Buffer
+
+    def _read_inputs(self) -> Iterator[LineRange]:
+        buffer = self.inputs if self.inputs is not None else b""
+        start, size = 0, len(buffer)
+
+        while start < size:
+            end = buffer.find(b"\n", start)
+            end = size if end == -1 else end + 1
+
+            # filter off empty lines in buffer
+            if _NON_SPACE.search(buffer, start, end):
+                yield start, end
+            start = end
+
+    def _decode(self, raw_input: LineRange) -> str:
+        start, end = raw_input
+        return bytes(self.inputs[start:end]).decode()
+
+    def _parse_rover_input(self, rover_input: LineRange) -> Tuple[str, str, Any]:
+        buffer = self.inputs
+        start, end = rover_input
+        separator = buffer.find(b":", start, end)
+
+        try:
+            assert separator != -1 and buffer.find(b":", separator + 1, end) == -1
+            name, input_type = self._decode((start, separator)).split()
+            input_type = input_type.lower()
+            assert input_type in ROVER_INPUT_TYPES
+
+        except (ValueError, AssertionError):
+            raise RoverError(f"invalid rover input. got {self._decode(rover_input)}") from None
+
+        if input_type == "landing":
+            return name, input_type, self._decode((separator + 1, end))
+
+        first_character = _NON_SPACE.search(buffer, separator + 1, end)
+        if first_character is None:
+            return name, input_type, memoryview(b"")
+
+        first, last = first_character.start(), end
+        while buffer[last - 1] in _SPACES:
+            last -= 1
+
+        instructions = memoryview(buffer)[first:last]
+        if has_digit(instructions):
+            if not is_valid_encoding(instructions):
+                raise RoverError(f"invalid run-length encoded instructions. got {bytes(instructions).decode()}", name)
+            try:
+                check_run_counts(instructions)
+            except ValueError as error:
+                raise RoverError(f"{error}. got {bytes(instructions).decode()}", name) from None
+
+        return name, input_type, instructions
@@ -0,0 +1,296 @@
+import gc
+import io
+import locale
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from os.path import getsize
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from internal.models import Point, Position
+from utils import InputError, RoverError
+from .input_parser import InputParser
+
+
+# flags of a rover in chunk records: which of its inputs the chunk has.
+HAS_LANDING, HAS_INSTRUCTIONS, HAS_ERROR, HAS_LARGE_LANDING = 1, 2, 4, 8
+
+ByteRange = Tuple[int, int]
+
+# (file path, start, end, encoding) of a chunk of an input file, sent to worker processes.
+ChunkTask = Tuple[str, int, int, str]
+
+
+class RoverRecords:
+    """ Columnar records of the rovers named in one chunk of an input file.
+
+        A chunk's input lines are reduced the way `InputParser._get_rover_details` adds them to its dict:
+        rovers are kept in the order they are first named, and a later input of a rover replaces an earlier
+        one. Only what is left after that is sent back from a worker.
+
+        Main Attributes:
+            names: name of every rover, in the order they are first named in the chunk.
+            flags: which inputs every rover has: HAS_LANDING, HAS_INSTRUCTIONS, HAS_ERROR, HAS_LARGE_LANDING.
+            xs, ys, headings: landing position of every rover with HAS_LANDING. 0 for other rovers.
+            instructions: instructions of every rover with HAS_INSTRUCTIONS, joined into one string.
+            instruction_ends: end of every rover's instructions in `instructions`. Rovers without instructions
+                end where the rover before them does.
+            values: last error of every rover with HAS_ERROR, and the landing position of every rover with
+                HAS_LARGE_LANDING, whose coordinates do not fit the coordinate columns, keyed by rover index.
+            errors: every error of the chunk, in file order. Errors of lines too malformed to name a rover
+                are only here.
+    """
+
+    __slots__ = ("names", "flags", "xs", "ys", "headings", "instructions", "instruction_ends", "values", "errors")
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.flags = bytearray()
+        self.xs = array("q")
+        self.ys = array("q")
+        self.headings = array("b")
+        self.instructions = ""
+        self.instruction_ends = array("q")
+        self.values: Dict[int, Any] = {}
+        self.errors: List[RoverError] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@contextmanager
+def _paused_gc():
+    """ Pauses the cyclic garbage collector while millions of small objects are built.
+
+        None of them form reference cycles, yet every few hundred new objects the collector would scan them again.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _translate_line_ending(line: str) -> str:
+    if line.endswith("\r\n"):
+        return line[:-2] + "\n"
+    if line.endswith("\r"):
+        return line[:-1] + "\n"
+    return line
+
+
+def _read_lines(task: ChunkTask) -> Iterator[str]:
+    """ Yields the non-empty lines of a chunk as reading the file in text mode would give them.
+
+        Lines are split on `\\n`, `\\r` and `\\r\\n`, and each line ending is translated to `\\n`.
+    """
+
+    file_path, start, end, encoding = task
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+
+    for line in io.StringIO(text, newline=""):
+        # filter off empty lines in chunk
+        if line.strip() != "":
+            yield _translate_line_ending(line)
+
+
+def parse_chunk(task: ChunkTask) -> RoverRecords:
+    "parses the rover input lines of a chunk of an input file into columnar records."
+
+    with _paused_gc():
+        return _parse_lines(_read_lines(task))
+
+
+def _parse_lines(lines: Iterator[str]) -> RoverRecords:
+    records = RoverRecords()
+    # rover name -> [flags, landing position, instructions, error], in the order rovers are first named.
+    rovers: Dict[str, list] = {}
+
+    for rover_input in lines:
+        try:
+            name, input_type, value = InputParser._parse_rover_input(rover_input)
+        except RoverError as error:
+            records.errors.append(error)
+            continue
+
+        details = rovers.get(name)
+        if details is None:
+            details = rovers[name] = [0, None, None, None]
+        try:
+            if input_type == "landing":
+                details[1] = InputParser._parse_to_position(value)
+                details[0] |= HAS_LANDING
+            else:
+                details[2] = InputParser._parse_instructions(value)
+                details[0] |= HAS_INSTRUCTIONS
+        except RoverError as error:
+            error.rover_name = name
+            details[0] |= HAS_ERROR
+            details[3] = error
+            records.errors.append(error)
+
+    names, flags, xs, ys, headings = records.names, records.flags, records.xs, records.ys, records.headings
+    ends, values = records.instruction_ends, records.values
+    instructions: List[str] = []
+    instructions_end = 0
+
+    for index, (name, (rover_flags, position, instruction, error)) in enumerate(rovers.items()):
+        x = y = heading = 0
+        if position is not None:
+            if position.point.x >= 1 << 63 or position.point.y >= 1 << 63:
+                rover_flags = rover_flags & ~HAS_LANDING | HAS_LARGE_LANDING
+                values[index] = position
+            else:
+                x, y, heading = position.point.x, position.point.y, position.heading
+        if instruction is not None:
+            instructions.append(instruction)
+            instructions_end += len(instruction)
+        if error is not None:
+            # a rover with an error is never built, so its error takes the place of any landing position.
+            rover_flags &= ~HAS_LARGE_LANDING
+            values[index] = error
+
+        names.append(name)
+        flags.append(rover_flags)
+        xs.append(x)
+        ys.append(y)
+        headings.append(heading)
+        ends.append(instructions_end)
+
+    records.instructions = "".join(instructions)
+    return records
+
+
+def split_input_file(file_path: str, start: int = 0, chunk_size: int = 1 << 24) -> List[ByteRange]:
+    "returns byte ranges of about `chunk_size` bytes covering a file from `start`, each ending at a line boundary."
+
+    ranges = []
+    size = getsize(file_path)
+    with open(file_path, "rb") as file:
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                file.seek(end)
+                end += len(file.readline())
+            end = min(end, size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _find_plateau(file_path: str, encoding: str) -> Tuple[Optional[str], int]:
+    "returns the first non-empty line of a file, with its line ending translated to `\\n`, and the byte offset after it."
+
+    offset = 0
+    with open(file_path, "r", encoding=encoding, newline="") as file:
+        for line in file:
+            offset += len(line.encode(encoding))
+            if line.strip() != "":
+                return _translate_line_ending(line), offset
+
+    return None, offset
+
+
+@dataclass
+class ParallelInputParser(InputParser):
+    """ Parses an input file in worker processes, for files with a very large number of rover inputs.
+
+        The file is split at line boundaries into byte ranges of about `chunk_size` bytes. Each worker
+        parses a range into columnar `RoverRecords`, which are merged in file order into the same rover
+        details `InputParser` builds line by line. Landing and instructions inputs of a rover are paired
+        even when they are in different ranges, later inputs of a rover replace earlier ones, and the
+        first error in file order is the one raised, with the same message.
+
+        Ranges are split after `\\n` bytes, so the file encoding must keep `\\n` a single byte,
+        as UTF-8 and single-byte encodings do.
+
+        Main Attributes:
+            inputs: path of the input file.
+            workers: number of worker processes. One per CPU when 0, and no worker process when 1.
+            chunk_size: approximate number of bytes in each range.
+            encoding: encoding of the input file. The one `open` uses by default when None.
+            plateau_definition: the plateau input, which is the first non-empty line of the file.
+
+        Main Methods:
+            get_rovers: returns list of rovers on plateau
+    """
+    inputs: str
+    workers: int = 0
+    chunk_size: int = 1 << 24
+    encoding: Optional[str] = None
+
+    def __post_init__(self):
+        self.encoding = self.encoding or locale.getpreferredencoding(False)
+        self.plateau_definition, self._rovers_start = None, 0
+        if self.inputs:
+            self.plateau_definition, self._rovers_start = _find_plateau(self.inputs, self.encoding)
+
+        super().__post_init__()
+
+    def _get_plateau(self):
+        if self.plateau_definition is None:
+            raise InputError("no input was given")
+
+        return self._parse_plateau(self.plateau_definition)
+
+    def _get_rovers(self):
+        with _paused_gc():
+            return super()._get_rovers()
+
+    def _read_rover_details(self) -> Dict:
+        rover_details: Dict[str, Dict] = {}
+        for records in self._parse_chunks():
+            self._merge_records(records, rover_details)
+
+        return rover_details
+
+    def _parse_chunks(self) -> Iterator[RoverRecords]:
+        tasks = [
+            (self.inputs, start, end, self.encoding)
+            for start, end in split_input_file(self.inputs, self._rovers_start, self.chunk_size)
+        ]
+        workers = self.workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) < 2:
+            yield from map(parse_chunk, tasks)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            yield from executor.map(parse_chunk, tasks)
+
+    def _merge_records(self, records: RoverRecords, rover_details: Dict[str, Dict]):
+        "adds the records of a chunk to the rover details, as if `_get_rover_details` had added each of its lines."
+
+        for error in records.errors:
+            self._record_error(error)
+
+        flags, xs, ys, headings = records.flags, records.xs, records.ys, records.headings
+        instructions, ends, values = records.instructions, records.instruction_ends, records.values
+        start = 0
+
+        for index, name in enumerate(records.names):
+            details = rover_details.get(name)
+            if details is None:
+                details = rover_details[name] = {}
+
+            rover_flags = flags[index]
+            if rover_flags & HAS_LANDING:
+                # built the way `Position.clone` does, which skips converting an orientation to a heading.
+                position = Position.__new__(Position)
+                position.point = Point(xs[index], ys[index])
+                position.heading = headings[index]
+                details["landing_position"] = position
+            elif rover_flags & HAS_LARGE_LANDING:
+                details["landing_position"] = values[index]
+            if rover_flags & HAS_INSTRUCTIONS:
+                end = ends[index]
+                details["instructions"] = instructions[start:end]
+                start = end
+            if rover_flags & HAS_ERROR:
+                details["error"] = values[index]
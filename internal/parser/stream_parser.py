@@ -0,0 +1,95 @@
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+from dataclasses import dataclass
+from internal.models import Rover
+from utils import InputError, RoverError
+from .input_parser import InputParser
+
+
+@dataclass
+class StreamInputParser:
+    """ Parses inputs lazily and yields each rover as soon as its landing and instructions inputs have been read.
+
+        Only rovers still waiting for one of their two inputs are kept in memory, so a mission file
+        can be run while it is being read. Unlike `InputParser`, rovers are yielded in the order their
+        inputs are completed and a rover named again after it was yielded starts a new rover.
+
+        Main Attributes:
+            inputs: iterable of inputs from users. The first input must be the plateau input.
+            partial: when True, invalid rovers are skipped and their errors recorded in `errors`
+                instead of raised. Later inputs of a rover that failed are skipped too.
+
+        Main Methods:
+            __iter__: yields rovers on plateau with their instructions set.
+    """
+    inputs: Iterable[str]
+    partial: bool = False
+
+    def __post_init__(self):
+        self.errors: List[RoverError] = []
+
+    def __iter__(self) -> Iterator[Rover]:
+        inputs = self._read_inputs()
+        plateau_definition = next(inputs, None)
+        if plateau_definition is None:
+            raise InputError("no input was given")
+
+        plateau = InputParser._parse_plateau(self._decode(plateau_definition))
+        pending_details: Dict[str, Dict] = {}
+        failed_rovers: Set[str] = set()
+
+        for rover_input in inputs:
+            name, rover = None, None
+            try:
+                name, input_type, value = self._parse_rover_input(rover_input)
+                if name in failed_rovers:
+                    continue
+                details = pending_details.setdefault(name, {})
+
+                if input_type == "landing":
+                    details["landing_position"] = InputParser._parse_to_position(value)
+                elif input_type == "instructions":
+                    details["instructions"] = value
+
+                if len(details) == 2:
+                    del pending_details[name]
+                    rover = Rover(name=name, position=details["landing_position"], land=plateau)
+                    rover.set_instruction(details["instructions"])
+            except RoverError as error:
+                if name is not None:
+                    error.rover_name = name
+                    pending_details.pop(name, None)
+                    failed_rovers.add(name)
+                self._record_error(error)
+                continue
+
+            if rover is not None:
+                yield rover
+
+        for name in pending_details:
+            self._record_error(RoverError(
+                f"landing and instructions inputs must both be given. got only one for rover {name}", name
+            ))
+
+    def _record_error(self, error: RoverError):
+        "raises the error of an invalid rover, or records it in partial mode."
+
+        if not self.partial:
+            raise error
+        self.errors.append(error)
+
+    def _read_inputs(self) -> Iterator:
+        "returns an iterator over the raw inputs."
+        return iter(self.inputs or ())
+
+    def _decode(self, raw_input) -> str:
+        "returns a raw input as a string."
+        return raw_input
+
+    def _parse_rover_input(self, rover_input) -> Tuple[str, str, Any]:
+        "returns the rover name, input type and value of a raw rover input, with instructions stripped."
+
+        name, input_type, value = InputParser._parse_rover_input(rover_input)
+        if input_type == "instructions":
+            value = InputParser._parse_instructions(value)
+
+        return name, input_type, value
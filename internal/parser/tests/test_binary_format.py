@@ -0,0 +1,92 @@
+import os
+import tempfile
+from unittest import TestCase
+from internal.engine.batch import run_fleet
+from internal.parser.binary_format import (
+    BinaryMission,
+    HEADER,
+    ROVER_DTYPE,
+    convert_to_binary,
+    pack_instruction
+)
+from internal.parser.input_parser import InputParser
+from utils import InputError, is_binary_mission
+
+
+class BinaryFormatTestCase(TestCase):
+    def setUp(self):
+        self.inputs = [
+            "Plateau:5 5",
+            "Rover1 Landing:1 2 N",
+            "Rover1 Instructions:LMLMLMLMM",
+            "Rover2 Landing:3 3 E",
+            "Rover2 Instructions:MMRMMRMRRM",
+            "Rover3 Landing:0 0 W",
+            "Rover3 Instructions:RRMMM",
+        ]
+        file_descriptor, self.file_path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        self.addCleanup(os.remove, self.file_path)
+
+    def expected_lines(self):
+        lines = []
+        for rover in InputParser(inputs=self.inputs).rovers:
+            rover.run_instruction()
+            lines.append(f"{rover.name}:{rover.position}")
+        return lines
+
+    def test_pack_instruction(self):
+        self.assertEqual(pack_instruction("LRMML"), (bytes([0b00011010, 0b00000000]), 5))
+        with self.assertRaises(InputError):
+            pack_instruction("M2R")
+
+    def test_encoded_instructions_cannot_be_converted(self):
+        self.inputs[6] = "Rover3 Instructions:M10000000000R"
+        with self.assertRaises(InputError):
+            convert_to_binary(self.inputs, self.file_path)
+        self.assertEqual(pack_instruction("M2xR"), (bytes([0b10010000]), 2))
+
+    def test_record_sizes(self):
+        self.assertEqual(HEADER.size, 32)
+        self.assertEqual(ROVER_DTYPE.itemsize, 48)
+
+    def test_converted_mission_is_detected(self):
+        convert_to_binary(self.inputs, self.file_path)
+        self.assertTrue(is_binary_mission(self.file_path))
+
+    def test_loaded_rovers_give_same_results(self):
+        convert_to_binary(self.inputs, self.file_path)
+        mission = BinaryMission.load(self.file_path)
+        self.assertEqual(mission.instruction(1), b"MMRMMRMRRM")
+
+        lines = []
+        for rover in mission.rovers():
+            rover.run_instruction()
+            lines.append(f"{rover.name}:{rover.position}")
+        self.assertEqual(lines, self.expected_lines())
+
+    def test_loaded_fleet_gives_same_results(self):
+        convert_to_binary(self.inputs, self.file_path)
+        mission = BinaryMission.load(self.file_path)
+        fleet = mission.fleet()
+        run_fleet(fleet, mission.plateau, mission.unpacked_instructions())
+        self.assertEqual(list(fleet.lines()), self.expected_lines())
+
+    def test_mission_without_rovers(self):
+        convert_to_binary(self.inputs[:1], self.file_path)
+        mission = BinaryMission.load(self.file_path)
+        self.assertEqual(mission.rovers(), [])
+
+    def test_text_file_is_not_binary_mission(self):
+        with open(self.file_path, "w") as file:
+            file.write("\n".join(self.inputs))
+        self.assertFalse(is_binary_mission(self.file_path))
+        with self.assertRaises(InputError):
+            BinaryMission.load(self.file_path)
+
+    def test_truncated_file_raises_error(self):
+        convert_to_binary(self.inputs, self.file_path)
+        with open(self.file_path, "rb+") as file:
+            file.truncate(HEADER.size + ROVER_DTYPE.itemsize)
+        with self.assertRaises(InputError):
+            BinaryMission.load(self.file_path)
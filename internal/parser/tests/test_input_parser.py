@@ -1,6 +1,7 @@
 from unittest import TestCase
 from typing import List
 from internal.parser.input_parser import InputParser
+from utils import InputError, PlateauError, RoverError
 
 
 class InputParserTestCase(TestCase):
@@ -33,18 +34,18 @@ class InputParserTestCase(TestCase):
             test_instruction=self.test_instruction
         )
 
-    def assert_exit_program(self, inputs):
-        with self.assertRaises(SystemExit):
+    def assert_raises_error(self, inputs):
+        with self.assertRaises(InputError):
             InputParser(inputs=inputs)
     
-    def assert_exit_program_on_set_input(self):
-        self.assert_exit_program(inputs=self.inputs)
+    def assert_raises_error_on_set_input(self):
+        self.assert_raises_error(inputs=self.inputs)
     
     def test_should_not_receive_empty_inputs(self):
-        self.assert_exit_program(inputs=[])
+        self.assert_raises_error(inputs=[])
         
     def test_must_receive_inputs(self):
-        self.assert_exit_program(inputs=None)
+        self.assert_raises_error(inputs=None)
     
     def test_parser_sets_input_instruction_for_each_rovers(self):
         parser = InputParser(inputs=self.inputs)
@@ -63,31 +64,70 @@ class InputParserTestCase(TestCase):
 
     def test_first_item_in_input_must_be_for_plateau(self):
         inputs = self.inputs[1:]    # remove plateau input
-        self.assert_exit_program(inputs=inputs)
+        self.assert_raises_error(inputs=inputs)
 
-    def test_invalid_plateau_input_exits_program(self):
+    def test_invalid_plateau_input_raises_error(self):
         self.inputs[0] = "Plateau:v 7"
-        self.assert_exit_program_on_set_input()
+        self.assert_raises_error_on_set_input()
 
-    def test_invalid_rover_landing_position_exits_program(self):
+    def test_invalid_rover_landing_position_raises_error(self):
         # invalid landing x coordinate
         self.inputs.append("Rover Landing:r 2 N")
-        self.assert_exit_program_on_set_input()
+        self.assert_raises_error_on_set_input()
 
         # invalid landing y coordinate
         self.inputs.append("Rover Landing:2 t N")
-        self.assert_exit_program_on_set_input()
+        self.assert_raises_error_on_set_input()
         
         # invalid landing cardinal compass point
         self.inputs.append("Rover Landing:2 2 Q")
-        self.assert_exit_program_on_set_input()
+        self.assert_raises_error_on_set_input()
 
-    def test_rover_landing_position_typo_error_input_exits_program(self):
+    def test_rover_landing_position_typo_error_input_raises_error(self):
         typo_landing_statement = "Rover Landiong:2 2 N"
         self.inputs.append(typo_landing_statement)
-        self.assert_exit_program_on_set_input()
+        self.assert_raises_error_on_set_input()
     
-    def test_rover_instruction_typo_error_input_exits_program(self):
+    def test_rover_instruction_typo_error_input_raises_error(self):
         typo_instruction = "Rover Instuctn:LMLMMR"
         self.inputs.append(typo_instruction)
-        self.assert_exit_program_on_set_input()
\ No newline at end of file
+        self.assert_raises_error_on_set_input()
+
+    def test_parser_accepts_run_length_encoded_instructions(self):
+        self.inputs[2] = "Rover1 Instructions:M1000R3M2"
+        parser = InputParser(inputs=self.inputs)
+        self.assertEqual(parser.rovers[0].instruction, "M1000R3M2")
+
+    def test_invalid_run_length_encoded_instructions_raises_error(self):
+        for instructions in ("M10X3", "M1000 R3", "M1000r3", "10M"):
+            self.inputs[2] = f"Rover1 Instructions:{instructions}"
+            self.assert_raises_error_on_set_input()
+
+    def test_run_count_above_maximum_raises_error(self):
+        self.inputs[2] = "Rover1 Instructions:M99999999999999999999"
+        self.assert_raises_error_on_set_input()
+
+    def test_run_counts_adding_up_above_maximum_raise_error(self):
+        self.inputs[2] = "Rover1 Instructions:" + "M900000000000000" * 2000
+        self.assert_raises_error_on_set_input()
+
+    def test_rover_missing_instructions_raises_error(self):
+        self.inputs.append("Rover4 Landing:1 1 N")
+        with self.assertRaises(RoverError) as context:
+            InputParser(inputs=self.inputs)
+        self.assertEqual(context.exception.rover_name, "Rover4")
+
+    def test_partial_mode_keeps_valid_rovers(self):
+        self.inputs[1] = "Rover1 Landing:9 9 N"
+        self.inputs[4] = "Rover2 Instructions:M99999999999999999999"
+        self.inputs.append("Rover Instuctn:LMLMMR")
+        parser = InputParser(inputs=self.inputs, partial=True)
+
+        self.assertEqual([rover.name for rover in parser.rovers], ["Rover3"])
+        self.assertEqual([error.rover_name for error in parser.errors], ["Rover2", None, "Rover1"])
+        self.assertEqual(str(parser.errors[2]), "Rover 'Rover1' is outside specified land")
+
+    def test_partial_mode_still_raises_plateau_errors(self):
+        self.inputs[0] = "Plateau:v 7"
+        with self.assertRaises(PlateauError):
+            InputParser(inputs=self.inputs, partial=True)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from unittest import TestCase
+from internal.parser.mapped_parser import MappedInputParser
+from internal.parser.stream_parser import StreamInputParser
+from utils import map_input_file
+from utils import InputError
+
+
+class MappedInputParserTestCase(TestCase):
+    def setUp(self):
+        self.content = (
+            "Plateau:5 5\n"
+            "Rover1 Landing:1 2 N\n"
+            "\n"
+            "Rover1 Instructions:  LMLMLMLMM \r\n"
+            "Rover2 Landing:3 3 E\n"
+            "Rover2 Instructions:MMRMMRMRRM"
+        )
+
+    def assert_raises_error(self, buffer):
+        with self.assertRaises(InputError):
+            list(MappedInputParser(inputs=buffer))
+
+    def test_yields_same_rovers_as_stream_parser(self):
+        mapped = [(rover.name, rover.position, bytes(rover.instruction).decode()) for rover in MappedInputParser(inputs=self.content.encode())]
+        streamed = [(rover.name, rover.position, rover.instruction) for rover in StreamInputParser(inputs=[line for line in self.content.splitlines(True) if line.strip()])]
+        self.assertEqual(mapped, streamed)
+
+    def test_instructions_are_views_of_the_buffer(self):
+        rover = next(iter(MappedInputParser(inputs=self.content.encode())))
+        self.assertIsInstance(rover.instruction, memoryview)
+        self.assertEqual(bytes(rover.instruction), b"LMLMLMLMM")
+
+    def test_rovers_run_instructions_from_buffer(self):
+        results = []
+        for rover in MappedInputParser(inputs=self.content.encode()):
+            rover.run_instruction()
+            results.append(f"{rover.name}:{rover.position}")
+        self.assertEqual(results, ["Rover1:1 3 N", "Rover2:5 1 E"])
+
+    def test_reads_memory_mapped_file(self):
+        file_descriptor, file_path = tempfile.mkstemp()
+        self.addCleanup(os.remove, file_path)
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(self.content)
+
+        buffer = map_input_file(file_path)
+        self.assertEqual([rover.name for rover in MappedInputParser(inputs=buffer)], ["Rover1", "Rover2"])
+
+    def test_should_not_receive_empty_inputs(self):
+        self.assert_raises_error(b"")
+
+    def test_rover_input_with_two_separators_raises_error(self):
+        self.assert_raises_error(self.content.encode() + b"\nRover3 Landing:1:2 N")
+
+    def test_rover_instruction_typo_error_input_raises_error(self):
+        self.assert_raises_error(self.content.encode() + b"\nRover Instuctn:LMLMMR")
+
+    def test_invalid_run_length_encoded_instructions_raises_error(self):
+        self.assert_raises_error(self.content.encode() + b"\nRover3 Landing:1 1 N\nRover3 Instructions:M1000 R3")
@@ -0,0 +1,146 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from internal.parser.input_parser import InputParser
+from internal.parser.parallel_parser import ParallelInputParser, split_input_file
+from utils import InputError, PlateauError, RoverError, get_input_from_args
+
+
+class ParallelInputParserTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "input.txt")
+
+    def write(self, content: str) -> str:
+        with open(self.path, "w", newline="") as file:
+            file.write(content)
+        return self.path
+
+    def parse_both(self, content, partial=False, **options):
+        "returns what InputParser and ParallelInputParser give for the same file: rovers and errors, or the error raised."
+
+        path = self.write(content)
+        results = []
+        for parse in (
+            lambda: InputParser(inputs=get_input_from_args(path, "", []), partial=partial),
+            lambda: ParallelInputParser(inputs=path, partial=partial, workers=1, **options),
+        ):
+            try:
+                parser = parse()
+            except InputError as error:
+                results.append((type(error), str(error), getattr(error, "rover_name", None)))
+                continue
+            rovers = [(rover.name, str(rover.position), rover.instruction) for rover in parser.rovers]
+            errors = [(type(error), str(error), error.rover_name) for error in parser.errors]
+            results.append((rovers, errors))
+
+        return results
+
+    def assert_same_as_input_parser(self, content, partial=False, **options):
+        expected, parallel = self.parse_both(content, partial, **options)
+        self.assertEqual(parallel, expected)
+        return parallel
+
+    def test_rovers_match_input_parser(self):
+        content = (
+            "Plateau:5 5\n"
+            "Rover1 Landing:1 2 N\n"
+            "\n"
+            "Rover1 Instructions:  LMLMLMLMM \r\n"
+            "Rover2 Landing:3 3 E\r"
+            "Rover2 Instructions:M2R3M"
+        )
+        rovers, errors = self.assert_same_as_input_parser(content, chunk_size=8)
+        self.assertEqual([name for name, _, _ in rovers], ["Rover1", "Rover2"])
+
+    def test_inputs_of_a_rover_are_paired_across_chunks(self):
+        lines = ["Plateau:50 50"]
+        names = [f"Rover{index}" for index in range(200)]
+        generator = random.Random(5)
+        for name in names:
+            lines.append(f"{name} Landing:{generator.randint(0, 50)} {generator.randint(0, 50)} S")
+        generator.shuffle(names)
+        for name in names:
+            lines.append(f"{name} Instructions:{''.join(generator.choice('LRM') for _ in range(20))}")
+        # later inputs of a rover replace earlier ones.
+        lines.append(f"{names[0]} Landing:0 0 W")
+
+        rovers, _ = self.assert_same_as_input_parser("\n".join(lines) + "\n", chunk_size=64)
+        self.assertEqual(len(rovers), 200)
+
+    def test_first_error_in_file_order_is_raised(self):
+        content = "Plateau:x 5\nRover1 Landing:1 2 N\nRover1 Instructions:LM\nRover2 Landing:a 2 N\nRover3 bad input\n"
+        error = self.assert_same_as_input_parser(content, chunk_size=16)
+        self.assertEqual(error, (RoverError, "invalid position definition: a 2 N\n", "Rover2"))
+
+    def test_invalid_rover_input_keeps_message(self):
+        content = "Plateau:5 5\nRover1 Landing:1 2 N\nRover1 bad input\n"
+        error = self.assert_same_as_input_parser(content, chunk_size=16)
+        self.assertEqual(error, (RoverError, "invalid rover input. got Rover1 bad input\n", None))
+
+    def test_rover_errors_come_before_plateau_errors(self):
+        self.assert_same_as_input_parser("Plateau:x 5\nRover1 Landing:1 2 N\nRover1 Instructions:M\n")
+        self.assert_same_as_input_parser("Plateau:5 5\nRover1 Landing:1 2 N\n")
+        error = self.assert_same_as_input_parser("\n  \nRover1 Landing:1 2 N\n")
+        self.assertEqual(error[0], PlateauError)
+
+    def test_empty_file_has_no_input(self):
+        self.assertEqual(self.assert_same_as_input_parser("\n\n")[0], InputError)
+
+    def test_partial_mode_records_errors_in_file_order(self):
+        content = (
+            "Plateau:5 5\n"
+            "Rover1 Landing:1 2 N\n"
+            "Rover2 Landing:9 9 N\n"
+            "Rover2 Instructions:M\n"
+            "Rover3 Instructions:M2X\n"
+            "oops\n"
+            "Rover1 Instructions:MM\n"
+            "Rover4 Landing:1 1 E\n"
+        )
+        rovers, errors = self.assert_same_as_input_parser(content, partial=True, chunk_size=20)
+        self.assertEqual(rovers, [("Rover1", "1 2 N", "MM")])
+        self.assertEqual(len(errors), 4)
+
+    def test_random_inputs_match_input_parser(self):
+        generator = random.Random(13)
+        lines = [
+            "Rover{} Landing:{} {} N", "Rover{} Landing:{} {} Q", "Rover{} Instructions:LM{}R{}",
+            "Rover{} Instructions:M{}X{}", "Rover{} landing {} {}", "",
+        ]
+        for _ in range(50):
+            content = "Plateau:6 6\n" + "".join(
+                generator.choice(lines).format(generator.randint(0, 5), generator.randint(0, 8), generator.randint(0, 8))
+                + generator.choice(["\n", "\r\n"])
+                for _ in range(generator.randint(0, 30))
+            )
+            for partial in (False, True):
+                self.assert_same_as_input_parser(content, partial=partial, chunk_size=generator.randint(1, 80))
+
+    def test_chunks_are_parsed_in_worker_processes(self):
+        lines = ["Plateau:9 9"]
+        for index in range(300):
+            lines.extend([f"Rover{index} Landing:{index % 10} 4 N", f"Rover{index} Instructions:MMRM"])
+        path = self.write("\n".join(lines))
+
+        parser = ParallelInputParser(inputs=path, workers=2, chunk_size=1024)
+        expected = InputParser(inputs=get_input_from_args(path, "", []))
+        self.assertEqual(
+            [(rover.name, str(rover.position), rover.instruction) for rover in parser.rovers],
+            [(rover.name, str(rover.position), rover.instruction) for rover in expected.rovers]
+        )
+
+
+class SplitInputFileTestCase(TestCase):
+    def test_ranges_end_at_line_boundaries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            content = b"Plateau:5 5\r\nRover1 Landing:1 2 N\nRover1 Instructions:LMLM\n"
+            with open(path, "wb") as file:
+                file.write(content)
+
+            ranges = split_input_file(path, 13, chunk_size=4)
+            self.assertEqual(ranges, [(13, 34), (34, len(content))])
+            self.assertEqual(split_input_file(path, 0, chunk_size=1 << 20), [(0, len(content))])
@@ -0,0 +1,62 @@
+from unittest import TestCase
+from internal.parser.input_parser import InputParser
+from internal.parser.stream_parser import StreamInputParser
+from utils import InputError
+
+
+class StreamInputParserTestCase(TestCase):
+    def setUp(self):
+        self.inputs = [
+            "Plateau:5 5",
+            "Rover1 Landing:1 2 N",
+            "Rover1 Instructions:LMLMLMLMM",
+            "Rover2 Landing:3 3 E",
+            "Rover2 Instructions:MMRMMRMRRM",
+        ]
+
+    def assert_raises_error(self, inputs):
+        with self.assertRaises(InputError):
+            list(StreamInputParser(inputs=inputs))
+
+    def test_yields_same_rovers_as_input_parser(self):
+        streamed = [(rover.name, rover.position, rover.instruction) for rover in StreamInputParser(inputs=self.inputs)]
+        parsed = [(rover.name, rover.position, rover.instruction) for rover in InputParser(inputs=self.inputs).rovers]
+        self.assertEqual(streamed, parsed)
+
+    def test_rover_is_yielded_once_both_inputs_are_read(self):
+        def inputs():
+            yield from self.inputs[:3]
+            self.fail("rover should be yielded before reading further inputs")
+
+        rover = next(iter(StreamInputParser(inputs=inputs())))
+        self.assertEqual(rover.name, "Rover1")
+
+    def test_inputs_of_rovers_may_interleave(self):
+        inputs = [self.inputs[0], self.inputs[1], self.inputs[3], self.inputs[4], self.inputs[2]]
+        self.assertEqual([rover.name for rover in StreamInputParser(inputs=inputs)], ["Rover2", "Rover1"])
+
+    def test_should_not_receive_empty_inputs(self):
+        self.assert_raises_error(inputs=[])
+
+    def test_must_receive_inputs(self):
+        self.assert_raises_error(inputs=None)
+
+    def test_invalid_plateau_input_raises_error(self):
+        self.inputs[0] = "Plateau:v 7"
+        self.assert_raises_error(inputs=self.inputs)
+
+    def test_invalid_rover_input_raises_error(self):
+        self.inputs.append("Rover Instuctn:LMLMMR")
+        self.assert_raises_error(inputs=self.inputs)
+
+    def test_rover_missing_instructions_raises_error(self):
+        self.inputs.append("Rover3 Landing:1 1 N")
+        self.assert_raises_error(inputs=self.inputs)
+
+    def test_partial_mode_skips_invalid_rovers(self):
+        self.inputs[1] = "Rover1 Landing:1 t N"
+        self.inputs.append("Rover3 Landing:1 1 N")
+        parser = StreamInputParser(inputs=self.inputs, partial=True)
+
+        self.assertEqual([rover.name for rover in parser], ["Rover2"])
+        self.assertEqual([error.rover_name for error in parser.errors], ["Rover1", "Rover3"])
@@ -0,0 +1,2 @@
+from .route import plan_route
+from .optimizer import OptimizedInstruction, optimize_instruction, simplify_instruction
@@ -0,0 +1,143 @@
+from typing import List, NamedTuple, Optional, Tuple
+from internal.models import Land, Point, Position, Rover, compile_instruction, execute
+from internal.models.land import RectangularLand
+from internal.models.mechanics import HEADINGS, UNIT_VECTORS
+from internal.models.program import Instruction, count_rotations, encode_runs, is_encoded, iter_command_runs
+from .route import plan_route
+
+
+State = Tuple[int, int, int]
+
+# (command, count) runs of an instruction.
+Runs = List[Tuple[str, int]]
+
+# shortest rotation runs for quarter turns to the right, 0 to 3.
+_TURN_RUNS = ((), (("R", 1),), (("R", 2),), (("L", 1),))
+
+
+class OptimizedInstruction(NamedTuple):
+    """ Result of optimizing a rover's instruction.
+
+        Main Attributes:
+            instruction: instruction that leaves the rover where the original one did. It is run-length
+                encoded when asked to be, which by default is when the original one was.
+            original_length: number of commands in the original instruction.
+            length: number of commands in the optimized instruction.
+    """
+
+    instruction: str
+    original_length: int
+    length: int
+
+    @property
+    def reduction_ratio(self) -> float:
+        "returns the share of the original commands that were removed, from 0 to 1."
+        return 1 - self.length / self.original_length if self.original_length else 0.0
+
+
+def _join_runs(runs: Runs, encoded: bool) -> str:
+    return encode_runs(runs) if encoded else "".join(command * count for command, count in runs)
+
+
+def _runs_length(runs: Runs) -> int:
+    return sum(count for _, count in runs)
+
+
+def simplify_instruction(
+    instruction: Instruction, land: Land, x: int, y: int, heading: int, encoded: bool = False
+) -> str:
+    """ Rewrites an instruction into an equivalent one without redundant commands.
+
+        Runs of rotations collapse into the fewest commands for their net turn (`LR` to nothing,
+        `LLL` to `R`), and moves that would leave the land are dropped. Rotations on either side of
+        dropped moves are merged too. The rover follows the same path, only without the commands
+        that did nothing. The result is run-length encoded when `encoded` is True.
+    """
+    return _join_runs(_simplified_runs(instruction, land, x, y, heading), encoded)
+
+
+def _simplified_runs(instruction: Instruction, land: Land, x: int, y: int, heading: int) -> Runs:
+    runs: Runs = []
+    pending_turn = 0
+    for turn, steps in compile_instruction(instruction):
+        pending_turn += turn
+        if not steps:
+            continue
+
+        step_heading = (heading + pending_turn) % 4
+        dx, dy = UNIT_VECTORS[step_heading]
+        next_x, next_y = land.traverse(x, y, dx, dy, steps)
+        moved = abs(next_x - x) + abs(next_y - y)
+        if moved:
+            runs.extend(_TURN_RUNS[pending_turn % 4])
+            runs.append(("M", moved))
+            x, y, heading, pending_turn = next_x, next_y, step_heading, 0
+
+    runs.extend(_TURN_RUNS[pending_turn % 4])
+    return runs
+
+
+def _rectangle_route(start: State, end: State) -> Runs:
+    """ Returns the runs of a shortest instruction between two states of the same rectangular land.
+
+        Nothing blocks a rover inside a rectangle, so an L-shaped path is always open: face one axis
+        and move along it, then the other, then turn to the final heading. Every route needs at least
+        the manhattan distance in moves, and trying both axis orders gives the fewest turns.
+    """
+
+    x, y, heading = start
+    end_x, end_y, end_heading = end
+    legs = []
+    if end_x != x:
+        legs.append((1 if end_x > x else 3, abs(end_x - x)))
+    if end_y != y:
+        legs.append((0 if end_y > y else 2, abs(end_y - y)))
+
+    best: Optional[Runs] = None
+    for order in ([legs] if len(legs) < 2 else [legs, legs[::-1]]):
+        runs: Runs = []
+        current = heading
+        for leg_heading, moves in order:
+            runs.extend(_TURN_RUNS[(leg_heading - current) % 4])
+            runs.append(("M", moves))
+            current = leg_heading
+        runs.extend(_TURN_RUNS[(end_heading - current) % 4])
+
+        if best is None or _runs_length(runs) < _runs_length(best):
+            best = runs
+
+    return best
+
+
+def optimize_instruction(rover: Rover, search: bool = True, encoded: Optional[bool] = None) -> OptimizedInstruction:
+    """ Rewrites a rover's instruction into the shortest one that leaves it at the same final position.
+
+        The rover itself is left as it is. On a rectangular land the shortest instruction has a closed form.
+        On other lands it is planned with `plan_route` when `search` is True, and otherwise the
+        instruction is only simplified by `simplify_instruction`. The result is run-length encoded when
+        `encoded` is True, or when it is None and the rover's instruction is encoded. Moves are kept as
+        counts until then, so a long run is never spelled out command by command.
+    """
+
+    instruction = rover.instruction
+    land = rover.land
+    point = rover.position.point
+    start = (point.x, point.y, rover.position.heading)
+    program = compile_instruction(instruction)
+    original_length = sum(program.steps) + count_rotations(instruction)
+    end = execute(program, land, *start)
+    if encoded is None:
+        encoded = is_encoded(instruction)
+
+    if isinstance(land, RectangularLand) and land.is_coordinate_within(point.x, point.y):
+        runs = _rectangle_route(start, end)
+    else:
+        runs = _simplified_runs(instruction, land, *start)
+        if search:
+            route = plan_route(
+                land, Position(point.x, point.y, HEADINGS[start[2]]), Point(end[0], end[1]), HEADINGS[end[2]]
+            )
+            if route is not None and len(route) < _runs_length(runs):
+                runs = list(iter_command_runs(route))
+
+    return OptimizedInstruction(_join_runs(runs, encoded), original_length, _runs_length(runs))
@@ -0,0 +1,202 @@
+import heapq
+from typing import Dict, Iterable, Optional, Set, Tuple
+from internal.models import Land, Orientation, Point, Position
+from internal.models.mechanics import LEFT_OF, RIGHT_OF, UNIT_VECTORS, heading_of
+
+
+# actions stored in the parent map, 2 bits per state. 0 marks a state that was not expanded yet.
+_UNSEEN, _LEFT, _RIGHT, _MOVE = 0, 1, 2, 3
+_COMMANDS = ("", "L", "R", "M")
+
+# states a search may expand before it gives up, several seconds of searching.
+DEFAULT_MAX_EXPANSIONS = 10**6
+
+
+def _turns_between(heading: int, other: int) -> int:
+    "returns the fewest quarter turns from one heading to another."
+
+    difference = (other - heading) % 4
+    return min(difference, 4 - difference)
+
+
+def _turns_needed(heading: int, dx: int, dy: int, target_heading: Optional[int]) -> int:
+    """ Returns a lower bound on the turns needed to cover a displacement and end facing a heading.
+
+        Every heading with a component towards the target has to be faced at some point, in some order,
+        before turning to the target heading.
+    """
+
+    needed = []
+    if dx:
+        needed.append(1 if dx > 0 else 3)
+    if dy:
+        needed.append(0 if dy > 0 else 2)
+
+    orders = [needed] if len(needed) < 2 else [needed, needed[::-1]]
+    best = None
+    for order in orders:
+        turns, current = 0, heading
+        for next_heading in order:
+            turns += _turns_between(current, next_heading)
+            current = next_heading
+        if target_heading is not None:
+            turns += _turns_between(current, target_heading)
+        best = turns if best is None else min(best, turns)
+
+    return best
+
+
+# _turns_needed for every heading, sign of dx, sign of dy and target heading (4 for any), indexed by _turn_index.
+_TURN_BOUNDS = tuple(
+    _turns_needed(heading, dx, dy, None if target_heading == 4 else target_heading)
+    for heading in range(4) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for target_heading in range(5)
+)
+
+
+def _turn_index(heading: int, dx: int, dy: int, target_heading: int) -> int:
+    return ((heading * 3 + (dx > 0) - (dx < 0) + 1) * 3 + (dy > 0) - (dy < 0) + 1) * 5 + target_heading
+
+
+class _ParentMap:
+    """ Action that first expanded each (x, y, heading) state of a land's bounding box, packed 2 bits per state.
+
+        A plateau of 10^4 x 10^4 cells needs 10^8 bytes, allocated zeroed so that only the pages
+        of states the search reaches are ever touched.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, states: int) -> None:
+        self._bits = bytearray((states + 3) // 4)
+
+    def get(self, state: int) -> int:
+        return self._bits[state >> 2] >> ((state & 3) << 1) & 3
+
+    def set(self, state: int, action: int):
+        self._bits[state >> 2] |= action << ((state & 3) << 1)
+
+
+def plan_route(
+    land: Land,
+    start: Position,
+    target: Point,
+    heading: Optional[Orientation] = None,
+    occupied: Iterable[Tuple[int, int]] = (),
+    max_expansions: Optional[int] = DEFAULT_MAX_EXPANSIONS
+) -> Optional[str]:
+    """ Returns a shortest instruction that takes a rover from a position to a target point, or None if there is none.
+
+        Every command (L, R or M) costs one, so the route has the fewest commands, rotations included.
+        The search is A* over (x, y, heading) states of the land's bounding box with a consistent heuristic:
+        the manhattan distance to the target plus a lower bound on the turns still needed.
+        States are numbered by position in the bounding box, and the expanded ones are kept in a 2-bit
+        parent map instead of per-state objects. Only the search frontier is kept in a dict.
+        A detour around a long wall on a large land can take most states of the land to find, so the
+        search gives up and returns None once it has expanded `max_expansions` states.
+
+        @params
+            land: land to move on. Cells outside of it are never entered.
+            start: position the rover starts from.
+            target: point to reach.
+            heading: orientation to end with. Any orientation when None.
+            occupied: (x, y) cells held by other rovers, which are never entered.
+            max_expansions: most states to expand before giving up. No limit when None.
+
+        Raises LandError if the land has no bounds.
+    """
+
+    lower_left, upper_right = land.bounds
+    origin_x, origin_y = lower_left.x, lower_left.y
+    width = upper_right.x - origin_x + 1
+    blocked: Set[Tuple[int, int]] = set(occupied)
+    target_x, target_y = target.x, target.y
+    target_heading = None if heading is None else heading_of(heading)
+
+    def is_free(x: int, y: int) -> bool:
+        return land.is_coordinate_within(x, y) and (x, y) not in blocked
+
+    if not (is_free(target_x, target_y) and land.is_address_within(start.point)):
+        return None
+
+    target_index = 4 if target_heading is None else target_heading
+
+    def estimate(x: int, y: int, state_heading: int) -> int:
+        dx, dy = target_x - x, target_y - y
+        return abs(dx) + abs(dy) + _TURN_BOUNDS[_turn_index(state_heading, dx, dy, target_index)]
+
+    def state_of(x: int, y: int, state_heading: int) -> int:
+        return ((y - origin_y) * width + (x - origin_x)) * 4 + state_heading
+
+    states = width * (upper_right.y - origin_y + 1) * 4
+    parents = _ParentMap(states)
+    x, y, start_heading = start.point.x, start.point.y, start.heading
+    start_state = state_of(x, y, start_heading)
+
+    # frontier: state -> cost so far * 4 + action that reached it. heap entries are single ints ordered
+    # by estimated total cost, then by deeper states first on ties, then by state.
+    frontier: Dict[int, int] = {start_state: _UNSEEN}
+    heap = [(estimate(x, y, start_heading) * (states + 1) + states) * states + start_state]
+    goal_state = None
+    expansions_left = -1 if max_expansions is None else max_expansions
+
+    while heap and expansions_left:
+        entry = heapq.heappop(heap)
+        state = entry % states
+        cost = states - entry // states % (states + 1)
+        known = frontier.get(state)
+        if known is None or known >> 2 != cost:
+            continue
+
+        del frontier[state]
+        expansions_left -= 1
+        # the start state keeps no action; mark it with any non-zero one so it counts as expanded.
+        parents.set(state, known & 3 or _MOVE)
+
+        cell, state_heading = divmod(state, 4)
+        row, column = divmod(cell, width)
+        x, y = origin_x + column, origin_y + row
+        if x == target_x and y == target_y and target_heading in (None, state_heading):
+            goal_state = state
+            break
+
+        dx, dy = UNIT_VECTORS[state_heading]
+        next_cost = cost + 1
+        for next_action, next_x, next_y, next_heading in (
+            (_LEFT, x, y, LEFT_OF[state_heading]),
+            (_RIGHT, x, y, RIGHT_OF[state_heading]),
+            (_MOVE, x + dx, y + dy, state_heading),
+        ):
+            if next_action == _MOVE and not is_free(next_x, next_y):
+                continue
+
+            next_state = state_of(next_x, next_y, next_heading)
+            if parents.get(next_state) != _UNSEEN:
+                continue
+
+            known = frontier.get(next_state)
+            if known is not None and known >> 2 <= next_cost:
+                continue
+
+            frontier[next_state] = next_cost << 2 | next_action
+            total = next_cost + estimate(next_x, next_y, next_heading)
+            heapq.heappush(heap, (total * (states + 1) + states - next_cost) * states + next_state)
+
+    if goal_state is None:
+        return None
+
+    # walk the parent map back to the start, undoing each action.
+    commands = []
+    state = goal_state
+    while state != start_state:
+        action = parents.get(state)
+        commands.append(_COMMANDS[action])
+        cell, state_heading = divmod(state, 4)
+        if action == _MOVE:
+            dx, dy = UNIT_VECTORS[state_heading]
+            state = (cell - dy * width - dx) * 4 + state_heading
+        elif action == _LEFT:
+            state = cell * 4 + RIGHT_OF[state_heading]
+        else:
+            state = cell * 4 + LEFT_OF[state_heading]
+
+    return "".join(reversed(commands))
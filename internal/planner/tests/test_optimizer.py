@@ -0,0 +1,117 @@
+import random
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.bitmap_land import ObstacleLand
+from internal.models.land import RectangularLand
+from internal.planner import optimize_instruction, plan_route, simplify_instruction
+
+
+class OptimizeInstructionTestCase(TestCase):
+    def final_position(self, land, start, instruction):
+        rover = Rover(name="Optimized Rover", position=start.clone(), land=land)
+        rover.set_instruction(instruction)
+        rover.run_instruction()
+        return str(rover.position)
+
+    def test_redundant_commands_are_removed(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        rover = Rover(name="Rover1", position=Position(1, 2, Orientation.N), land=land)
+        rover.set_instruction("LRRRRRLLLLMMMMMMMMM")
+
+        result = optimize_instruction(rover)
+        self.assertEqual(result.instruction, "MMM")
+        self.assertEqual((result.original_length, result.length), (19, 3))
+        self.assertAlmostEqual(result.reduction_ratio, 16 / 19)
+
+    def test_rover_is_left_as_it_is(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        rover = Rover(name="Rover1", position=Position(1, 2, Orientation.N), land=land)
+        rover.set_instruction("LMLMLMLMM")
+
+        optimize_instruction(rover)
+        self.assertEqual(str(rover.position), "1 2 N")
+        self.assertEqual(rover.instruction, "LMLMLMLMM")
+
+    def test_empty_instruction_has_no_reduction(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        rover = Rover(name="Rover1", position=Position(1, 2, Orientation.N), land=land)
+
+        result = optimize_instruction(rover)
+        self.assertEqual((result.instruction, result.reduction_ratio), ("", 0.0))
+
+    def test_rectangle_programs_are_shortest_with_same_final_position(self):
+        generator = random.Random(3)
+        for _ in range(200):
+            land = RectangularLand(
+                upper_right_edge=Point(generator.randint(0, 6), generator.randint(0, 6)),
+            )
+            start = Position(
+                generator.randint(0, land.upper_right_edge.x),
+                generator.randint(0, land.upper_right_edge.y),
+                generator.choice(list(Orientation)),
+            )
+            instruction = "".join(generator.choice("LRM") for _ in range(generator.randint(0, 40)))
+            rover = Rover(name="Rover1", position=start.clone(), land=land)
+            rover.set_instruction(instruction)
+
+            result = optimize_instruction(rover)
+            expected = self.final_position(land, start, instruction)
+            self.assertEqual(self.final_position(land, start, result.instruction), expected)
+
+            x, y, orientation = expected.split()
+            route = plan_route(land, start, Point(int(x), int(y)), getattr(Orientation, orientation))
+            self.assertEqual(result.length, len(route))
+
+    def test_encoded_instruction_is_optimized(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        rover = Rover(name="Rover1", position=Position(0, 0, Orientation.N), land=land)
+        rover.set_instruction("M1000R3M20")
+
+        result = optimize_instruction(rover)
+        self.assertEqual(result.instruction, "M5L")
+        self.assertEqual((result.original_length, result.length), (1023, 6))
+        self.assertEqual(optimize_instruction(rover, encoded=False).instruction, "MMMMML")
+
+    def test_long_encoded_runs_stay_encoded(self):
+        land = RectangularLand(upper_right_edge=Point(10 ** 12, 10 ** 12))
+        rover = Rover(name="Rover1", position=Position(0, 0, Orientation.N), land=land)
+        rover.set_instruction("M1000000000000RM1000000000000LR4")
+
+        self.assertEqual(optimize_instruction(rover).instruction, "RM1000000000000LM1000000000000")
+        land = ObstacleLand(upper_right_edge=Point(100, 100), obstacles=[])
+        self.assertEqual(simplify_instruction("M1000000000000R4M5RM20", land, 0, 0, 0, encoded=True), "M100RM20")
+
+    def test_obstacle_land_programs_keep_final_position(self):
+        generator = random.Random(11)
+        for _ in range(30):
+            obstacles = []
+            for _ in range(4):
+                x, y = generator.randint(0, 7), generator.randint(0, 7)
+                obstacles.append((Point(x, y), Point(x + generator.randint(0, 1), y + generator.randint(0, 1))))
+            land = ObstacleLand(upper_right_edge=Point(7, 7), obstacles=obstacles)
+            cells = [(x, y) for x in range(8) for y in range(8) if land.is_coordinate_within(x, y)]
+            start_x, start_y = generator.choice(cells)
+            start = Position(start_x, start_y, generator.choice(list(Orientation)))
+            instruction = "".join(generator.choice("LRMMM") for _ in range(30))
+            rover = Rover(name="Rover1", position=start.clone(), land=land)
+            rover.set_instruction(instruction)
+
+            expected = self.final_position(land, start, instruction)
+            searched, simplified = optimize_instruction(rover), optimize_instruction(rover, search=False)
+            self.assertEqual(self.final_position(land, start, searched.instruction), expected)
+            self.assertEqual(self.final_position(land, start, simplified.instruction), expected)
+            self.assertLessEqual(searched.length, simplified.length)
+
+
+class SimplifyInstructionTestCase(TestCase):
+    def test_rotation_runs_collapse(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        self.assertEqual(simplify_instruction("LR", land, 1, 1, 0), "")
+        self.assertEqual(simplify_instruction("RRRR", land, 1, 1, 0), "")
+        self.assertEqual(simplify_instruction("LLL", land, 1, 1, 0), "R")
+        self.assertEqual(simplify_instruction("LLMRRRM", land, 1, 1, 0), "RRMLM")
+
+    def test_blocked_moves_are_dropped_and_rotations_merged(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        self.assertEqual(simplify_instruction("MMMRMMLLM", land, 0, 5, 0), "RMMRRM")
+        self.assertEqual(simplify_instruction("RMMMR", land, 5, 5, 0), "RR")
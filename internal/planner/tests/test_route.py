@@ -0,0 +1,113 @@
+import random
+from collections import deque
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.bitmap_land import ObstacleLand
+from internal.models.land import Land, RectangularLand
+from internal.models.mechanics import LEFT_OF, RIGHT_OF, UNIT_VECTORS
+from internal.planner import plan_route
+from utils import LandError
+
+
+def shortest_length(land, start, target, heading=None, occupied=()):
+    "returns the length of a shortest route found by breadth-first search, or None."
+
+    blocked = set(occupied)
+    first = (start.point.x, start.point.y, start.heading)
+    distances = {first: 0}
+    queue = deque([first])
+    while queue:
+        x, y, state_heading = queue.popleft()
+        if (x, y) == (target.x, target.y) and heading in (None, state_heading):
+            return distances[(x, y, state_heading)]
+
+        dx, dy = UNIT_VECTORS[state_heading]
+        for state in ((x, y, LEFT_OF[state_heading]), (x, y, RIGHT_OF[state_heading]), (x + dx, y + dy, state_heading)):
+            if state[:2] != (x, y) and (not land.is_coordinate_within(*state[:2]) or state[:2] in blocked):
+                continue
+            if state not in distances:
+                distances[state] = distances[(x, y, state_heading)] + 1
+                queue.append(state)
+
+    return None
+
+
+class PlanRouteTestCase(TestCase):
+    def run_route(self, land, start, route):
+        rover = Rover(name="Planner Rover", position=start.clone(), land=land)
+        rover.set_instruction(route)
+        rover.run_instruction()
+        return rover.position
+
+    def test_route_reaches_target_with_fewest_commands(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        start = Position(1, 2, Orientation.N)
+
+        route = plan_route(land, start, Point(4, 0), Orientation.W)
+        self.assertEqual(len(route), shortest_length(land, start, Point(4, 0), 3))
+        self.assertEqual(str(self.run_route(land, start, route)), "4 0 W")
+
+    def test_route_to_own_position_is_empty(self):
+        land = RectangularLand(upper_right_edge=Point(5, 5))
+        self.assertEqual(plan_route(land, Position(1, 2, Orientation.N), Point(1, 2)), "")
+        self.assertEqual(plan_route(land, Position(1, 2, Orientation.N), Point(1, 2), Orientation.S), "RR")
+
+    def test_routes_around_obstacles_and_rovers_are_shortest(self):
+        generator = random.Random(7)
+        for _ in range(30):
+            obstacles = []
+            for _ in range(6):
+                x, y = generator.randint(0, 9), generator.randint(0, 9)
+                obstacles.append((Point(x, y), Point(x + generator.randint(0, 2), y + generator.randint(0, 2))))
+            land = ObstacleLand(upper_right_edge=Point(9, 9), obstacles=obstacles)
+            cells = [(x, y) for x in range(10) for y in range(10) if land.is_coordinate_within(x, y)]
+            (start_x, start_y), (target_x, target_y), *occupied = generator.sample(cells, 6)
+
+            start = Position(start_x, start_y, generator.choice(list(Orientation)))
+            heading = generator.choice([None, *Orientation])
+            route = plan_route(land, start, Point(target_x, target_y), heading, occupied)
+            expected = shortest_length(land, start, Point(target_x, target_y), None if heading is None else heading.value // 90, occupied)
+
+            if expected is None:
+                self.assertIsNone(route)
+                continue
+
+            self.assertEqual(len(route), expected)
+            # rovers are kept out of occupied cells by the land they run on.
+            x, y = start_x, start_y
+            for command in route:
+                if command == "M":
+                    dx, dy = UNIT_VECTORS[start.heading]
+                    x, y = x + dx, y + dy
+                    self.assertNotIn((x, y), occupied)
+                    start.move()
+                else:
+                    start.turn_left() if command == "L" else start.turn_right()
+            self.assertEqual((start.point.x, start.point.y), (target_x, target_y))
+
+    def test_unreachable_target_has_no_route(self):
+        land = ObstacleLand(upper_right_edge=Point(4, 4), obstacles=[(Point(2, 0), Point(2, 4))])
+        self.assertIsNone(plan_route(land, Position(0, 0, Orientation.N), Point(4, 4)))
+        self.assertIsNone(plan_route(land, Position(0, 0, Orientation.N), Point(2, 2)))
+
+    def test_large_plateau(self):
+        land = RectangularLand(upper_right_edge=Point(9999, 9999))
+        route = plan_route(land, Position(0, 0, Orientation.S), Point(9999, 9999))
+        self.assertEqual(len(route), 2 * 9999 + 2)
+
+    def test_search_gives_up_after_max_expansions(self):
+        land = ObstacleLand(upper_right_edge=Point(9999, 9999), obstacles=[(Point(0, 5000), Point(9990, 5001))])
+        self.assertIsNone(plan_route(land, Position(0, 0, Orientation.N), Point(0, 9999), max_expansions=20000))
+
+        land = ObstacleLand(upper_right_edge=Point(99, 99), obstacles=[(Point(0, 50), Point(90, 51))])
+        route = plan_route(land, Position(0, 0, Orientation.N), Point(0, 99), max_expansions=None)
+        self.assertEqual(len(route), 99 + 2 * 91 + 3)
+        self.assertIsNone(plan_route(land, Position(0, 0, Orientation.N), Point(0, 99), max_expansions=100))
+
+    def test_land_without_bounds_raises_error(self):
+        class DiagonalLand(Land):
+            def is_address_within(self, address: Point) -> bool:
+                return address.x == address.y
+
+        with self.assertRaises(LandError):
+            plan_route(DiagonalLand(), Position(0, 0, Orientation.N), Point(2, 2))
@@ -0,0 +1 @@
+from .server import END_OF_MESSAGE, MissionServer, request_mission, run_missions, serve
\ No newline at end of file
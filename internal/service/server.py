@@ -0,0 +1,250 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional, Tuple
+from internal.parser import InputParser
+from utils import InputError, format_error_message
+
+
+# a mission payload is sent as input lines followed by this line. results are returned the same way.
+END_OF_MESSAGE = "END"
+
+# longest mission line the server reads, in bytes. longer lines are answered with an error.
+DEFAULT_MAX_LINE_LENGTH = 1 << 26
+
+Mission = List[str]
+
+
+def run_missions(missions: List[Mission]) -> List[List[str]]:
+    """ Runs a batch of missions and returns the result lines of each one.
+
+        A mission that fails, for any reason, returns its error message as its only line and does not stop the others.
+    """
+
+    results = []
+    for mission in missions:
+        try:
+            rovers = InputParser(inputs=mission).rovers
+            lines = []
+            for rover in rovers:
+                rover.run_instruction()
+                lines.append(f"{rover.name}:{rover.position}")
+        except Exception as error:
+            lines = [format_error_message(str(error))]
+        results.append(lines)
+
+    return results
+
+
+class MissionServer:
+    """ Long-running asyncio server that runs missions sent over a local TCP or Unix socket.
+
+        Missions received from every connection are put on a bounded queue and run in batches,
+        away from the event loop. When the queue is full, connections wait before their next
+        mission is read, which pushes back on clients.
+
+        Main Attributes:
+            batch_size: largest number of missions run together.
+            batch_delay: seconds to wait for more missions before running a batch that is not full.
+            queue_size: number of missions that may wait to run.
+            max_connections: number of connections served at the same time.
+            max_line_length: longest mission line read, in bytes. A mission with a longer line gets an error.
+            executor: executor batches run on. The event loop's default executor when None.
+
+        Main Methods:
+            start_tcp: starts serving on a TCP host and port.
+            start_unix: starts serving on a Unix socket path.
+            close: stops serving and waits for queued missions to finish.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        batch_delay: float = 0.002,
+        queue_size: int = 256,
+        max_connections: int = 128,
+        max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
+        executor: Optional[Executor] = None
+    ) -> None:
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queue_size = queue_size
+        self.max_connections = max_connections
+        self.max_line_length = max_line_length
+        self.executor = executor
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._connections: Optional[asyncio.Semaphore] = None
+        self._batcher: Optional[asyncio.Task] = None
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        self._start()
+        self._server = await asyncio.start_server(self._handle, host, port, limit=self.max_line_length)
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._start()
+        self._server = await asyncio.start_unix_server(self._handle, path, limit=self.max_line_length)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._queue is not None:
+            await self._queue.join()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    def _start(self):
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._connections = asyncio.Semaphore(self.max_connections)
+        self._batcher = asyncio.ensure_future(self._run_batches())
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async with self._connections:
+            try:
+                while True:
+                    try:
+                        mission = await read_message(reader)
+                    except InputError as error:
+                        await write_message(writer, [format_error_message(str(error))])
+                        continue
+                    if mission is None:
+                        break
+
+                    result = asyncio.get_running_loop().create_future()
+                    await self._queue.put((mission, result))
+                    await write_message(writer, await result)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+            finally:
+                writer.close()
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[Mission, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0 and self._queue.empty():
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), max(timeout, 0)))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await loop.run_in_executor(self.executor, run_missions, [mission for mission, _ in batch])
+                for (_, result), lines in zip(batch, results):
+                    if not result.cancelled():
+                        result.set_result(lines)
+            except Exception as error:
+                for _, result in batch:
+                    if not result.done():
+                        result.set_exception(error)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[List[str]]:
+    """ Reads lines up to the end of message line. returns None when the connection closes first.
+
+        A line longer than the reader's limit, or not UTF-8 encoded, is skipped, and InputError is raised
+        once the rest of its message is read, so that the next message starts on the right line.
+    """
+
+    lines = []
+    error = None
+    while True:
+        try:
+            line = await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as incomplete:
+            line = incomplete.partial
+        except asyncio.LimitOverrunError:
+            if not await _skip_line(reader):
+                return None
+            error = error or InputError("mission line is longer than the server reads")
+            continue
+
+        if not line:
+            return None
+
+        try:
+            line = line.decode().rstrip("\r\n")
+        except UnicodeDecodeError:
+            error = error or InputError("mission lines must be UTF-8 encoded")
+            continue
+
+        if line == END_OF_MESSAGE:
+            if error is not None:
+                raise error
+            return lines
+        if line.strip():
+            lines.append(line)
+
+
+async def _skip_line(reader: asyncio.StreamReader) -> bool:
+    "drops the rest of a line a buffer at a time. returns False when the connection closes first."
+
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return True
+        except asyncio.LimitOverrunError as overrun:
+            await reader.readexactly(overrun.consumed)
+        except asyncio.IncompleteReadError:
+            return False
+
+
+async def write_message(writer: asyncio.StreamWriter, lines: List[str]):
+    writer.write("".join(f"{line}\n" for line in [*lines, END_OF_MESSAGE]).encode())
+    await writer.drain()
+
+
+async def request_mission(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, mission: Mission) -> List[str]:
+    "sends a mission over an open connection to a mission server and returns its result lines."
+
+    await write_message(writer, mission)
+    lines = await read_message(reader)
+    if lines is None:
+        raise ConnectionError("mission server closed the connection")
+    return lines
+
+
+def serve(address: str, **server_options):
+    """ Runs a mission server until interrupted.
+
+        @param
+            address: 'HOST:PORT' for a TCP socket or 'unix:PATH' for a Unix socket.
+
+        Raises InputError if a TCP address has no port between 0 and 65535.
+    """
+
+    unix = address.startswith("unix:")
+    if not unix:
+        host, _, port = address.rpartition(":")
+        if not (port.isascii() and port.isdigit() and int(port) <= 65535):
+            raise InputError(f"address must be HOST:PORT, with a port from 0 to 65535, or unix:PATH. got {address}")
+
+    async def main():
+        server = MissionServer(**server_options)
+        if unix:
+            listener = await server.start_unix(address[len("unix:"):])
+        else:
+            listener = await server.start_tcp(host or "127.0.0.1", int(port))
+
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+from internal.service import MissionServer, request_mission, run_missions, serve
+from internal.service.server import read_message
+from utils import InputError
+
+
+MISSION = [
+    "Plateau:5 5",
+    "Rover1 Landing:1 2 N",
+    "Rover1 Instructions:LMLMLMLMM",
+    "Rover2 Landing:3 3 E",
+    "Rover2 Instructions:MMRMMRMRRM",
+]
+
+
+class TestRunMissions(TestCase):
+    def test_runs_each_mission(self):
+        results = run_missions([MISSION, MISSION[:3]])
+        self.assertEqual(results, [["Rover1:1 3 N", "Rover2:5 1 E"], ["Rover1:1 3 N"]])
+
+    def test_failed_mission_does_not_stop_others(self):
+        results = run_missions([["Plateau:5 5", "Rover1 Landing:9 9 N", "Rover1 Instructions:LM"], MISSION[:3]])
+        self.assertEqual(len(results[0]), 1)
+        self.assertTrue(results[0][0].startswith("error occured"))
+        self.assertEqual(results[1], ["Rover1:1 3 N"])
+
+    def test_unexpected_error_does_not_stop_others(self):
+        results = run_missions([["Plateau:5 5", None], MISSION[:3]])
+        self.assertEqual(len(results[0]), 1)
+        self.assertTrue(results[0][0].startswith("error occured"))
+        self.assertEqual(results[1], ["Rover1:1 3 N"])
+
+
+class TestServe(TestCase):
+    def test_rejects_invalid_ports(self):
+        for address in ("127.0.0.1:http", "127.0.0.1:70000", "127.0.0.1:-1", "127.0.0.1", "127.0.0.1:"):
+            with self.assertRaises(InputError):
+                serve(address)
+
+
+class TestMissionServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = MissionServer(batch_size=8, queue_size=4, max_connections=16)
+        listener = await self.server.start_tcp("127.0.0.1", 0)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def request(self, missions):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            return [await request_mission(reader, writer, mission) for mission in missions]
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_runs_several_missions_on_one_connection(self):
+        results = await self.request([MISSION, MISSION[:3]])
+        self.assertEqual(results, [["Rover1:1 3 N", "Rover2:5 1 E"], ["Rover1:1 3 N"]])
+
+    async def test_serves_concurrent_clients(self):
+        results = await asyncio.gather(*(self.request([MISSION]) for _ in range(32)))
+        self.assertEqual(results, [[["Rover1:1 3 N", "Rover2:5 1 E"]]] * 32)
+
+    async def test_reports_errors_to_client(self):
+        results = await self.request([["Plateau:5 5", "Rover1 Landing:1:2 N"], MISSION[:3]])
+        self.assertTrue(results[0][0].startswith("error occured"))
+        self.assertEqual(results[1], ["Rover1:1 3 N"])
+
+
+    async def test_reads_lines_longer_than_64_kib(self):
+        mission = [*MISSION[:2], "Rover1 Instructions:" + "LR" * 40000 + "LMLMLMLMM"]
+        results = await self.request([mission])
+        self.assertEqual(results, [["Rover1:1 3 N"]])
+
+    async def test_answers_bad_lines_with_errors_and_keeps_connection(self):
+        server = MissionServer(max_line_length=1024)
+        listener = await server.start_tcp("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+            too_long = [*MISSION[:2], "Rover1 Instructions:" + "M" * 4096]
+            self.assertTrue((await request_mission(reader, writer, too_long))[0].startswith("error occured"))
+
+            writer.write(b"Plateau:5 5\nRover1 Landing:1 2 N\xff\nEND\n")
+            self.assertTrue((await read_message(reader))[0].startswith("error occured"))
+
+            self.assertEqual(await request_mission(reader, writer, MISSION[:3]), ["Rover1:1 3 N"])
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            await server.close()
+
+
+class TestUnixMissionServer(IsolatedAsyncioTestCase):
+    async def test_serves_on_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rovers.sock")
+            server = MissionServer()
+            await server.start_unix(path)
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+                self.assertEqual(await request_mission(reader, writer, MISSION[:3]), ["Rover1:1 3 N"])
+                writer.close()
+                await writer.wait_closed()
+            finally:
+                await server.close()
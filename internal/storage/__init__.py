@@ -0,0 +1,4 @@
+from .cache import CacheStats, ResultCache, cache_key, run_cached
+from .checkpoint import Checkpoint, CheckpointStore, instruction_digest, resume_rover, run_from_checkpoints
+from .step_index import StepIndex
+from .trajectory import Trajectory, TrajectoryRecorder, run_recorded
@@ -0,0 +1,227 @@
+import sqlite3
+from hashlib import sha256
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from internal.models import Position, Rover
+from internal.models.land import RectangularLand
+from internal.models.mechanics import HEADINGS
+from internal.models.program import Instruction
+
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    instruction_digest BLOB NOT NULL,
+    landing_x INTEGER NOT NULL,
+    landing_y INTEGER NOT NULL,
+    landing_heading INTEGER NOT NULL,
+    lower_left_x INTEGER NOT NULL,
+    lower_left_y INTEGER NOT NULL,
+    upper_right_x INTEGER NOT NULL,
+    upper_right_y INTEGER NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    heading INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (
+        instruction_digest, landing_x, landing_y, landing_heading,
+        lower_left_x, lower_left_y, upper_right_x, upper_right_y
+    )
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+_KEY_COLUMNS = (
+    "instruction_digest = ? AND landing_x = ? AND landing_y = ? AND landing_heading = ? AND "
+    "lower_left_x = ? AND lower_left_y = ? AND upper_right_x = ? AND upper_right_y = ?"
+)
+
+# instruction digest, landing (x, y, heading) and plateau bounds (lower left x, y, upper right x, y).
+CacheKey = Tuple[bytes, int, int, int, int, int, int, int]
+
+
+class CacheStats:
+    """ Counts how rovers were served by a result cache.
+
+        Main Attributes:
+            hits: rovers whose final position was found in the cache.
+            misses: rovers that had to run and whose result was added to the cache.
+            bypassed: rovers on lands the cache cannot key, which ran without it.
+            evictions: results removed to keep the cache within its size.
+    """
+
+    __slots__ = ("hits", "misses", "bypassed", "evictions")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_ratio:.1%} hit ratio), {self.evictions} evictions"
+
+
+def _instruction_hash(instruction: Instruction) -> bytes:
+    if isinstance(instruction, str):
+        instruction = instruction.encode()
+    return sha256(instruction).digest()
+
+
+def cache_key(rover: Rover) -> Optional[CacheKey]:
+    """ Returns the key of a rover's result: its instruction's sha256, its landing position and its plateau's bounds.
+
+        Only rectangular lands are fully described by their bounds, so rovers on other lands have no key.
+    """
+
+    land = rover.land
+    if not isinstance(land, RectangularLand):
+        return None
+
+    lower_left, upper_right = land.bounds
+    point = rover.position.point
+    return (
+        _instruction_hash(rover.instruction), point.x, point.y, rover.position.heading,
+        lower_left.x, lower_left.y, upper_right.x, upper_right.y
+    )
+
+
+class ResultCache:
+    """ Sqlite cache of rover final positions with least recently used eviction.
+
+        A result is looked up by `cache_key`, so the same rover on the same plateau gets its final
+        position back without running, whatever mission it is part of. Each result is one fixed-size row,
+        and the least recently used ones are evicted once there are more than `max_entries`.
+        Use the cache as a context manager to write pending updates and close it when done.
+
+        Main Attributes:
+            max_entries: number of results kept.
+            stats: hit and miss counts of this cache since it was opened.
+
+        Main Methods:
+            get: returns the cached final (x, y, heading) of a key, or None.
+            put: adds the final (x, y, heading) of a key.
+            flush: writes pending results and recency updates, then evicts old results.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        self._clock, self._entries = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0), COUNT(*) FROM results"
+        ).fetchone()
+        self._new_results: Dict[CacheKey, Tuple[int, int, int, int]] = {}
+        self._used_keys: List[Tuple[int, CacheKey]] = []
+
+    def __len__(self) -> int:
+        "returns the number of results stored, pending ones included."
+        return self._entries + len(self._new_results)
+
+    def get(self, key: CacheKey) -> Optional[Tuple[int, int, int]]:
+        pending = self._new_results.get(key)
+        if pending is not None:
+            self.stats.hits += 1
+            return pending[:3]
+
+        row = self._connection.execute(f"SELECT x, y, heading FROM results WHERE {_KEY_COLUMNS}", key).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._clock += 1
+        self._used_keys.append((self._clock, key))
+        return row
+
+    def put(self, key: CacheKey, position: Tuple[int, int, int]):
+        "adds a result. it is written with the next flush."
+
+        self._clock += 1
+        self._new_results[key] = (*position, self._clock)
+
+    def flush(self):
+        "writes pending results and recency updates in one transaction, then evicts results over `max_entries`."
+
+        with self._connection:
+            self._connection.executemany(
+                f"UPDATE results SET last_used = ? WHERE {_KEY_COLUMNS}",
+                ((clock, *key) for clock, key in self._used_keys)
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((*key, *result) for key, result in self._new_results.items())
+            )
+            self._entries += len(self._new_results)
+            self._used_keys, self._new_results = [], {}
+
+            if self._entries > self.max_entries:
+                # results replaced by the same key were counted twice, so count again before evicting.
+                self._entries = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                if self._entries > self.max_entries:
+                    self._evict()
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _evict(self):
+        "deletes the least recently used results over `max_entries`."
+
+        excess = self._entries - self.max_entries
+        cursor = self._connection.execute(
+            "DELETE FROM results WHERE last_used <= "
+            "(SELECT last_used FROM results ORDER BY last_used LIMIT 1 OFFSET ?)",
+            (excess - 1,)
+        )
+        self.stats.evictions += cursor.rowcount
+        self._entries -= cursor.rowcount
+
+
+def run_cached(cache: ResultCache, rovers: Iterable[Rover], flush_every: int = 1024) -> Iterator[Rover]:
+    """ Runs rovers through a result cache, yielding each one at its final position.
+
+        A rover found in the cache is moved to its cached final position without running its instruction.
+        Other rovers run and their results are added to the cache, which is flushed every `flush_every` rovers.
+    """
+
+    pending = 0
+    for rover in rovers:
+        key = cache_key(rover)
+        if key is None:
+            cache.stats.bypassed += 1
+            rover.run_instruction()
+            yield rover
+            continue
+
+        cached = cache.get(key)
+        if cached is None:
+            rover.run_instruction()
+            point = rover.position.point
+            cache.put(key, (point.x, point.y, rover.position.heading))
+        else:
+            x, y, heading = cached
+            rover.position = Position(x, y, HEADINGS[heading])
+            rover.reset_instruction()
+
+        pending += 1
+        if pending >= flush_every:
+            cache.flush()
+            pending = 0
+
+        yield rover
+
+    cache.flush()
@@ -0,0 +1,203 @@
+import sqlite3
+from hashlib import blake2b
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from internal.models import Position, Rover
+from internal.models.mechanics import HEADINGS
+from internal.models.program import Instruction, is_encoded
+
+
+DIGEST_SIZE = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    mission TEXT NOT NULL,
+    rover TEXT NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    heading INTEGER NOT NULL,
+    landing_x INTEGER NOT NULL,
+    landing_y INTEGER NOT NULL,
+    landing_heading INTEGER NOT NULL,
+    instruction_length INTEGER NOT NULL,
+    instruction_digest BLOB NOT NULL,
+    PRIMARY KEY (mission, rover)
+) WITHOUT ROWID
+"""
+
+
+class Checkpoint(NamedTuple):
+    """ Saved state of a rover after running its instruction.
+
+        Main Attributes:
+            position: final position of the rover as (x, y, heading).
+            landing: landing position the instruction was run from, as (x, y, heading).
+            instruction_length: length of the instruction that was run.
+            instruction_digest: digest of the instruction that was run. See `instruction_digest`.
+    """
+    position: Tuple[int, int, int]
+    landing: Tuple[int, int, int]
+    instruction_length: int
+    instruction_digest: bytes
+
+
+def instruction_digest(instruction: Instruction) -> bytes:
+    "returns a short digest identifying an instruction, whatever buffer type holds it."
+
+    if isinstance(instruction, str):
+        instruction = instruction.encode()
+    return blake2b(instruction, digest_size=DIGEST_SIZE).digest()
+
+
+def _starts_with_digit(instruction: Instruction) -> bool:
+    first = instruction[:1]
+    if isinstance(first, str):
+        first = first.encode()
+    return bytes(first).isdigit()
+
+
+def _state(position: Position) -> Tuple[int, int, int]:
+    return position.point.x, position.point.y, position.heading
+
+
+class CheckpointStore:
+    """ Sqlite store of rover checkpoints, keyed by mission and rover name.
+
+        Each checkpoint is one fixed-size row of integers and a 16-byte digest, however long the
+        instruction that led to it. Use the store as a context manager to close it when done.
+
+        Main Methods:
+            load: returns the checkpoint of a rover in a mission, or None.
+            load_mission: returns the checkpoints of every rover in a mission.
+            save: saves the checkpoints of several rovers in one transaction.
+            delete_mission: deletes the checkpoints of a mission.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def load(self, mission: str, rover_name: str) -> Optional[Checkpoint]:
+        row = self._connection.execute(
+            "SELECT x, y, heading, landing_x, landing_y, landing_heading, instruction_length, instruction_digest "
+            "FROM checkpoints WHERE mission = ? AND rover = ?",
+            (mission, rover_name)
+        ).fetchone()
+        return None if row is None else self._to_checkpoint(row)
+
+    def load_mission(self, mission: str) -> Dict[str, Checkpoint]:
+        rows = self._connection.execute(
+            "SELECT rover, x, y, heading, landing_x, landing_y, landing_heading, instruction_length, instruction_digest "
+            "FROM checkpoints WHERE mission = ?",
+            (mission,)
+        )
+        return {row[0]: self._to_checkpoint(row[1:]) for row in rows}
+
+    def save(self, mission: str, checkpoints: Iterable[Tuple[str, Checkpoint]]):
+        "saves (rover name, checkpoint) pairs, replacing earlier checkpoints of the same rovers."
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (mission, name, *checkpoint.position, *checkpoint.landing,
+                     checkpoint.instruction_length, checkpoint.instruction_digest)
+                    for name, checkpoint in checkpoints
+                )
+            )
+
+    def delete_mission(self, mission: str):
+        with self._connection:
+            self._connection.execute("DELETE FROM checkpoints WHERE mission = ?", (mission,))
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _to_checkpoint(row) -> Checkpoint:
+        x, y, heading, landing_x, landing_y, landing_heading, length, digest = row
+        return Checkpoint((x, y, heading), (landing_x, landing_y, landing_heading), length, bytes(digest))
+
+
+def resume_rover(rover: Rover, checkpoint: Optional[Checkpoint]) -> bool:
+    """ Moves a rover to its checkpoint and trims its instruction to the part not run yet.
+
+        The checkpoint is used only if it was made from the rover's current landing position and
+        its instruction is a prefix of the rover's instruction, ending between two commands and run-length
+        encoded only if the rover's whole instruction is.
+        Returns True if the rover was resumed, False if its whole instruction still has to run.
+    """
+
+    instruction = rover.instruction
+    if checkpoint is None or checkpoint.landing != _state(rover.position):
+        return False
+
+    length = checkpoint.instruction_length
+    if length > len(instruction):
+        return False
+
+    prefix, suffix = instruction[:length], instruction[length:]
+    if _starts_with_digit(suffix):
+        # the checkpoint ends inside a run-length encoded run, whose count has since changed.
+        return False
+    if is_encoded(prefix) != is_encoded(instruction):
+        # whether an instruction is run-length encoded depends on all of it, so the prefix ran under other rules.
+        return False
+    if instruction_digest(prefix) != checkpoint.instruction_digest:
+        return False
+
+    x, y, heading = checkpoint.position
+    rover.position = Position(x, y, HEADINGS[heading])
+    rover.set_instruction(suffix)
+    return True
+
+
+def run_from_checkpoints(
+    store: CheckpointStore,
+    mission: str,
+    rovers: Iterable[Rover],
+    resume: bool = True,
+    save_every: int = 1024
+) -> Iterator[Rover]:
+    """ Runs rovers, starting each one from its checkpoint when it has a usable one, and saves new checkpoints.
+
+        Only the part of an instruction added since its checkpoint runs, so running a mission again
+        after appending instructions costs the size of what was appended. Rovers are yielded after
+        they run, and checkpoints are saved in batches of `save_every` rovers. The last batch is saved
+        even when a later rover fails, so every rover yielded keeps its checkpoint.
+
+        @params
+            store: checkpoint store to load checkpoints from and save them to.
+            mission: name of the mission the rovers belong to.
+            rovers: rovers at their landing positions, with their whole instructions set.
+            resume: when False, checkpoints are not loaded and every rover runs its whole instruction.
+    """
+
+    pending: List[Tuple[str, Checkpoint]] = []
+
+    try:
+        for rover in rovers:
+            instruction = rover.instruction
+            landing = _state(rover.position)
+            if resume:
+                resume_rover(rover, store.load(mission, rover.name))
+
+            rover.run_instruction()
+            pending.append((rover.name, Checkpoint(
+                _state(rover.position), landing, len(instruction), instruction_digest(instruction)
+            )))
+            if len(pending) >= save_every:
+                store.save(mission, pending)
+                pending = []
+
+            yield rover
+    finally:
+        # rovers already yielded keep their checkpoints when a later rover fails or the caller stops early.
+        store.save(mission, pending)
@@ -0,0 +1,139 @@
+""" Index answering where a rover is after any number of instruction steps, without replaying the instruction.
+
+    An instruction is a sequence of runs of one repeated command. Within a run the state is a closed form
+    of the state before it: a rotation run turns one quarter per step, and a move run moves one unit per step
+    until it reaches the distance the land lets it go. The index is a prefix table holding, for every run,
+    the step it starts at, the exact state before it and how far it can move. Edge clamping is resolved
+    once when the table is built, so a query is a binary search over runs however often the rover
+    runs into the land's edge.
+
+    Each run takes 34 bytes, kept in arrays:
+
+        starts    int64   step the run starts at
+        xs, ys    int64   coordinates before the run
+        headings  int8    heading before the run (quarter turns right of north)
+        kinds     int8    command of the run: 0 for L, 1 for R, 2 for M
+        limits    int64   moves the land lets a move run make. 0 for rotation runs
+"""
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Tuple
+from internal.models import Rover
+from internal.models.mechanics import UNIT_VECTORS
+from internal.models.program import iter_command_runs
+
+
+State = Tuple[int, int, int]
+
+_KINDS = {"L": 0, "R": 1, "M": 2}
+_MOVE = 2
+
+
+class StepIndex:
+    """ Prefix table of a rover's instruction runs, built for its landing position and land.
+
+        Main Methods:
+            build: builds the index of a rover's instruction. The rover is left as it is.
+            position_at: returns the state after a number of steps, in O(log n) for n runs.
+            positions_at: returns the states after many numbers of steps at once, as NumPy arrays.
+    """
+
+    __slots__ = ("starts", "xs", "ys", "headings", "kinds", "limits", "landing", "_length")
+
+    def __init__(self, landing: State) -> None:
+        self.starts = array("q")
+        self.xs = array("q")
+        self.ys = array("q")
+        self.headings = array("b")
+        self.kinds = array("b")
+        self.limits = array("q")
+        self.landing = landing
+        self._length = 0
+
+    @classmethod
+    def build(cls, rover: Rover) -> "StepIndex":
+        "runs a rover's instruction one run at a time, keeping the state before every run."
+
+        land = rover.land
+        point = rover.position.point
+        x, y, heading = point.x, point.y, rover.position.heading
+        index = cls((x, y, heading))
+        starts, xs, ys, headings, kinds, limits = (
+            index.starts, index.xs, index.ys, index.headings, index.kinds, index.limits
+        )
+
+        step = 0
+        for command, count in iter_command_runs(rover.instruction):
+            starts.append(step)
+            xs.append(x)
+            ys.append(y)
+            headings.append(heading)
+            kind = _KINDS[command]
+            kinds.append(kind)
+
+            if kind == _MOVE:
+                dx, dy = UNIT_VECTORS[heading]
+                new_x, new_y = land.traverse(x, y, dx, dy, count)
+                limits.append(abs(new_x - x) + abs(new_y - y))
+                x, y = new_x, new_y
+            else:
+                limits.append(0)
+                heading = (heading + (count if kind else -count)) % 4
+
+            step += count
+
+        index._length = step
+        return index
+
+    def __len__(self) -> int:
+        "returns the number of steps in the instruction."
+        return self._length
+
+    def position_at(self, step: int) -> State:
+        "returns (x, y, heading) after `step` steps. step 0 is the landing position."
+
+        if not 0 <= step <= self._length:
+            raise IndexError(f"step must be between 0 and {self._length}. got {step}")
+        if not self.starts:
+            return self.landing
+
+        run = bisect_right(self.starts, step) - 1
+        offset = step - self.starts[run]
+        x, y, heading, kind = self.xs[run], self.ys[run], self.headings[run], self.kinds[run]
+
+        if kind == _MOVE:
+            moved = min(offset, self.limits[run])
+            dx, dy = UNIT_VECTORS[heading]
+            return x + dx * moved, y + dy * moved, heading
+
+        return x, y, (heading + (offset if kind else -offset)) % 4
+
+    def positions_at(self, steps: Iterable[int]):
+        """ Returns (xs, ys, headings) NumPy arrays of the states after each number of steps.
+
+            Every query is answered at once: the runs are found with one `searchsorted` and the
+            states within them are computed column-wise.
+        """
+
+        import numpy as np
+
+        steps = np.asarray(steps, dtype=np.int64)
+        if steps.size and (steps.min() < 0 or steps.max() > self._length):
+            raise IndexError(f"steps must be between 0 and {self._length}")
+        if not self.starts:
+            x, y, heading = self.landing
+            return np.full(steps.shape, x), np.full(steps.shape, y), np.full(steps.shape, heading)
+
+        starts = np.frombuffer(self.starts, dtype=np.int64)
+        runs = np.searchsorted(starts, steps, side="right") - 1
+        offsets = steps - starts[runs]
+        kinds = np.frombuffer(self.kinds, dtype=np.int8)[runs]
+        headings = np.frombuffer(self.headings, dtype=np.int8)[runs].astype(np.int64)
+
+        moved = np.where(kinds == _MOVE, np.minimum(offsets, np.frombuffer(self.limits, dtype=np.int64)[runs]), 0)
+        unit_vectors = np.array(UNIT_VECTORS, dtype=np.int64)
+        xs = np.frombuffer(self.xs, dtype=np.int64)[runs] + unit_vectors[headings, 0] * moved
+        ys = np.frombuffer(self.ys, dtype=np.int64)[runs] + unit_vectors[headings, 1] * moved
+        turns = np.array((-1, 1, 0), dtype=np.int64)[kinds]
+
+        return xs, ys, (headings + turns * offsets) % 4
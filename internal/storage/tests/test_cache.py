@@ -0,0 +1,80 @@
+import os
+import tempfile
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.bitmap_land import ObstacleLand
+from internal.models.land import RectangularLand
+from internal.storage import ResultCache, cache_key, run_cached
+
+
+class ResultCacheTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "results.db")
+        self.land = RectangularLand(upper_right_edge=Point(x=5, y=5))
+
+    def open_cache(self, max_entries=100):
+        cache = ResultCache(self.path, max_entries=max_entries)
+        self.addCleanup(cache.close)
+        return cache
+
+    def build_rover(self, name, instruction, land=None, position=None):
+        rover = Rover(name=name, position=position or Position(1, 2, Orientation.N), land=land or self.land)
+        rover.set_instruction(instruction)
+        return rover
+
+    def run_mission(self, cache, rovers):
+        return [f"{rover.name}:{rover.position}" for rover in run_cached(cache, rovers)]
+
+    def test_repeated_rovers_are_served_from_cache(self):
+        rovers = [self.build_rover("Rover1", "LMLMLMLMM"), self.build_rover("Rover2", "MMRMMRMRRM")]
+        with ResultCache(self.path) as cache:
+            self.assertEqual(self.run_mission(cache, rovers), ["Rover1:1 3 N", "Rover2:3 4 N"])
+            self.assertEqual((cache.stats.hits, cache.stats.misses), (0, 2))
+
+        cache = self.open_cache()
+        rovers = [self.build_rover("Other", "LMLMLMLMM"), self.build_rover("Rover2", "MMRMMRMRRM")]
+        self.assertEqual(self.run_mission(cache, rovers), ["Other:1 3 N", "Rover2:3 4 N"])
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 0))
+        self.assertEqual(cache.stats.hit_ratio, 1.0)
+        self.assertEqual(rovers[0].instruction, "")
+
+    def test_key_covers_instruction_landing_and_plateau(self):
+        rover = self.build_rover("Rover1", "MM")
+        key = cache_key(rover)
+        self.assertNotEqual(key, cache_key(self.build_rover("Rover1", "MMM")))
+        self.assertNotEqual(key, cache_key(self.build_rover("Rover1", "MM", position=Position(1, 2, Orientation.E))))
+        self.assertNotEqual(key, cache_key(self.build_rover("Rover1", "MM", land=RectangularLand(Point(x=9, y=9)))))
+        self.assertEqual(key, cache_key(self.build_rover("Rover2", "MM")))
+
+        cache = self.open_cache()
+        self.run_mission(cache, [rover])
+        # the same instruction on a smaller plateau stops at its edge instead.
+        small = self.build_rover("Rover1", "MM", land=RectangularLand(Point(x=3, y=3)))
+        self.assertEqual(self.run_mission(cache, [small]), ["Rover1:1 3 N"])
+        self.assertEqual(cache.stats.misses, 2)
+
+    def test_duplicate_rovers_in_one_run_hit_pending_results(self):
+        cache = self.open_cache()
+        rovers = [self.build_rover(f"Rover{index}", "MRM") for index in range(3)]
+        self.assertEqual(self.run_mission(cache, rovers), ["Rover0:2 3 E", "Rover1:2 3 E", "Rover2:2 3 E"])
+        self.assertEqual((cache.stats.hits, cache.stats.misses, len(cache)), (2, 1, 1))
+
+    def test_least_recently_used_results_are_evicted(self):
+        cache = self.open_cache(max_entries=2)
+        self.run_mission(cache, [self.build_rover("Rover1", "M"), self.build_rover("Rover2", "MM")])
+        # using Rover1's result makes Rover2's the least recently used one.
+        self.run_mission(cache, [self.build_rover("Rover1", "M")])
+        self.run_mission(cache, [self.build_rover("Rover3", "MMM")])
+
+        self.assertEqual((len(cache), cache.stats.evictions), (2, 1))
+        self.assertIsNotNone(cache.get(cache_key(self.build_rover("Rover1", "M"))))
+        self.assertIsNone(cache.get(cache_key(self.build_rover("Rover2", "MM"))))
+        self.assertIsNotNone(cache.get(cache_key(self.build_rover("Rover3", "MMM"))))
+
+    def test_rovers_on_other_lands_bypass_cache(self):
+        land = ObstacleLand(upper_right_edge=Point(5, 5), obstacles=[(Point(1, 4), Point(1, 4))])
+        cache = self.open_cache()
+        self.assertEqual(self.run_mission(cache, [self.build_rover("Rover1", "MMM", land=land)]), ["Rover1:1 3 N"])
+        self.assertEqual((cache.stats.bypassed, cache.stats.misses, len(cache)), (1, 0, 0))
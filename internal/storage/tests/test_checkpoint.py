@@ -0,0 +1,73 @@
+import os
+import tempfile
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.land import RectangularLand
+from internal.storage import CheckpointStore, run_from_checkpoints
+from utils import RoverError
+
+
+class CheckpointStoreTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = CheckpointStore(os.path.join(directory.name, "checkpoints.db"))
+        self.addCleanup(self.store.close)
+        self.land = RectangularLand(upper_right_edge=Point(x=5, y=5))
+
+    def build_rover(self, name: str, instruction: str) -> Rover:
+        rover = Rover(name=name, position=Position(1, 2, Orientation.N), land=self.land)
+        rover.set_instruction(instruction)
+        return rover
+
+    def run_mission(self, mission, rovers, resume=True):
+        return [f"{rover.name}:{rover.position}" for rover in run_from_checkpoints(self.store, mission, rovers, resume)]
+
+    def run_in_full(self, rovers):
+        for rover in rovers:
+            rover.run_instruction()
+        return [f"{rover.name}:{rover.position}" for rover in rovers]
+
+    def test_checkpoints_are_saved_per_mission_and_rover(self):
+        self.run_mission("mission", [self.build_rover("Rover1", "LMLMLMLMM")])
+        self.assertEqual(self.store.load("mission", "Rover1").position, (1, 3, 0))
+        self.assertIsNone(self.store.load("other mission", "Rover1"))
+        self.assertEqual(list(self.store.load_mission("mission")), ["Rover1"])
+
+    def test_appended_instructions_run_from_checkpoint(self):
+        self.run_mission("mission", [self.build_rover("Rover1", "LMLMLMLMM"), self.build_rover("Rover2", "M3R")])
+
+        rovers = [self.build_rover("Rover1", "LMLMLMLMMRMM"), self.build_rover("Rover2", "M3RM2")]
+        expected = self.run_in_full([rover.clone() for rover in rovers])
+        self.assertEqual(self.run_mission("mission", rovers), expected)
+        self.assertEqual(self.store.load("mission", "Rover1").instruction_length, 12)
+
+    def test_changed_instructions_run_in_full(self):
+        self.run_mission("mission", [self.build_rover("Rover1", "MMR"), self.build_rover("Rover2", "M3")])
+
+        # Rover1's history changed and Rover2's last run got longer, so neither checkpoint can be used.
+        rovers = [self.build_rover("Rover1", "MLRM"), self.build_rover("Rover2", "M30")]
+        expected = self.run_in_full([rover.clone() for rover in rovers])
+        self.assertEqual(self.run_mission("mission", rovers), expected)
+
+    def test_instructions_encoded_differently_from_checkpoint_run_in_full(self):
+        self.run_mission("mission", [self.build_rover("Rover1", "M3")])
+
+        # "M3 M" is not a valid encoding, so it is a plain instruction of two moves.
+        rovers = [self.build_rover("Rover1", "M3 M")]
+        expected = self.run_in_full([rover.clone() for rover in rovers])
+        self.assertEqual(self.run_mission("mission", rovers), expected)
+        self.assertEqual(expected, ["Rover1:1 4 N"])
+
+    def test_checkpoints_are_not_loaded_without_resume(self):
+        self.run_mission("mission", [self.build_rover("Rover1", "MM")])
+        self.assertEqual(self.run_mission("mission", [self.build_rover("Rover1", "MM")], resume=False), ["Rover1:1 4 N"])
+
+    def test_checkpoints_of_run_rovers_are_saved_when_a_later_rover_fails(self):
+        def rovers():
+            yield self.build_rover("Rover1", "MM")
+            raise RoverError("invalid rover input. got Rover2")
+
+        with self.assertRaises(RoverError):
+            self.run_mission("mission", rovers())
+        self.assertEqual(self.store.load("mission", "Rover1").position, (1, 4, 0))
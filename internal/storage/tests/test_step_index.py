@@ -0,0 +1,77 @@
+import random
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.bitmap_land import ObstacleLand
+from internal.models.land import RectangularLand
+from internal.models.program import expand_instruction
+from internal.storage import StepIndex
+
+
+class StepIndexTestCase(TestCase):
+    def setUp(self):
+        self.land = RectangularLand(upper_right_edge=Point(x=6, y=6))
+        generator = random.Random(23)
+        self.instruction = "".join(generator.choice("LRMMM") for _ in range(3000))
+
+    def build_rover(self, instruction, land=None):
+        rover = Rover(name="Rover1", position=Position(3, 3, Orientation.N), land=land or self.land)
+        rover.set_instruction(instruction)
+        return rover
+
+    def expected_states(self, instruction, land=None):
+        "runs the instruction one command at a time, collecting the state after every step."
+
+        rover = self.build_rover("", land)
+        states = [(3, 3, 0)]
+        for command in expand_instruction(instruction):
+            {"L": rover.spin_left, "R": rover.spin_right, "M": rover.move}[command]()
+            states.append((rover.position.point.x, rover.position.point.y, rover.position.heading))
+        return states
+
+    def test_position_at_every_step_matches_stepwise_run(self):
+        index = StepIndex.build(self.build_rover(self.instruction))
+        expected = self.expected_states(self.instruction)
+
+        self.assertEqual(len(index), len(self.instruction))
+        self.assertEqual([index.position_at(step) for step in range(len(index) + 1)], expected)
+
+    def test_batched_positions_match_single_queries(self):
+        index = StepIndex.build(self.build_rover(self.instruction))
+        steps = list(range(len(index), -1, -7))
+
+        xs, ys, headings = index.positions_at(steps)
+        expected = [index.position_at(step) for step in steps]
+        self.assertEqual(list(zip(xs.tolist(), ys.tolist(), headings.tolist())), expected)
+
+    def test_encoded_instruction_steps_count_expanded_commands(self):
+        instruction = "M10R2M3L5M20"
+        index = StepIndex.build(self.build_rover(instruction))
+        expected = self.expected_states(instruction)
+
+        self.assertEqual(len(index), 40)
+        self.assertEqual([index.position_at(step) for step in range(41)], expected)
+
+    def test_obstacles_clamp_moves(self):
+        obstacles = [(Point(3, 5), Point(3, 5)), (Point(5, 0), Point(5, 6))]
+        land = ObstacleLand(upper_right_edge=Point(6, 6), obstacles=obstacles)
+        index = StepIndex.build(self.build_rover(self.instruction, land))
+        self.assertEqual(
+            [index.position_at(step) for step in range(len(index) + 1)], self.expected_states(self.instruction, land)
+        )
+
+    def test_rover_is_left_at_landing(self):
+        rover = self.build_rover("MMR")
+        StepIndex.build(rover)
+        self.assertEqual((str(rover.position), rover.instruction), ("3 3 N", "MMR"))
+
+    def test_empty_instruction_stays_at_landing(self):
+        index = StepIndex.build(self.build_rover(""))
+        self.assertEqual(index.position_at(0), (3, 3, 0))
+        self.assertEqual([array.tolist() for array in index.positions_at([0, 0])], [[3, 3], [3, 3], [0, 0]])
+
+    def test_steps_out_of_range_are_rejected(self):
+        index = StepIndex.build(self.build_rover("MM"))
+        with self.assertRaises(IndexError):
+            index.position_at(3)
+        with self.assertRaises(IndexError):
+            index.positions_at([0, -1])
@@ -0,0 +1,95 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from internal.models import Orientation, Point, Position, Rover
+from internal.models.land import RectangularLand
+from internal.storage import Trajectory, TrajectoryRecorder, run_recorded
+
+
+class TrajectoryTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.land = RectangularLand(upper_right_edge=Point(x=6, y=6))
+
+        generator = random.Random(17)
+        self.instruction = "".join(generator.choice("LRMMM") for _ in range(5000))
+
+    def build_rover(self, instruction: str) -> Rover:
+        rover = Rover(name="Rover1", position=Position(3, 3, Orientation.N), land=self.land)
+        rover.set_instruction(instruction)
+        return rover
+
+    def expected_states(self, instruction: str):
+        "runs the instruction one command at a time, collecting the state after every step."
+
+        rover = self.build_rover("")
+        states = [(3, 3, 0)]
+        for command in instruction:
+            {"L": rover.spin_left, "R": rover.spin_right, "M": rover.move}[command]()
+            states.append((rover.position.point.x, rover.position.point.y, rover.position.heading))
+        return states
+
+    def record(self, instruction: str, **options) -> TrajectoryRecorder:
+        rover = self.build_rover(instruction)
+        recorder = TrajectoryRecorder(3, 3, 0, **options)
+        self.addCleanup(recorder.close)
+        run_recorded(rover, recorder)
+        self.assertEqual(recorder.state, (rover.position.point.x, rover.position.point.y, rover.position.heading))
+        return recorder
+
+    def test_recorded_steps_match_instruction_commands(self):
+        expected = self.expected_states(self.instruction)
+        recorder = self.record(self.instruction, chunk_size=64)
+
+        self.assertEqual(len(recorder), len(self.instruction))
+        self.assertEqual(list(recorder.positions()), expected)
+        for step in (0, 1, 63, 64, 65, 2500, len(self.instruction)):
+            self.assertEqual(recorder.position_at(step), expected[step])
+
+    def test_run_length_encoded_instructions_are_recorded_per_step(self):
+        recorder = self.record("M10R2L7M3", chunk_size=4)
+        self.assertEqual(list(recorder.positions()), self.expected_states("M" * 10 + "RR" + "L" * 7 + "MMM"))
+
+    def test_long_runs_are_recorded_as_run_chunks(self):
+        path = os.path.join(self.directory, "rover.trj")
+        recorder = self.record("M1000000L3", chunk_size=4096, memory_budget=64 * 1024, spill_path=path)
+
+        self.assertEqual(len(recorder), 1000003)
+        self.assertEqual(recorder.position_at(3), (3, 6, 0))
+        self.assertEqual(recorder.position_at(1000003), (3, 6, 1))
+        self.assertEqual(list(recorder.positions(999999)), [(3, 6, 0), (3, 6, 0), (3, 6, 3), (3, 6, 2), (3, 6, 1)])
+
+    def test_moves_blocked_at_the_edge_take_constant_space(self):
+        path = os.path.join(self.directory, "rover.trj")
+        recorder = self.record("M3RM10000000000LM5000", chunk_size=64, spill_path=path)
+
+        recorder.flush()
+        self.assertTrue(os.path.getsize(path) < 1024)
+        with Trajectory.open(path) as trajectory:
+            self.assertEqual(len(trajectory), 3 + 1 + 10**10 + 1 + 5000)
+            self.assertEqual(trajectory.position_at(5), (4, 6, 1))
+            self.assertEqual(trajectory.position_at(10**9), (6, 6, 1))
+            self.assertEqual(trajectory.position_at(len(trajectory)), (6, 6, 0))
+            self.assertEqual(list(trajectory.positions(10**10 + 3, 10**10 + 6)), [(6, 6, 1), (6, 6, 1), (6, 6, 0), (6, 6, 0)])
+
+    def test_chunks_spill_to_disk_over_memory_budget(self):
+        path = os.path.join(self.directory, "rover.trj")
+        expected = self.expected_states(self.instruction)
+        recorder = self.record(self.instruction, chunk_size=128, memory_budget=1024, spill_path=path)
+
+        self.assertTrue(os.path.getsize(path) > 0)
+        self.assertEqual(list(recorder.positions(100, 300)), expected[100:301])
+
+        recorder.flush()
+        with Trajectory.open(path) as trajectory:
+            self.assertEqual(len(trajectory), len(self.instruction))
+            self.assertEqual(trajectory.position_at(4321), expected[4321])
+            self.assertEqual(list(trajectory.positions()), expected)
+
+    def test_position_at_rejects_steps_out_of_range(self):
+        recorder = self.record("MM")
+        with self.assertRaises(IndexError):
+            recorder.position_at(3)
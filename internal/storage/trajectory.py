@@ -0,0 +1,366 @@
+""" Compact storage of the path a rover takes, one (x, y, heading) state per instruction step.
+
+    A trajectory is split into chunks of up to `chunk_size` steps. Each chunk starts with a keyframe
+    holding the absolute state before its first step, followed by three columns of signed byte deltas:
+    x, y and heading (-1 for a left turn, 1 for a right turn). A step costs 3 bytes instead of a
+    `Position` object, and any step can be found by decoding one chunk only.
+
+    A run of at least `chunk_size` steps with the same deltas, such as a long run of moves or of moves
+    blocked at the edge, is stored as a run chunk instead: its keyframe, one delta per column and a
+    count, so it costs the same few bytes however long the run is.
+
+    When a recorder holds more than `memory_budget` bytes of deltas, full chunks are spilled to a file.
+    Every chunk is stored in the file as a little-endian header followed by its three columns:
+
+        x          int64   keyframe x coordinate
+        y          int64   keyframe y coordinate
+        heading    uint8   keyframe heading (quarter turns right of north)
+        kind       uint8   0 for a chunk of delta columns, 1 for a run chunk
+        count      uint64  number of steps in the chunk
+        dx, dy, dh int8    `count` deltas each, or a single delta each in a run chunk
+"""
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from internal.models import Rover
+from internal.models.mechanics import UNIT_VECTORS
+from internal.models.program import iter_command_runs
+
+
+CHUNK_HEADER = struct.Struct("<qqBBQ")
+RUN_DELTAS = struct.Struct("<bbb")
+
+COLUMNS_CHUNK, RUN_CHUNK = 0, 1
+
+State = Tuple[int, int, int]
+
+_TURNS = {"L": -1, "R": 1}
+_UNITS = {value: array("b", (value,)) for value in (-1, 0, 1)}
+
+
+class _Chunk:
+    """ keyframe and delta columns of a chunk, or where to read its columns from once spilled.
+        a run chunk has no columns but the deltas every one of its steps takes.
+    """
+
+    __slots__ = ("x", "y", "heading", "count", "columns", "offset", "deltas")
+
+    def __init__(self, x: int, y: int, heading: int) -> None:
+        self.x = x
+        self.y = y
+        self.heading = heading
+        self.count = 0
+        self.columns: Optional[Tuple[array, array, array]] = (array("b"), array("b"), array("b"))
+        self.offset = -1
+        self.deltas: Optional[State] = None
+
+
+class Trajectory:
+    """ Read access to a recorded trajectory.
+
+        Main Methods:
+            open: opens a trajectory file written by a `TrajectoryRecorder`.
+            position_at: returns the state after a number of steps, decoding one chunk only.
+            positions: yields the states of a range of steps, one chunk at a time.
+    """
+
+    def __init__(self, chunks: List[_Chunk], file: Optional[BinaryIO] = None) -> None:
+        self._chunks = chunks
+        self._file = file
+        self._starts = list(accumulate((chunk.count for chunk in chunks[:-1]), initial=0))
+
+    @classmethod
+    def open(cls, path: str) -> "Trajectory":
+        "reads the chunk headers of a trajectory file. chunk columns are read when needed."
+
+        file = open(path, "rb")
+        chunks = []
+        while True:
+            header = file.read(CHUNK_HEADER.size)
+            if len(header) < CHUNK_HEADER.size:
+                break
+
+            x, y, heading, kind, count = CHUNK_HEADER.unpack(header)
+            chunk = _Chunk(x, y, heading)
+            chunk.count, chunk.columns, chunk.offset = count, None, file.tell()
+            chunks.append(chunk)
+            if kind == RUN_CHUNK:
+                chunk.deltas = RUN_DELTAS.unpack(file.read(RUN_DELTAS.size))
+            else:
+                file.seek(3 * count, os.SEEK_CUR)
+
+        if not chunks:
+            file.close()
+            raise ValueError(f"no trajectory recorded in {path}")
+
+        return cls(chunks, file)
+
+    def __len__(self) -> int:
+        "returns the number of steps recorded."
+        return self._starts[-1] + self._chunks[-1].count
+
+    def position_at(self, step: int) -> State:
+        "returns (x, y, heading) after `step` steps. step 0 is the landing position."
+
+        if not 0 <= step <= len(self):
+            raise IndexError(f"step must be between 0 and {len(self)}. got {step}")
+
+        index = bisect_right(self._starts, step) - 1
+        chunk = self._chunks[index]
+        offset = step - self._starts[index]
+        if chunk.deltas is not None:
+            dx, dy, dh = chunk.deltas
+            return chunk.x + dx * offset, chunk.y + dy * offset, (chunk.heading + dh * offset) % 4
+
+        dx, dy, dh = self._read_columns(chunk)
+        return chunk.x + sum(dx[:offset]), chunk.y + sum(dy[:offset]), (chunk.heading + sum(dh[:offset])) % 4
+
+    def positions(self, start: int = 0, stop: Optional[int] = None) -> Iterator[State]:
+        "yields (x, y, heading) after each step from `start` up to and including `stop`."
+
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start > stop:
+            return
+
+        x, y, heading = self.position_at(start)
+        yield x, y, heading
+
+        index = bisect_right(self._starts, start) - 1
+        step = start
+        while step < stop:
+            chunk = self._chunks[index]
+            offsets = range(step - self._starts[index], min(chunk.count, stop - self._starts[index]))
+            if chunk.deltas is not None:
+                dx, dy, dh = chunk.deltas
+                for _ in offsets:
+                    x += dx
+                    y += dy
+                    heading = (heading + dh) % 4
+                    step += 1
+                    yield x, y, heading
+            else:
+                dx, dy, dh = self._read_columns(chunk)
+                for offset in offsets:
+                    x += dx[offset]
+                    y += dy[offset]
+                    heading = (heading + dh[offset]) % 4
+                    step += 1
+                    yield x, y, heading
+            index += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read_columns(self, chunk: _Chunk) -> Tuple[array, array, array]:
+        if chunk.columns is not None:
+            return chunk.columns
+
+        self._file.seek(chunk.offset)
+        count = chunk.count
+        data = self._file.read(3 * count)
+        return array("b", data[:count]), array("b", data[count:2 * count]), array("b", data[2 * count:])
+
+
+class TrajectoryRecorder(Trajectory):
+    """ Records a trajectory step by step while it can be read like any other trajectory.
+
+        Main Attributes:
+            chunk_size: number of steps in a chunk.
+            memory_budget: bytes of deltas kept in memory before full chunks are spilled to disk.
+            spill_path: file chunks are spilled to. A temporary file is used when None.
+
+        Main Methods:
+            record: records steps given as columns of x, y and heading deltas.
+            record_run: records a number of steps that all take the same deltas.
+            record_turns: records steps turning the rover left or right.
+            record_moves: records move steps, of which the last ones may be blocked.
+            flush: writes every chunk to the spill file, so it can be opened with `Trajectory.open`.
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        heading: int,
+        chunk_size: int = 4096,
+        memory_budget: int = 64 * 1024 * 1024,
+        spill_path: Optional[str] = None
+    ) -> None:
+        super().__init__([_Chunk(x, y, heading)])
+        self.chunk_size = chunk_size
+        self.memory_budget = memory_budget
+        self.spill_path = spill_path
+        self._state = [x, y, heading]
+        self._memory_steps = 0
+
+    def record(self, dx: array, dy: array, dh: array):
+        "records one step per item of three equally long columns of signed byte deltas."
+
+        start, size = 0, len(dx)
+        while start < size:
+            chunk = self._chunks[-1]
+            if chunk.count == self.chunk_size or chunk.columns is None:
+                chunk = self._start_chunk()
+
+            end = min(size, start + self.chunk_size - chunk.count)
+            columns = chunk.columns
+            columns[0].extend(dx[start:end])
+            columns[1].extend(dy[start:end])
+            columns[2].extend(dh[start:end])
+            chunk.count += end - start
+            self._memory_steps += end - start
+            start = end
+
+        state = self._state
+        state[0] += sum(dx)
+        state[1] += sum(dy)
+        state[2] = (state[2] + sum(dh)) % 4
+
+    def record_turns(self, turn: int, count: int = 1):
+        "records `count` turns. `turn` is -1 for a left turn and 1 for a right turn."
+
+        self.record_run(0, 0, turn, count)
+
+    def record_moves(self, dx: int, dy: int, moved: int, blocked: int = 0):
+        "records `moved` unit moves of (dx, dy) followed by `blocked` moves that were dropped."
+
+        self.record_run(dx, dy, 0, moved)
+        self.record_run(0, 0, 0, blocked)
+
+    def record_run(self, dx: int, dy: int, dh: int, count: int):
+        "records `count` steps of the same deltas, as a run chunk when they would fill a chunk."
+
+        if count < self.chunk_size:
+            self.record(_UNITS[dx] * count, _UNITS[dy] * count, _UNITS[dh] * count)
+            return
+
+        chunk = self._start_chunk()
+        chunk.columns, chunk.deltas, chunk.count = None, (dx, dy, dh), count
+
+        state = self._state
+        state[0] += dx * count
+        state[1] += dy * count
+        state[2] = (state[2] + dh * count) % 4
+
+    @property
+    def state(self) -> State:
+        "returns (x, y, heading) after the last recorded step."
+        x, y, heading = self._state
+        return x, y, heading
+
+    def flush(self):
+        "writes every chunk still in memory, including the one being filled, to the spill file."
+
+        self._spill(self._chunks)
+        self._file.flush()
+
+    def _start_chunk(self) -> _Chunk:
+        last = self._chunks[-1]
+        self._starts.append(self._starts[-1] + last.count)
+
+        x, y, heading = self._chunk_end(last)
+        chunk = _Chunk(x, y, heading)
+        self._chunks.append(chunk)
+
+        if 3 * self._memory_steps > self.memory_budget:
+            self._spill(self._chunks[:-1])
+        return chunk
+
+    def _chunk_end(self, chunk: _Chunk) -> State:
+        if chunk.deltas is not None:
+            dx, dy, dh = chunk.deltas
+            return chunk.x + dx * chunk.count, chunk.y + dy * chunk.count, (chunk.heading + dh * chunk.count) % 4
+
+        dx, dy, dh = self._read_columns(chunk)
+        return chunk.x + sum(dx), chunk.y + sum(dy), (chunk.heading + sum(dh)) % 4
+
+    def _spill(self, chunks: List[_Chunk]):
+        if self._file is None:
+            if self.spill_path is None:
+                self._file = tempfile.TemporaryFile()
+            else:
+                self._file = open(self.spill_path, "w+b")
+
+        file = self._file
+        file.seek(0, os.SEEK_END)
+        for chunk in chunks:
+            if chunk.offset >= 0:
+                continue
+
+            if chunk.deltas is not None:
+                file.write(CHUNK_HEADER.pack(chunk.x, chunk.y, chunk.heading, RUN_CHUNK, chunk.count))
+                chunk.offset = file.tell()
+                file.write(RUN_DELTAS.pack(*chunk.deltas))
+                continue
+
+            file.write(CHUNK_HEADER.pack(chunk.x, chunk.y, chunk.heading, COLUMNS_CHUNK, chunk.count))
+            chunk.offset = file.tell()
+            for column in chunk.columns:
+                file.write(column.tobytes())
+
+            chunk.columns = None
+            self._memory_steps -= chunk.count
+
+
+def run_recorded(rover: Rover, recorder: TrajectoryRecorder):
+    """ Runs a rover's instruction one run of commands at a time, recording every step.
+
+        The rover ends where `Rover.run_instruction` would leave it. Blocked moves are recorded as
+        steps that do not change the position, so step numbers match instruction commands.
+        Deltas are gathered in columns and handed to the recorder a chunk at a time, and runs of a
+        chunk or more are recorded as run chunks, so neither memory nor the spill file grows with
+        the length of a run.
+    """
+
+    position = rover.position
+    land = rover.land
+    chunk_size = recorder.chunk_size
+    x, y, heading = position.point.x, position.point.y, position.heading
+    units = _UNITS
+    dxs, dys, dhs = array("b"), array("b"), array("b")
+
+    for command, count in iter_command_runs(rover.instruction):
+        if command == "M":
+            dx, dy = UNIT_VECTORS[heading]
+            new_x, new_y = land.traverse(x, y, dx, dy, count)
+            moved = abs(new_x - x) + abs(new_y - y)
+            # (x, y, heading) deltas of a step and how many steps take them: moves, then blocked moves.
+            parts = ((dx, dy, 0, moved), (0, 0, 0, count - moved))
+            x, y = new_x, new_y
+        else:
+            turn = _TURNS[command]
+            parts = ((0, 0, turn, count),)
+            heading = (heading + turn * count) % 4
+
+        for step_x, step_y, step_heading, steps in parts:
+            if steps >= chunk_size:
+                recorder.record(dxs, dys, dhs)
+                dxs, dys, dhs = array("b"), array("b"), array("b")
+                recorder.record_run(step_x, step_y, step_heading, steps)
+                continue
+
+            while steps:
+                size = min(steps, chunk_size - len(dxs))
+                dxs.extend(units[step_x] * size)
+                dys.extend(units[step_y] * size)
+                dhs.extend(units[step_heading] * size)
+                steps -= size
+                if len(dxs) >= chunk_size:
+                    recorder.record(dxs, dys, dhs)
+                    dxs, dys, dhs = array("b"), array("b"), array("b")
+
+    recorder.record(dxs, dys, dhs)
+    position.point.x, position.point.y, position.heading = x, y, heading
+    rover.reset_instruction()
@@ -1,6 +1,268 @@
 import argparse
-from internal.parser import InputParser
-from utils import get_input_from_args
+import os
+import sys
+from os.path import basename, isfile, join
+from typing import Iterable, List, Optional
+from internal.models import Rover
+from utils import (
+    InputError,
+    MarsRoverError,
+    RoverError,
+    exit_program,
+    format_error_message,
+    get_input_from_args,
+    is_binary_mission,
+    iter_input_from_args,
+    map_input_file
+)
+from utils.profiling import PROFILE_ENV_VAR, Profiler, enable_profiling, profile_stage
+
+
+def print_rovers(rovers: Iterable[Rover], profiler: Optional[Profiler], flush: bool = False):
+    "runs each rover's instruction and prints its final position."
+
+    for rover in rovers:
+        if profiler is None:
+            rover.run_instruction()
+            print(f"{rover.name}:{rover.position}", flush=flush)
+        else:
+            profiler.run_rover(rover)
+            with profiler.stage("print"):
+                print(f"{rover.name}:{rover.position}", flush=flush)
+
+
+def print_lines(lines: Iterable[str]):
+    with profile_stage("print"):
+        for line in lines:
+            print(line)
+
+
+def print_errors(errors: List[RoverError]):
+    "prints the errors of rovers left out in partial mode."
+
+    for error in errors:
+        print(format_error_message(str(error)), file=sys.stderr)
+
+
+def print_optimized(rovers: Iterable[Rover], plateau_definition: str):
+    """ prints the mission with each rover's instruction rewritten into the shortest one with the same final position.
+
+        Run-length encoded instructions stay encoded. The reduction of each instruction is reported on standard error.
+    """
+
+    from internal.planner import optimize_instruction
+
+    print(plateau_definition)
+    original_total = optimized_total = 0
+    for rover in rovers:
+        result = optimize_instruction(rover)
+        print(f"{rover.name} Landing:{rover.position}")
+        print(f"{rover.name} Instructions:{result.instruction}")
+        print(
+            f"{rover.name}: {result.original_length} -> {result.length} commands ({result.reduction_ratio:.1%} fewer)",
+            file=sys.stderr
+        )
+        original_total += result.original_length
+        optimized_total += result.length
+
+    if original_total:
+        print(
+            f"total: {original_total} -> {optimized_total} commands ({1 - optimized_total / original_total:.1%} fewer)",
+            file=sys.stderr
+        )
+
+
+def run_from_checkpoints(args: argparse.Namespace, rovers: Iterable[Rover]):
+    "runs rovers and saves their checkpoints, starting from the saved ones in append mode."
+
+    from internal.storage import CheckpointStore, run_from_checkpoints
+
+    mission = args.mission or (basename(args.file_path) if args.file_path else "default")
+    with CheckpointStore(args.checkpoint) as store:
+        for rover in run_from_checkpoints(store, mission, rovers, resume=args.append):
+            print(f"{rover.name}:{rover.position}", flush=True)
+
+
+def run_with_cache(args: argparse.Namespace, rovers: Iterable[Rover]):
+    "runs rovers through the result cache, taking the final position of rovers run before from it."
+
+    from internal.storage import ResultCache, run_cached
+
+    with ResultCache(args.cache, max_entries=args.cache_size) as cache:
+        for rover in run_cached(cache, rovers):
+            print(f"{rover.name}:{rover.position}", flush=True)
+    print(f"cache: {cache.stats}", file=sys.stderr)
+
+
+def run_recording_trajectories(args: argparse.Namespace, rovers: Iterable[Rover]):
+    "runs rovers, recording each one's trajectory to a file named after it in the trajectory directory."
+
+    from urllib.parse import quote
+    from internal.storage import TrajectoryRecorder, run_recorded
+
+    os.makedirs(args.trajectory, exist_ok=True)
+    for rover in rovers:
+        point = rover.position.point
+        spill_path = join(args.trajectory, f"{quote(rover.name, safe='')}.trj")
+        with TrajectoryRecorder(point.x, point.y, rover.position.heading, spill_path=spill_path) as recorder:
+            run_recorded(rover, recorder)
+            recorder.flush()
+        print(f"{rover.name}:{rover.position}", flush=True)
+
+
+def run_rovers(args: argparse.Namespace, profiler: Optional[Profiler] = None):
+    "parses inputs, runs every rover's instruction and prints each rover's final position."
+
+    binary = bool(args.file_path) and isfile(args.file_path) and is_binary_mission(args.file_path)
+
+    # these options pick how text input is read, so they would be silently ignored where it is read another way.
+    if args.parse_workers > 0 and (args.stream or args.mmap):
+        raise InputError("--parse-workers parses the whole input at once, so it cannot be combined with --stream or --mmap")
+    if binary and (args.stream or args.mmap or args.partial or args.parse_workers > 0):
+        options = [
+            option for option, given in (
+                ("--stream", args.stream),
+                ("--mmap", args.mmap),
+                ("--partial", args.partial),
+                ("--parse-workers", args.parse_workers > 0),
+            ) if given
+        ]
+        raise InputError(f"binary missions are loaded whole, so {', '.join(options)} cannot be used with them. got {args.file_path}")
+
+    if binary or args.optimize:
+        streamed_rovers = None
+    elif args.mmap and args.file_path and isfile(args.file_path):
+        from internal.parser import MappedInputParser
+
+        streamed_rovers = MappedInputParser(inputs=map_input_file(args.file_path), partial=args.partial)
+    elif args.stream or args.mmap:
+        from internal.parser import StreamInputParser
+
+        data = iter_input_from_args(args.file_path, args.plateau_input, args.rovers_input)
+        streamed_rovers = StreamInputParser(inputs=data, partial=args.partial)
+    else:
+        streamed_rovers = None
+
+    if streamed_rovers is not None:
+        if args.checkpoint:
+            run_from_checkpoints(args, streamed_rovers)
+        elif args.trajectory:
+            run_recording_trajectories(args, streamed_rovers)
+        elif args.cache:
+            run_with_cache(args, streamed_rovers)
+        else:
+            print_rovers(streamed_rovers, profiler, flush=True)
+        print_errors(streamed_rovers.errors)
+        return
+
+    if binary:
+        from internal.parser.binary_format import BinaryMission
+
+        if args.to_binary:
+            raise InputError(f"input is already a binary mission. got {args.file_path}")
+
+        with profile_stage("read"):
+            mission = BinaryMission.load(args.file_path)
+
+        fast_path = not (
+            args.collisions or args.workers > 0 or args.checkpoint or args.trajectory or args.cache or args.optimize
+        )
+        if args.engine == "numpy" and fast_path:
+            from internal.engine import run_fleet
+
+            with profile_stage("execute"):
+                fleet = mission.fleet()
+                run_fleet(fleet, mission.plateau, mission.unpacked_instructions())
+            print_lines(fleet.lines())
+            return
+
+        with profile_stage("parse"):
+            rovers = mission.rovers()
+        upper_right_edge = mission.plateau.upper_right_edge
+        plateau_definition = f"Plateau:{upper_right_edge.x} {upper_right_edge.y}"
+    elif args.parse_workers > 0 and args.file_path and isfile(args.file_path) and not args.to_binary:
+        from internal.parser import ParallelInputParser
+
+        with profile_stage("parse"):
+            parser = ParallelInputParser(inputs=args.file_path, partial=args.partial, workers=args.parse_workers)
+            rovers = parser.rovers
+        plateau_definition = parser.plateau_definition.strip()
+        print_errors(parser.errors)
+    else:
+        with profile_stage("read"):
+            data = get_input_from_args(args.file_path, args.plateau_input, args.rovers_input)
+
+        if args.to_binary:
+            from internal.parser.binary_format import convert_to_binary
+
+            convert_to_binary(data, args.to_binary)
+            return
+
+        from internal.parser import InputParser
+
+        with profile_stage("parse"):
+            parser = InputParser(inputs=data, partial=args.partial)
+            rovers = parser.rovers
+        plateau_definition = data[0].strip()
+        print_errors(parser.errors)
+
+    if args.optimize:
+        print_optimized(rovers, plateau_definition)
+    elif args.checkpoint:
+        run_from_checkpoints(args, rovers)
+    elif args.trajectory:
+        run_recording_trajectories(args, rovers)
+    elif args.cache:
+        run_with_cache(args, rovers)
+    elif args.collisions:
+        from internal.engine import run_with_collisions
+
+        with profile_stage("execute"):
+            run_with_collisions(rovers, mode=args.collisions)
+        print_lines(f"{rover.name}:{rover.position}" for rover in rovers)
+    elif args.workers > 0:
+        from internal.engine import run_rovers_in_pool
+
+        with profile_stage("execute"):
+            lines = list(run_rovers_in_pool(rovers, workers=args.workers))
+        print_lines(lines)
+    elif args.engine == "periodic":
+        from internal.engine import run_periodic_instruction
+
+        with profile_stage("execute"):
+            for rover in rovers:
+                run_periodic_instruction(rover)
+        print_lines(f"{rover.name}:{rover.position}" for rover in rovers)
+    elif args.engine == "numpy":
+        from internal.engine import simulate_rovers
+
+        with profile_stage("execute"):
+            fleet = simulate_rovers(rovers)
+        print_lines(fleet.lines())
+    else:
+        print_rovers(rovers, profiler)
+
+
+def run_batch(args: argparse.Namespace, file_paths: Iterable[str], profiler: Optional[Profiler] = None) -> int:
+    """ Runs several mission files in one process, each under a '==> path <==' header line.
+
+        A mission that fails, for any reason, is reported on standard error and the next one still runs.
+        Returns the number of missions that failed.
+    """
+
+    failed = 0
+    for file_path in file_paths:
+        print(f"==> {file_path} <==", flush=True)
+        try:
+            if not isfile(file_path):
+                raise InputError(f"no such mission file. got {file_path}")
+            run_rovers(argparse.Namespace(**{**vars(args), "file_path": file_path}), profiler)
+        except Exception as error:
+            failed += 1
+            print(format_error_message(str(error)), file=sys.stderr, flush=True)
+
+    return failed
+
 
 if __name__ == "__main__":
     arg_parser = argparse.ArgumentParser(description="plateau and rover inputs", prog="Mars Rover")
@@ -8,14 +270,67 @@ if __name__ == "__main__":
     arg_parser.add_argument("file_path", type=str, help="file path for plateau and rover inputs' file", nargs="?")
     arg_parser.add_argument("-p", "--plateau_input", type=str, help="plateau input", nargs="?", default="")
     arg_parser.add_argument("-r", "--rovers_input", type=str, help="landing and instructions input for rovers", nargs="*", default=[])
+    arg_parser.add_argument("-e", "--engine", type=str, help="engine that runs rover instructions", choices=["object", "numpy", "periodic"], default="object")
+    arg_parser.add_argument("-w", "--workers", type=int, help="number of worker processes to run rovers on", default=0)
+    arg_parser.add_argument("--parse-workers", type=int, help="number of worker processes to parse the input file on", default=0)
+    arg_parser.add_argument("-c", "--collisions", type=str, help="keep rovers from moving onto each other's cells", choices=["sequential", "timestep"])
+    arg_parser.add_argument("-s", "--stream", help="read input lazily and run each rover as soon as it is complete", action="store_true")
+    arg_parser.add_argument("-m", "--mmap", help="memory-map the input file and run rovers on instructions read in place", action="store_true")
+    arg_parser.add_argument("--to-binary", type=str, help="convert text input to a binary mission file at this path instead of running it", metavar="OUTPUT_PATH")
+    arg_parser.add_argument("--optimize", help="print the mission with each instruction rewritten into the shortest one with the same final position", action="store_true")
+    arg_parser.add_argument("--partial", help="leave out invalid rovers, reporting each one, and run the rest", action="store_true")
+    arg_parser.add_argument("--checkpoint", type=str, help="save each rover's final position to this checkpoint file", metavar="CHECKPOINT_PATH")
+    arg_parser.add_argument("--append", help="run only the instructions appended since the checkpoint of each rover", action="store_true")
+    arg_parser.add_argument("--mission", type=str, help="mission name checkpoints are saved under. defaults to the input file name")
+    arg_parser.add_argument("--trajectory", type=str, help="record each rover's path to a file in this directory", metavar="DIRECTORY")
+    arg_parser.add_argument("--cache", type=str, help="take the final position of rovers run before from this result cache file, adding new ones to it", metavar="CACHE_PATH")
+    arg_parser.add_argument("--cache-size", type=int, help="number of rover results the cache keeps before evicting the least recently used", default=100_000)
+    arg_parser.add_argument("--batch", type=str, help="run many mission files in one process. paths are read from standard input when none are given", nargs="*", metavar="FILE_PATH")
+    arg_parser.add_argument("--serve", type=str, help="serve missions over a socket at HOST:PORT or unix:PATH instead of running input", metavar="ADDRESS")
+    arg_parser.add_argument("--profile", type=str, help="write per-stage timings and per-rover counters to this JSON file", default=os.environ.get(PROFILE_ENV_VAR))
 
     args = arg_parser.parse_args()
+    if args.append and not args.checkpoint:
+        arg_parser.error("--append requires --checkpoint")
 
-    data = get_input_from_args(args.file_path, args.plateau_input, args.rovers_input)
+    # each of these picks how rovers run, so only one of them may be given.
+    run_modes = [
+        option for option, given in (
+            ("--optimize", args.optimize),
+            ("--checkpoint", args.checkpoint),
+            ("--trajectory", args.trajectory),
+            ("--cache", args.cache),
+            ("--collisions", args.collisions),
+            ("--workers", args.workers > 0),
+            (f"--engine {args.engine}", args.engine != "object"),
+        ) if given
+    ]
+    if len(run_modes) > 1:
+        arg_parser.error(f"{run_modes[0]} cannot be combined with {', '.join(run_modes[1:])}")
+    if args.to_binary and (args.stream or args.mmap or run_modes):
+        options = [option for option, given in (("--stream", args.stream), ("--mmap", args.mmap)) if given] + run_modes
+        arg_parser.error(f"--to-binary converts input instead of running it, so it cannot be combined with {', '.join(options)}")
+    if (args.stream or args.mmap) and (args.collisions or args.workers > 0 or args.engine != "object"):
+        arg_parser.error("--stream and --mmap run rovers one at a time, so they cannot be combined with --collisions, --workers or --engine")
 
-    parser = InputParser(inputs=data)
-    rovers = parser.rovers
+    try:
+        if args.serve:
+            from internal.service import serve
 
-    for rover in rovers:
-        rover.run_instruction()
-        print(f"{rover.name}:{rover.position}")
+            serve(args.serve)
+        elif args.batch is not None:
+            file_paths = args.batch or (line.strip() for line in sys.stdin if line.strip())
+            profiler = enable_profiling() if args.profile else None
+            failed = run_batch(args, file_paths, profiler)
+            if profiler is not None:
+                profiler.write(args.profile)
+            if failed:
+                sys.exit(1)
+        elif args.profile:
+            profiler = enable_profiling()
+            run_rovers(args, profiler)
+            profiler.write(args.profile)
+        else:
+            run_rovers(args)
+    except MarsRoverError as error:
+        exit_program(str(error))
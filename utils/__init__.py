@@ -1 +1,18 @@
-from .utils import exit_program, get_input_from_args
+from .errors import (
+    EngineError,
+    InputError,
+    LandError,
+    MarsRoverError,
+    PlateauError,
+    RotationError,
+    RoverError
+)
+from .utils import (
+    BINARY_MISSION_MAGIC,
+    exit_program,
+    format_error_message,
+    get_input_from_args,
+    is_binary_mission,
+    iter_input_from_args,
+    map_input_file
+)
\ No newline at end of file
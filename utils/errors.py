@@ -0,0 +1,42 @@
+from typing import Optional
+
+
+class MarsRoverError(Exception):
+    "base class of the errors raised while parsing inputs or running rovers."
+
+
+class InputError(MarsRoverError):
+    "raised when inputs are missing or cannot be read."
+
+
+class PlateauError(InputError):
+    "raised when the plateau input is invalid."
+
+
+class RoverError(InputError):
+    """ Raised when the input or the state of a single rover is invalid.
+
+        Other rovers are not affected by it, so parsers in partial mode record it and go on with the rest.
+
+        Main Attributes:
+            rover_name: name of the rover, or None when the input is too malformed to tell.
+    """
+
+    def __init__(self, message: str, rover_name: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.rover_name = rover_name
+
+    def __reduce__(self):
+        return type(self), (str(self), self.rover_name)
+
+
+class RotationError(MarsRoverError):
+    "raised when a rotation is not to one of the four cardinal compass points."
+
+
+class LandError(MarsRoverError):
+    "raised when a land cannot be created."
+
+
+class EngineError(MarsRoverError):
+    "raised when an engine cannot run the rovers it is given."
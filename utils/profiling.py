@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, List, Optional
+
+
+# setting this environment variable to a file path turns profiling on, like the `--profile` flag.
+PROFILE_ENV_VAR = "MARS_ROVER_PROFILE"
+
+
+class Profiler:
+    """ Records wall time per stage and per-rover execution counters of a run.
+
+        Main Methods:
+            stage: context manager that adds the wall time of its block to a stage.
+            run_rover: runs a rover's instruction while counting what it does.
+            report: returns the recorded timings and counters.
+            write: writes the report to a JSON file.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.rovers: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+    def run_rover(self, rover):
+        "runs a rover's instruction, adds its wall time to the 'execute' stage and records its counters."
+
+        from internal.models import ExecutionCounters
+
+        counters = ExecutionCounters()
+        with self.stage("execute"):
+            started = time.perf_counter()
+            rover.run_instruction(counters)
+            seconds = time.perf_counter() - started
+
+        self.rovers.append({
+            "name": rover.name,
+            "moves": counters.moves,
+            "blocked_moves": counters.blocked_moves,
+            "rotations": counters.rotations,
+            "instructions": counters.instructions,
+            "seconds": seconds,
+            "instructions_per_second": counters.instructions / seconds if seconds else None,
+        })
+
+    def report(self) -> Dict[str, Any]:
+        totals = {
+            counter: sum(rover[counter] for rover in self.rovers)
+            for counter in ("moves", "blocked_moves", "rotations", "instructions")
+        }
+        execute_seconds = sum(rover["seconds"] for rover in self.rovers)
+        totals["instructions_per_second"] = totals["instructions"] / execute_seconds if execute_seconds else None
+
+        return {"stages": dict(self.stages), "totals": totals, "rovers": self.rovers}
+
+    def write(self, file_path: str):
+        import json
+
+        with open(file_path, "w") as file:
+            json.dump(self.report(), file, indent=4)
+
+
+_active_profiler: Optional[Profiler] = None
+
+
+def enable_profiling() -> Profiler:
+    "turns profiling on for the rest of the run and returns the profiler used."
+
+    global _active_profiler
+    _active_profiler = Profiler()
+    return _active_profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    "returns the active profiler, or None when profiling is off."
+    return _active_profiler
+
+
+def profile_stage(name: str) -> ContextManager:
+    "times a block as a stage of the active profiler. does nothing when profiling is off."
+    return _active_profiler.stage(name) if _active_profiler is not None else nullcontext()
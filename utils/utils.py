@@ -1,9 +1,16 @@
 from sys import exit
-from os.path import isfile
-from typing import List
+from mmap import mmap, ACCESS_READ
+from os.path import isfile, getsize
+from typing import Iterator, List, Union
+
+# first bytes of every binary mission file. see `internal.parser.binary_format`.
+BINARY_MISSION_MAGIC = b"MRVB"
+
+def format_error_message(error_message: str) -> str:
+    return f"error occured: {error_message}"
 
 def exit_program(error_message: str):
-    exit(f"error occured: {error_message}")
+    exit(format_error_message(error_message))
 
 def get_input_from_args(file_path: str, plateau_arg: str, rovers_arg: List[str]) -> List[str]:
     if file_path and isfile(file_path):
@@ -14,3 +21,23 @@ def get_input_from_args(file_path: str, plateau_arg: str, rovers_arg: List[str])
         data = [plateau_arg, *rovers_arg]
     
     return data
+
+def iter_input_from_args(file_path: str, plateau_arg: str, rovers_arg: List[str]) -> Iterator[str]:
+    if file_path and isfile(file_path):
+        with open(file_path, "r") as file:
+            # filter off empty lines while reading file one line at a time
+            yield from (line for line in file if line.strip() != '')
+    else:
+        yield from [plateau_arg, *rovers_arg]
+
+def map_input_file(file_path: str) -> Union[mmap, bytes]:
+    # empty files cannot be memory-mapped, and have no inputs to read anyway
+    if getsize(file_path) == 0:
+        return b""
+
+    with open(file_path, "rb") as file:
+        return mmap(file.fileno(), 0, access=ACCESS_READ)
+
+def is_binary_mission(file_path: str) -> bool:
+    with open(file_path, "rb") as file:
+        return file.read(len(BINARY_MISSION_MAGIC)) == BINARY_MISSION_MAGIC